@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Benchmark of the SQLite keyword catalog.
+
+Indexes a synthetic page-object corpus (3k keywords by default), re-indexes
+it after touching a single file, and times name lookups and full-text
+searches against the populated catalog. Parsing and call-graph construction
+happen up front and are not part of the reported index times.
+
+    python benchmarks/bench_keyword_catalog.py --keywords 3000
+"""
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic_corpus import generate_keywords, write_corpus
+from rf_auto_generator.keyword_catalog import KeywordCatalog
+from rf_auto_generator.rf_native_parser import RFNativeParser
+
+
+def timed_ms(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--keywords", type=int, default=3000)
+    arg_parser.add_argument("--queries", type=int, default=200)
+    arg_parser.add_argument("--json", help="Write results to this JSON file")
+    args = arg_parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(tmp) / "page-objects"
+        files = write_corpus(corpus, args.keywords)
+        parser = RFNativeParser(tmp, use_cache=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            parsed_files = parser.parse_directory(corpus)
+            parser.analyze_keyword_dependencies(parsed_files)
+
+        with KeywordCatalog(Path(tmp) / "catalog.db") as catalog:
+            full_ms, _ = timed_ms(catalog.update, parsed_files, parser.call_graph)
+
+            with open(files[0], "a") as f:
+                f.write("\nTouched Keyword\n    No Operation\n")
+            with contextlib.redirect_stdout(io.StringIO()):
+                parsed_files[0] = parser.parse_robot_file(files[0])
+                parser.analyze_keyword_dependencies(parsed_files)
+            incremental_ms, result = timed_ms(catalog.update, parsed_files, parser.call_graph)
+
+            names = [spec.name for spec in generate_keywords(args.keywords)][:args.queries]
+            lookup_ms = [timed_ms(catalog.lookup, name)[0] for name in names]
+            search_ms = [timed_ms(catalog.search, f"{name.split()[0]} {i}")[0]
+                         for i, name in enumerate(names)]
+            stats = catalog.stats()
+
+    results = {
+        "keywords": stats["keywords"],
+        "files": stats["files"],
+        "full_index_ms": round(full_ms, 1),
+        "incremental_update_ms": round(incremental_ms, 1),
+        "incremental_files_updated": result["updated"],
+        "lookup_median_ms": round(statistics.median(lookup_ms), 3),
+        "lookup_max_ms": round(max(lookup_ms), 3),
+        "search_median_ms": round(statistics.median(search_ms), 3),
+        "search_max_ms": round(max(search_ms), 3),
+    }
+
+    print(f"Keyword catalog ({results['keywords']} keywords in {results['files']} files)")
+    print(f"   full index          {results['full_index_ms']:10.1f} ms")
+    print(f"   incremental update  {results['incremental_update_ms']:10.1f} ms "
+          f"({results['incremental_files_updated']} file rewritten)")
+    print(f"   name lookup         {results['lookup_median_ms']:10.3f} ms median, "
+          f"{results['lookup_max_ms']:.3f} ms max")
+    print(f"   full-text search    {results['search_median_ms']:10.3f} ms median, "
+          f"{results['search_max_ms']:.3f} ms max")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+"""
+Benchmark of dispatching keywords by RF name through the generated registry.
+
+Generates wrapper modules and keyword_registry.py for a synthetic
+page-object corpus (3k keywords by default) and runs random keywords by
+their RF names, written with random case and spacing the way data-driven
+suites name steps. The registry is one dict lookup per name; the baselines scan the
+keyword classes linearly: `getattr` of the sanitized method name on every
+class, and matching RF-normalized method names against dir() of every
+class. Keyword bodies are no-ops on a fake bridge; generation is not timed.
+
+    python benchmarks/bench_keyword_dispatch.py --keywords 3000 --calls 20000
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from robot.utils import normalize
+
+from benchmarks.synthetic_corpus import write_corpus
+from rf_auto_generator.rf_native_parser import RFNativeParser
+from rf_auto_generator.smart_code_generator import REGISTRY_MODULE, SmartCodeGenerator
+
+PACKAGE = "dispatch_generated"
+
+
+class FakeBridge:
+    """Bridge whose methods (and retry counts) accept anything and do nothing."""
+
+    def __getattr__(self, name):
+        return _noop
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+def generate_package(root: Path, keywords: int, embedded_ratio: float):
+    """Write the corpus and root/PACKAGE; returns the parsed resources."""
+    corpus = root / "page-objects"
+    write_corpus(corpus, keywords, embedded_ratio=embedded_ratio)
+    parser = RFNativeParser(root, use_cache=False, quiet=True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        parsed_files = parser.parse_directory(corpus)
+        generator = SmartCodeGenerator(root / PACKAGE, quiet=True)
+        generator.generate_all(parsed_files)
+        generator.generate_package_init(pf.filename for pf in parsed_files)
+        generator.generate_keyword_registry({pf.filename: [kw.name for kw in pf.keywords]
+                                             for pf in parsed_files})
+    return generator, parsed_files
+
+
+def spellings(keywords, count: int, seed: int = 0):
+    """
+    count (RF name, keyword name, arguments) calls of random keywords, the RF
+    names written with random case, spaces and underscores.
+    """
+    rng = random.Random(seed)
+    calls = []
+    for _ in range(count):
+        kw = rng.choice(keywords)
+        words = [word.upper() if rng.random() < 0.3 else word.lower() for word in kw.name.split()]
+        calls.append((rng.choice([" ", "  ", "_"]).join(words), kw.name, ("value",) * len(kw.args)))
+    return calls
+
+
+def scan_getattr(instances, generator):
+    """
+    Dispatch by getattr of the sanitized method name on each class in turn.
+    Only finds names spelled like the keyword, so it is timed with those.
+    """
+    def lookup(name):
+        method = generator.sanitize_name(name)
+        for instance in instances:
+            found = getattr(instance, method, None)
+            if found is not None:
+                return found
+        raise KeyError(name)
+    return lookup
+
+
+def scan_normalized(instances):
+    """Dispatch by comparing RF-normalized method names from dir() of each class."""
+    def lookup(name):
+        target = normalize(name, ignore='_')
+        for instance in instances:
+            for attribute in dir(instance):
+                if not attribute.startswith('_') and normalize(attribute, ignore='_') == target:
+                    return getattr(instance, attribute)
+        raise KeyError(name)
+    return lookup
+
+
+def time_dispatch(lookup, calls):
+    """Seconds to look up and run every call."""
+    start = time.perf_counter()
+    for name, arguments in calls:
+        lookup(name)(*arguments)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--keywords", type=int, default=3000)
+    arg_parser.add_argument("--calls", type=int, default=20000)
+    arg_parser.add_argument("--embedded-ratio", type=float, default=0.0,
+                            help="Share of embedded-argument names; only affects the untimed setup")
+    arg_parser.add_argument("--json", help="Write results to this JSON file")
+    args = arg_parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        generator, parsed_files = generate_package(root, args.keywords, args.embedded_ratio)
+        sys.path.insert(0, tmp)
+        try:
+            registry_module = importlib.import_module(f"{PACKAGE}.{REGISTRY_MODULE}")
+            package = importlib.import_module(PACKAGE)
+            bridge = FakeBridge()
+            instances = [getattr(package, name)(bridge) for name in package.__all__]
+            spelled = spellings([kw for pf in parsed_files for kw in pf.keywords], args.calls)
+            calls = [(name, arguments) for name, _, arguments in spelled]
+            exact_calls = [(name, arguments) for _, name, arguments in spelled]
+
+            registry = registry_module.KeywordRegistry(bridge)
+            cold = time_dispatch(registry.get_keyword, calls)
+            warm = time_dispatch(registry.get_keyword, calls)
+            getattr_scan = time_dispatch(scan_getattr(instances, generator), exact_calls)
+            normalized_calls = calls[:max(1, args.calls // 20)]
+            normalized_scan = time_dispatch(scan_normalized(instances), normalized_calls)
+        finally:
+            sys.path.remove(tmp)
+
+    per_call = {
+        "registry_cold": cold / len(calls),
+        "registry_warm": warm / len(calls),
+        "getattr_scan": getattr_scan / len(calls),
+        "normalized_scan": normalized_scan / len(normalized_calls),
+    }
+    results = {"keywords": args.keywords, "classes": len(instances), "calls": len(calls),
+               "microseconds_per_call": {key: round(value * 1e6, 3) for key, value in per_call.items()}}
+
+    print(f"Keyword dispatch by RF name: {args.keywords} keywords in {len(instances)} classes, "
+          f"{len(calls)} calls")
+    for key, value in per_call.items():
+        print(f"   {key:16} {value * 1e6:10.2f} µs/call  ({per_call['getattr_scan'] / value:8.2f}x vs getattr scan)")
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
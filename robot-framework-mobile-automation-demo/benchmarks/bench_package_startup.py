@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+Benchmark of test-collection startup with the lazily loading package __init__.
+
+Generates wrapper modules for a synthetic page-object corpus (3k keywords
+by default) twice: once with the generated __init__ (keyword classes are
+loaded on first access) and once with an eager __init__ that imports every
+module up front. Test modules shaped like pytest_tests/test_login.py import
+three keyword classes from the package; `pytest --collect-only` on them is
+run in fresh processes, timing pytest's collection phase (with a small
+plugin) and the whole process, along with the bare import and the number
+of generated modules each variant loads. Corpus setup is not timed.
+
+    python benchmarks/bench_package_startup.py --keywords 3000 --repeat 5
+"""
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic_corpus import write_corpus
+from rf_auto_generator.rf_native_parser import RFNativeParser
+from rf_auto_generator.smart_code_generator import SmartCodeGenerator
+
+TEST_MODULE = '''from {package} import {imports}
+
+
+def test_{index}_classes_load():
+    assert {first}.__name__ == {first_name!r}
+'''
+
+IMPORT_PROBE = '''import sys, time
+start = time.perf_counter()
+from {package} import {imports}
+elapsed = time.perf_counter() - start
+loaded = sum(1 for name in sys.modules if name.startswith("{package}."))
+print(elapsed, loaded)
+'''
+
+# pytest plugin appending the duration of the collection phase to collect_times.txt
+COLLECT_TIMER = '''import time
+
+
+def pytest_collection(session):
+    session.config.collect_start = time.perf_counter()
+
+
+def pytest_collection_finish(session):
+    with open("collect_times.txt", "a") as f:
+        f.write(f"{time.perf_counter() - session.config.collect_start}\\n")
+'''
+
+
+def generate_package(root: Path, keywords: int, embedded_ratio: float) -> SmartCodeGenerator:
+    """Write the corpus and the generated (lazy) package root/lazy_generated."""
+    corpus = root / "page-objects"
+    write_corpus(corpus, keywords, embedded_ratio=embedded_ratio)
+    parser = RFNativeParser(root, use_cache=False, quiet=True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        parsed_files = parser.parse_directory(corpus)
+        parser.analyze_keyword_dependencies(parsed_files)
+        generator = SmartCodeGenerator(root / "lazy_generated", quiet=True)
+        generator.enable_compiler(parser.call_graph, parsed_files)
+        generator.generate_all(parsed_files)
+        generator.generate_package_init(pf.filename for pf in parsed_files)
+    return generator
+
+
+def write_eager_copy(lazy: Path, eager: Path):
+    """Copy of the package whose __init__ imports every keyword class at import time."""
+    shutil.copytree(lazy, eager)
+    namespace = {}
+    exec(compile((lazy / "__init__.py").read_text(), "__init__", "exec"), namespace)
+    (eager / "__init__.py").write_text("".join(
+        f"from .{module} import {name}\n" for name, module in sorted(namespace["_CLASSES"].items())))
+    return namespace["_CLASSES"]
+
+
+def write_tests(directory: Path, package: str, classes, test_files: int):
+    """Test modules importing three keyword classes each, like pytest_tests/test_login.py."""
+    directory.mkdir()
+    names = sorted(classes)
+    for index in range(test_files):
+        imports = [names[(index * 3 + offset) % len(names)] for offset in range(3)]
+        (directory / f"test_flow_{index}.py").write_text(TEST_MODULE.format(
+            package=package, imports=", ".join(imports), index=index, first=imports[0], first_name=imports[0]))
+
+
+def time_collection(tests: Path, cwd: Path, repeat: int):
+    """(median collection seconds, median process seconds) of `pytest --collect-only` on tests."""
+    timings = cwd / "collect_times.txt"
+    timings.unlink(missing_ok=True)
+    process = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider",
+                        "-p", "collect_timer", "--rootdir", str(cwd), str(tests)],
+                       cwd=cwd, check=True, capture_output=True)
+        process.append(time.perf_counter() - start)
+    collection = [float(line) for line in timings.read_text().split()]
+    return statistics.median(collection), statistics.median(process)
+
+
+def probe_import(package: str, classes, cwd: Path, repeat: int):
+    """(median seconds, generated modules loaded) for importing three classes in a fresh process."""
+    imports = ", ".join(sorted(classes)[:3])
+    code = IMPORT_PROBE.format(package=package, imports=imports)
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], cwd=cwd, check=True,
+                                capture_output=True, text=True).stdout.split()
+        samples.append((float(output[0]), int(output[1])))
+    return statistics.median(s for s, _ in samples), samples[0][1]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--keywords", type=int, default=3000)
+    arg_parser.add_argument("--test-files", type=int, default=2,
+                            help="Test modules to collect (pytest_tests has 2)")
+    arg_parser.add_argument("--embedded-ratio", type=float, default=0.0,
+                            help="Share of embedded-argument names; only affects the untimed setup")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--json", help="Write results to this JSON file")
+    args = arg_parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        generator = generate_package(root, args.keywords, args.embedded_ratio)
+        classes = write_eager_copy(generator.output_dir, root / "eager_generated")
+        (root / "collect_timer.py").write_text(COLLECT_TIMER)
+
+        results = {"keywords": args.keywords, "modules": len(classes), "test_files": args.test_files}
+        for variant in ("eager", "lazy"):
+            package = f"{variant}_generated"
+            write_tests(root / f"tests_{variant}", package, classes, args.test_files)
+            import_seconds, loaded = probe_import(package, classes, root, args.repeat)
+            collect_seconds, process_seconds = time_collection(root / f"tests_{variant}", root, args.repeat)
+            results[variant] = {"import_seconds": round(import_seconds, 4), "modules_loaded": loaded,
+                                "collect_seconds": round(collect_seconds, 4),
+                                "process_seconds": round(process_seconds, 4)}
+
+    eager, lazy = results["eager"], results["lazy"]
+    print(f"Package startup: {results['modules']} generated modules, {args.keywords} keywords")
+    print(f"   {'':6} {'import (ms)':>12} {'modules loaded':>15} {'collect (ms)':>13} {'process (ms)':>13}")
+    for variant in ("eager", "lazy"):
+        r = results[variant]
+        print(f"   {variant:6} {r['import_seconds'] * 1000:>12.1f} {r['modules_loaded']:>15} "
+              f"{r['collect_seconds'] * 1000:>13.1f} {r['process_seconds'] * 1000:>13.1f}")
+    print(f"   collection saved {(eager['collect_seconds'] - lazy['collect_seconds']) * 1000:.1f} ms "
+          f"({eager['collect_seconds'] / lazy['collect_seconds']:.2f}x)")
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
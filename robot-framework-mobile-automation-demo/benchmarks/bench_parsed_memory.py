@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+Memory benchmark for the parsed keyword representation.
+
+Builds a synthetic corpus of parsed keywords (50k by default) the way
+RFNativeParser produces them - every token value is a fresh string - once
+with the compact slotted/interned ParsedKeyword/ParsedStep classes and once
+with the previous dict-backed, list-based layout, each in its own process,
+and reports the RSS growth of holding the corpus in memory.
+
+    python benchmarks/bench_parsed_memory.py --keywords 50000
+"""
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic_corpus import generate_keywords
+
+
+@dataclass
+class LegacyParsedStep:
+    """Pre-compaction layout: per-instance __dict__, lists, no interning."""
+    kind: str
+    name: str = ""
+    args: List[str] = field(default_factory=list)
+    assign: List[str] = field(default_factory=list)
+    body: List['LegacyParsedStep'] = field(default_factory=list)
+    orelse: Optional['LegacyParsedStep'] = None
+
+
+@dataclass
+class LegacyParsedKeyword:
+    """Pre-compaction layout: per-instance __dict__, lists, no interning."""
+    name: str
+    args: List[str] = field(default_factory=list)
+    doc: str = ""
+    body: List[str] = field(default_factory=list)
+    return_value: bool = False
+    tags: List[str] = field(default_factory=list)
+    source_file: str = ""
+    rf_name: str = ""
+    steps: List[LegacyParsedStep] = field(default_factory=list)
+
+
+def fresh(value: str) -> str:
+    """A new string object with the same value, like a freshly lexed token."""
+    return value.encode().decode()
+
+
+def rss_bytes() -> int:
+    """Current resident set size (falls back to peak RSS off Linux)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def build_corpus(variant: str, keyword_count: int, keywords_per_file: int):
+    """Build the parsed corpus in the requested representation."""
+    if variant == 'compact':
+        from rf_auto_generator.rf_native_parser import ParsedKeyword as Keyword, ParsedStep as Step
+    else:
+        Keyword, Step = LegacyParsedKeyword, LegacyParsedStep
+
+    keywords = []
+    for i, spec in enumerate(generate_keywords(keyword_count)):
+        source_file = f"object-repository/page-objects/Synthetic{i // keywords_per_file:05d}Po.robot"
+        steps = [Step(kind=fresh('KEYWORD'), name=fresh(name),
+                      args=[fresh(a) for a in args], assign=[fresh(a) for a in assign])
+                 for name, args, assign in spec.calls]
+        keywords.append(Keyword(
+            name=fresh(spec.name),
+            args=[fresh(a.strip('${}')) for a in spec.args],
+            doc=fresh(spec.doc),
+            body=[fresh(name) for name, _, _ in spec.calls],
+            source_file=fresh(source_file),
+            rf_name=fresh(spec.rf_name),
+            steps=steps,
+        ))
+    return keywords
+
+
+def measure(variant: str, keyword_count: int, keywords_per_file: int) -> Dict:
+    """Measure RSS growth of one representation (run in a fresh process)."""
+    # Import everything up front so only the corpus itself is measured
+    import rf_auto_generator.rf_native_parser  # noqa: F401
+    generate_keywords(8)
+    gc.collect()
+    before = rss_bytes()
+
+    corpus = build_corpus(variant, keyword_count, keywords_per_file)
+    gc.collect()
+    after = rss_bytes()
+
+    return {
+        "variant": variant,
+        "keywords": len(corpus),
+        "rss_growth_bytes": after - before,
+        "bytes_per_keyword": (after - before) / max(len(corpus), 1),
+    }
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--keywords", type=int, default=50000)
+    arg_parser.add_argument("--keywords-per-file", type=int, default=25)
+    arg_parser.add_argument("--json", help="Write results to this JSON file")
+    arg_parser.add_argument("--variant", choices=["compact", "legacy"], help=argparse.SUPPRESS)
+    args = arg_parser.parse_args(argv)
+
+    if args.variant:
+        print(json.dumps(measure(args.variant, args.keywords, args.keywords_per_file)))
+        return
+
+    results = {}
+    for variant in ("legacy", "compact"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--variant", variant,
+             "--keywords", str(args.keywords), "--keywords-per-file", str(args.keywords_per_file)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results[variant] = json.loads(output.strip().splitlines()[-1])
+
+    legacy = results["legacy"]["rss_growth_bytes"]
+    compact = results["compact"]["rss_growth_bytes"]
+    results["reduction_percent"] = round(100.0 * (legacy - compact) / legacy, 1) if legacy else 0.0
+
+    print(f"Parsed keyword memory ({args.keywords} synthetic keywords)")
+    for variant in ("legacy", "compact"):
+        r = results[variant]
+        print(f"   {variant:<8} {r['rss_growth_bytes'] / 2**20:8.1f} MiB   "
+              f"{r['bytes_per_keyword']:8.0f} B/keyword")
+    print(f"   reduction {results['reduction_percent']}%")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
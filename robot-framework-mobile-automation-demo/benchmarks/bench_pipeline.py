@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+"""
+Benchmark of the parse -> analyze -> generate pipeline on synthetic corpora.
+
+For every corpus size (1k, 10k and 100k keywords by default) a corpus of
+page-object resources shaped like CommonPo.robot / LoginScreenPo.robot is
+written to a temporary directory and, in a fresh process, timed through
+RFNativeParser.parse_directory, analyze_keyword_dependencies and
+SmartCodeGenerator.generate_all. Peak RSS is recorded after each phase.
+Results are written as JSON so runs on different commits can be compared.
+
+    python benchmarks/bench_pipeline.py --sizes 1000 10000 --json results/bench-pipeline.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic_corpus import write_corpus
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process."""
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def timed_phase(func, *args, **kwargs):
+    """Run one phase; returns (result, {seconds, cpu_seconds, peak_rss_bytes})."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = func(*args, **kwargs)
+    return result, {
+        "seconds": round(time.perf_counter() - wall, 3),
+        "cpu_seconds": round(time.process_time() - cpu, 3),
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def run_pipeline(corpus_dir: str, jobs: int) -> dict:
+    """Time the three pipeline phases on an existing corpus (run in a fresh process)."""
+    from rf_auto_generator.rf_native_parser import RFNativeParser
+    from rf_auto_generator.smart_code_generator import SmartCodeGenerator
+
+    phases = {"startup": {"peak_rss_bytes": peak_rss_bytes()}}
+    with tempfile.TemporaryDirectory() as output_dir, \
+            open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        parser = RFNativeParser(corpus_dir, use_cache=False)
+        parsed, phases["parse"] = timed_phase(parser.parse_directory, corpus_dir, jobs=jobs)
+        _, phases["analyze"] = timed_phase(parser.analyze_keyword_dependencies, parsed)
+        generator = SmartCodeGenerator(output_dir)
+        generated, phases["generate"] = timed_phase(generator.generate_all, parsed, jobs=jobs)
+
+    return {
+        "files": len(parsed),
+        "keywords": sum(len(pf.keywords) for pf in parsed),
+        "modules": len(generated),
+        "phases": phases,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_size(args, size: int) -> dict:
+    """Write a corpus of size keywords and benchmark it in a child process."""
+    config = {"keywords_requested": size, "keywords_per_file": args.keywords_per_file,
+              "fan_in": args.fan_in, "embedded_ratio": args.embedded_ratio, "jobs": args.jobs}
+    with tempfile.TemporaryDirectory() as tmp:
+        write_corpus(tmp, size, args.keywords_per_file, args.embedded_ratio, args.seed, args.fan_in)
+        try:
+            output = subprocess.run(
+                [sys.executable, __file__, "--run-corpus", tmp, "--jobs", str(args.jobs)],
+                check=True, capture_output=True, text=True, timeout=args.timeout,
+            ).stdout
+        except subprocess.TimeoutExpired:
+            return {**config, "error": f"timed out after {args.timeout} s"}
+        except subprocess.CalledProcessError as error:
+            return {**config, "error": error.stderr.strip().splitlines()[-1] if error.stderr else str(error)}
+    return {**config, **json.loads(output.strip().splitlines()[-1])}
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                            help="Corpus sizes in keywords")
+    arg_parser.add_argument("--keywords-per-file", type=int, default=25)
+    arg_parser.add_argument("--fan-in", type=int, default=2,
+                            help="Each resource is imported by up to this many others")
+    arg_parser.add_argument("--embedded-ratio", type=float, default=0.8,
+                            help="Share of keywords with embedded-argument names")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("-j", "--jobs", type=int, default=1,
+                            help="Worker processes for parsing and for emitting modules")
+    arg_parser.add_argument("--timeout", type=float, help="Give up on a corpus size after this many seconds")
+    arg_parser.add_argument("--json", help="Write results to this JSON file")
+    arg_parser.add_argument("--run-corpus", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args(argv)
+
+    if args.run_corpus:
+        print(json.dumps(run_pipeline(args.run_corpus, args.jobs)))
+        return
+
+    import robot
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "robot_framework": robot.__version__,
+        "results": [],
+    }
+
+    print("Pipeline benchmark (seconds; peak RSS in MiB)")
+    print(f"   {'keywords':>9} {'parse':>9} {'analyze':>9} {'generate':>9} {'peak RSS':>9}")
+    for size in args.sizes:
+        result = run_size(args, size)
+        report["results"].append(result)
+        if "error" in result:
+            print(f"   {size:>9} {result['error']}")
+            continue
+        phases = result["phases"]
+        peak = max(phase["peak_rss_bytes"] for phase in phases.values())
+        print(f"   {result['keywords']:>9} {phases['parse']['seconds']:>9.2f} "
+              f"{phases['analyze']['seconds']:>9.2f} {phases['generate']['seconds']:>9.2f} "
+              f"{peak / 2**20:>9.1f}")
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Benchmark of the token-level variables fast path.
+
+Writes thousands of synthetic locator files and parses them with the
+parse cache disabled, once through the full model (parse_robot_file) and
+once through the tokenizer (parse_variables_file), checks both produce the
+same variables and reports the time of each.
+
+    python benchmarks/bench_variables_fast_path.py --files 5000
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic_corpus import write_locator_files
+from rf_auto_generator.rf_native_parser import RFNativeParser
+
+
+def time_parse(parse, files):
+    """Parse every file; returns (seconds, results)."""
+    start = time.perf_counter()
+    results = [parse(path) for path in files]
+    return time.perf_counter() - start, results
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--files", type=int, default=5000)
+    arg_parser.add_argument("--locators-per-file", type=int, default=10)
+    arg_parser.add_argument("--json", help="Write results to this JSON file")
+    args = arg_parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = write_locator_files(tmp, args.files, args.locators_per_file)
+        parser = RFNativeParser(tmp, use_cache=False)
+
+        model_time, model_results = time_parse(parser.parse_robot_file, files)
+        token_time, token_results = time_parse(parser.parse_variables_file, files)
+
+    mismatches = sum(1 for a, b in zip(model_results, token_results)
+                     if (a.variables, a.imports, a.library_imports) != (b.variables, b.imports, b.library_imports))
+    results = {
+        "files": args.files,
+        "locators_per_file": args.locators_per_file,
+        "model_seconds": round(model_time, 3),
+        "tokens_seconds": round(token_time, 3),
+        "speedup": round(model_time / token_time, 2) if token_time else 0.0,
+        "mismatches": mismatches,
+    }
+
+    print(f"Variables parsing ({args.files} locator files, cache disabled)")
+    print(f"   model    {model_time:8.2f} s")
+    print(f"   tokens   {token_time:8.2f} s")
+    print(f"   speedup  {results['speedup']}x, {mismatches} mismatching files")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2) + "\n")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
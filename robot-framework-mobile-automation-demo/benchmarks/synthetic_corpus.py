@@ -0,0 +1,142 @@
+"""
+Synthetic RF keyword corpora shaped like the page objects in this repo.
+
+Keywords mimic CommonPo.robot / LoginScreenPo.robot: embedded
+"[Arguments] ${...}" names, Wait Until Keyword Succeeds wrappers around
+AppiumLibrary calls, Run Keyword If platform switches and composite flows
+that call other page-object keywords.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Sequence, Tuple
+import random
+
+# (keyword, args, assign)
+Call = Tuple[str, Tuple[str, ...], Tuple[str, ...]]
+
+
+@dataclass
+class KeywordSpec:
+    """One synthetic keyword."""
+    name: str
+    args: Tuple[str, ...]
+    embedded: bool
+    doc: str
+    calls: List[Call] = field(default_factory=list)
+
+    @property
+    def rf_name(self) -> str:
+        """Name as written in the resource file."""
+        if self.embedded and self.args:
+            return f"{self.name} [Arguments] {' '.join(self.args)}"
+        return self.name
+
+    def call_from(self, *values: str) -> Call:
+        """A call site invoking this keyword with the given argument values."""
+        if self.embedded and self.args:
+            return (f"{self.name} [Arguments] {' '.join(values)}", (), ())
+        return (self.name, tuple(values), ())
+
+
+def _wrapped(library_keyword: str, *args: str) -> Call:
+    return ('Wait Until Keyword Succeeds', ('${retryScale}', '${RETRY_DELAY}', library_keyword) + args, ())
+
+
+def generate_keywords(count: int, embedded_ratio: float = 0.8, seed: int = 0) -> List[KeywordSpec]:
+    """Build count keyword specs; embedded_ratio of them use embedded-argument names."""
+    rng = random.Random(seed)
+    specs: List[KeywordSpec] = []
+
+    for i in range(count):
+        embedded = rng.random() < embedded_ratio
+        shape = i % 4
+
+        if shape == 0:
+            spec = KeywordSpec(f"Click Element {i}", ('${locator}', '${retryScale}'), embedded,
+                               "Click on a given button",
+                               [_wrapped('Wait Until Element Is Visible', '${locator}'),
+                                _wrapped('Click Element', '${locator}')])
+        elif shape == 1:
+            spec = KeywordSpec(f"Input Text {i}", ('${textBoxLocator}', '${text}', '${retryScale}'), embedded,
+                               "Input text into a text box",
+                               [_wrapped('Wait Until Element Is Visible', '${textBoxLocator}'),
+                                _wrapped('Input Text', '${textBoxLocator}', '${text}')])
+        elif shape == 2:
+            spec = KeywordSpec(f"Alert Title Should Be {i}", ('${alertTitle}',), embedded,
+                               "Validate the text of the alert title",
+                               [('Set Variable', ('id=android:id/alertTitle',), ('${alertLocator}',)),
+                                ('Run Keyword If', ("'${PLATFORM_NAME}' == '${ANDROID_PLATFORM_NAME}'",
+                                                    'Element Text Should Be', '${alertLocator}', '${alertTitle}'), ())])
+        else:
+            # Composite flow calling the three keywords defined just before it
+            calls = [callee.call_from(*(['${SMALL_RETRY_COUNT}'] * len(callee.args)))
+                     for callee in specs[-3:]]
+            spec = KeywordSpec(f"Complete Flow {i}", ('${emailAddress}', '${password}'), embedded,
+                               "Complete a multi step flow", calls)
+        specs.append(spec)
+
+    return specs
+
+
+def render_resource(specs: Sequence[KeywordSpec], resource_imports: Sequence[str] = (),
+                    libraries: Sequence[str] = ('AppiumLibrary',)) -> str:
+    """Render keyword specs as the text of a .robot resource file."""
+    lines = ["*** Settings ***"]
+    lines += [f"Resource    {imp}" for imp in resource_imports]
+    lines += [f"Library    {lib}" for lib in libraries]
+    lines += ["", "", "*** Keywords ***"]
+
+    for spec in specs:
+        lines.append(spec.rf_name)
+        lines.append(f"    [Documentation]    {spec.doc}")
+        if spec.args and not spec.embedded:
+            lines.append("    [Arguments]    " + "    ".join(spec.args))
+        for keyword, args, assign in spec.calls:
+            lines.append("    " + "    ".join(list(assign) + [keyword] + list(args)))
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_corpus(directory: str, keyword_count: int, keywords_per_file: int = 25,
+                 embedded_ratio: float = 0.8, seed: int = 0, fan_in: int = 0) -> List[Path]:
+    """
+    Write a corpus of page-object resources; returns the written files.
+
+    With fan_in, file i imports the fan_in files written before it, so every
+    resource is imported by up to fan_in others (like CommonPo.robot being
+    shared by LoginScreenPo.robot and NavigationBarPo.robot).
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    specs = generate_keywords(keyword_count, embedded_ratio, seed)
+
+    written = []
+    for index, start in enumerate(range(0, keyword_count, keywords_per_file)):
+        path = directory / f"Synthetic{index:05d}Po.robot"
+        imports = [p.name for p in written[max(0, index - fan_in):]] if fan_in else []
+        path.write_text(render_resource(specs[start:start + keywords_per_file], imports))
+        written.append(path)
+    return written
+
+
+def render_locators(index: int, count: int) -> str:
+    """Render a locator file like object-repository/locators/*.robot."""
+    lines = ["*** Variables ***"]
+    for i in range(count):
+        name = "${screen%dElement%dButton}" % (index, i)
+        lines.append(f"{name:<40}accessibility_id=button-{index}-{i}")
+    return "\n".join(lines) + "\n"
+
+
+def write_locator_files(directory: str, file_count: int, locators_per_file: int = 10) -> List[Path]:
+    """Write file_count locator files; returns the written files."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    for index in range(file_count):
+        path = directory / f"Synthetic{index:05d}Locators.robot"
+        path.write_text(render_locators(index, locators_per_file))
+        written.append(path)
+    return written
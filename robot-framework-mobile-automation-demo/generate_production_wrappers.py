@@ -3,16 +3,301 @@
 Production-ready wrapper generator using RF's native parser.
 Handles ALL RF syntax correctly - ready for 3000+ keywords.
 """
+import argparse
+import hashlib
+import json
+import os
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+if {"-q", "--quiet"} & set(sys.argv[1:]):
+    # Before the imports below: rf_native_parser prints on import
+    os.environ["RF_GENERATOR_QUIET"] = "1"
+
+from rf_auto_generator.incremental import GenerationManifest, MANIFEST_NAME
+from rf_auto_generator.keyword_catalog import CATALOG_NAME, KeywordCatalog
+from rf_auto_generator.library_specs import DEFAULT_CACHE_DIR as LIBDOC_CACHE_DIR, LibrarySpecs
+from rf_auto_generator.metrics import RunMetrics, quiet_requested
+from rf_auto_generator.reachability import prune_unreachable, select_tests
+from rf_auto_generator.resource_resolver import ResourceResolver
 from rf_auto_generator.rf_native_parser import RFNativeParser
-from rf_auto_generator.smart_code_generator import SmartCodeGenerator
+from rf_auto_generator.smart_code_generator import SHARD_SIZE, SmartCodeGenerator
+from rf_auto_generator.variable_resolver import VARIABLE_DIRS, VariableResolver
+from rf_auto_generator.watcher import PollingWatcher
+
+PAGE_OBJECTS_DIR = Path("object-repository/page-objects")
+LOCATORS_DIR = Path("object-repository/locators")
+WATCHED_DIRS = ["object-repository", "configs", "constants"]
+OUTPUT_DIR = "pytest_rf_bridge/production_generated"
+
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    arg_parser = argparse.ArgumentParser(description="Generate Python wrappers from RF resource files.")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=1,
+                            help="Parse resource files and write modules in N worker processes (0 = one per CPU)")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help="Ignore the .rf_parse_cache and .rf_libdoc_cache directories: reparse every "
+                                 "file and rebuild library keyword specs")
+    arg_parser.add_argument("--incremental", action="store_true",
+                            help="Only regenerate modules whose source or imported resources changed")
+    arg_parser.add_argument("--stream", action="store_true",
+                            help="Write each module as soon as its resource is parsed (flat memory, "
+                                 "skips whole-corpus dependency analysis)")
+    arg_parser.add_argument("--catalog", nargs="?", const=CATALOG_NAME, metavar="PATH",
+                            help=f"Update the SQLite keyword catalog (default: {CATALOG_NAME}); "
+                                 "query it with rf_catalog.py")
+    arg_parser.add_argument("--tests", nargs="+", metavar="PATH",
+                            help="Only generate keywords reachable from these test-case files/directories")
+    arg_parser.add_argument("--include-tag", action="append", default=[], metavar="TAG",
+                            help="Only generate keywords reachable from tests matching this RF tag "
+                                 "pattern (repeatable; tests come from test-cases/ unless --tests is given)")
+    arg_parser.add_argument("--exclude-tag", action="append", default=[], metavar="TAG",
+                            help="Leave out tests matching this RF tag pattern when pruning (repeatable)")
+    arg_parser.add_argument("--prune-report", metavar="PATH",
+                            help="Write the kept/pruned keywords of a --tests/--include-tag run as JSON")
+    arg_parser.add_argument("--no-compile", action="store_true",
+                            help="Keep pattern-based method bodies instead of compiling keyword bodies "
+                                 "into Python calls (--stream never compiles)")
+    arg_parser.add_argument("--platforms", nargs="*", metavar="PLATFORM",
+                            help=f"Also write a package per platform ({OUTPUT_DIR}_<platform>; all "
+                                 "platforms of configs/ if none are named) with PLATFORM_NAME fixed and "
+                                 "platform conditions folded at generation time")
+    arg_parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, metavar="N",
+                            help="Split resources with more than N keywords into shard modules behind a "
+                                 f"facade class (default: {SHARD_SIZE}; 0 = never shard)")
+    arg_parser.add_argument("--no-stubs", action="store_true",
+                            help="Do not write .pyi type stubs next to the generated modules")
+    arg_parser.add_argument("--no-byte-compile", action="store_true",
+                            help="Do not byte-compile the generated modules after writing them")
+    arg_parser.add_argument("--watch", action="store_true",
+                            help="Keep running and regenerate affected modules whenever "
+                                 f"{', '.join(WATCHED_DIRS)} change")
+    arg_parser.add_argument("--debounce", type=float, default=1.0, metavar="SECONDS",
+                            help="Watch mode: wait until files have been quiet this long (default: 1.0)")
+    arg_parser.add_argument("--poll-interval", type=float, default=0.5, metavar="SECONDS",
+                            help="Watch mode: how often to check files for changes (default: 0.5)")
+    arg_parser.add_argument("-q", "--quiet", action="store_true",
+                            help="Only print step headers, warnings and the summary (no per-file output)")
+    arg_parser.add_argument("--metrics-json", metavar="PATH",
+                            help="Write wall time, CPU time and peak memory per phase and per file, "
+                                 "plus keyword/placeholder/cache counts, as JSON")
+    args = arg_parser.parse_args(argv)
+    args.quiet = args.quiet or quiet_requested()
+    args.prune = bool(args.tests or args.include_tag or args.exclude_tag)
+    if args.prune and (args.stream or args.watch):
+        arg_parser.error("--tests/--include-tag/--exclude-tag need the whole-corpus call graph; "
+                         "they cannot be combined with --stream or --watch")
+    if args.platforms is not None and (args.stream or args.watch or args.no_compile):
+        arg_parser.error("--platforms folds conditions in compiled keyword bodies; it cannot be combined "
+                         "with --stream, --watch or --no-compile")
+    if args.shard_size < 0:
+        arg_parser.error("--shard-size must be 0 or more")
+    if args.metrics_json and args.watch:
+        arg_parser.error("--metrics-json reports a single run; it cannot be combined with --watch")
+    return args
+
+
+def load_locators(parser):
+    """Parse locator files into {resolved file path: variables}."""
+    locators_map = {}
+    
+    if LOCATORS_DIR.exists():
+        for loc_file in sorted(LOCATORS_DIR.glob("*.robot")):
+            parsed_loc = parser.parse_variables_file(loc_file)
+            locators_map[str(loc_file.resolve())] = parsed_loc.variables
+            if not parser.quiet:
+                print(f"   📍 {loc_file.name}: {len(parsed_loc.variables)} locators")
+            
+    return locators_map
 
 
-def main():
+def generation_variant(args, compiled=True):
+    """Generation settings that change the output of unchanged sources (see GenerationManifest)."""
+    return " ".join(filter(None, ["compiled" if compiled and not args.no_compile else "",
+                                  f"shards:{args.shard_size}", "" if args.no_stubs else "stubs"]))
+    
+    
+def library_specs(args):
+    """Library keyword specs (compiler and fallback), cached in .rf_libdoc_cache unless --no-cache."""
+    return LibrarySpecs(None if args.no_cache else LIBDOC_CACHE_DIR)
+    
+    
+def keyword_names(page_objects):
+    """{resource file: keyword names} of the generated modules, for the keyword registry."""
+    return {pf.filename: [kw.name for kw in pf.keywords] for pf in page_objects}
+    
+    
+def find_test_files(paths):
+    """Test-case .robot files from a list of files and directories."""
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.rglob("*.robot")) if path.is_dir() else [path])
+    return files
+    
+    
+def write_variables(parser, generator):
+    """Resolve configs/ and constants/ and write the variables module; returns the resolver."""
+    print("\n🔣 Resolving config and constant variables...")
+    resolver = VariableResolver(parser, Path.cwd())
+    generator.generate_variables_module(resolver)
+    return resolver
+    
+    
+def run_streaming(args, parser, locators_map, metrics):
+    """Parse and emit one resource at a time; returns (modules written, keywords wrapped)."""
+    generator = SmartCodeGenerator(OUTPUT_DIR, quiet=args.quiet, shard_size=args.shard_size,
+                                   stubs=not args.no_stubs, specs=library_specs(args))
+    with metrics.phase("variables"):
+        variables = write_variables(parser, generator)
+    
+    print("\n🏗️  Step 2: Streaming parse → generate...")
+    manifest = GenerationManifest(generator.output_dir / MANIFEST_NAME, variables.files)
+    variant = generation_variant(args, compiled=False)
+    resolver = ResourceResolver(parser, keep_resources=False)
+    
+    sources = []
+    names = {}
+    stale = []
+    
+    def parsed_stream():
+        for pf in parser.iter_directory(PAGE_OBJECTS_DIR, jobs=args.jobs):
+            resolver.add(pf)
+            sources.append(pf.filepath)
+            names.update(keyword_names([pf]))
+            metrics.count("keywords", len(pf.keywords))
+            if args.incremental and not manifest.is_stale(pf, generator.output_file_for(pf), resolver, variant):
+                continue
+            stale.append(len(pf.keywords))
+            yield pf
+            
+    with metrics.phase("stream"):
+        for pf, output_file in generator.generate_stream(parsed_stream(), locators_map):
+            manifest.record(pf, output_file, resolver, variant, generator.uses_variables(output_file))
+            
+    manifest.save(sources)
+    generator.generate_package_init(sources)
+    generator.generate_keyword_registry(names)
+    finish_output(args, generator, metrics)
+    metrics.add_files("parse", parser.file_stats)
+    metrics.add_files("generate", generator.file_stats)
+    record_generated(metrics, generator)
+    if args.incremental:
+        print(f"   ♻️  {len(sources) - len(stale)} modules up to date, regenerating {len(stale)}")
+    return len(stale), sum(stale)
+
+
+def remove_generated(generator, manifest, parsed):
+    """Delete the module (shards, stubs and bytecode included) generated for a removed source."""
+    output_file = generator.output_file_for(parsed)
+    if manifest.owns(parsed, output_file):
+        for module_file in [output_file] + generator.shard_files_for(output_file):
+            generator.remove_module(module_file)
+        print(f"   🗑️  Removed {output_file.name} ({parsed.filename} was deleted)")
+    manifest.forget([parsed.filepath])
+    
+    
+def run_watch(args, parser, max_batches=None):
+    """
+    Regenerate modules whenever watched resource files change.
+    
+    Only file stats are polled; a debounced batch of changes invalidates
+    the changed files in the resolver, and only page objects that are
+    changed or (transitively) import a changed file are reparsed and
+    regenerated.
+    """
+    print("\n📁 Step 1: Parsing locator files...")
+    locators_map = load_locators(parser)
+    
+    specs = library_specs(args)
+    generator = SmartCodeGenerator(OUTPUT_DIR, quiet=args.quiet, shard_size=args.shard_size,
+                                   stubs=not args.no_stubs, specs=specs)
+    variables = write_variables(parser, generator)
+    manifest = GenerationManifest(generator.output_dir / MANIFEST_NAME, variables.files)
+    variant = generation_variant(args)
+    resolver = ResourceResolver(parser)
+    page_objects = {}
+    for pf in parser.iter_directory(PAGE_OBJECTS_DIR, jobs=args.jobs):
+        resolver.add(pf)
+        page_objects[resolver.key(pf.filepath)] = pf
+        
+    def regenerate(keys):
+        resolver.resolve(sorted(keys))
+        if not args.no_compile:
+            # Compiled bodies depend on the keywords of every page object
+            resolver.resolve(sorted(page_objects))
+            tables = {key: resolver.symbol_table(key) for key in page_objects}
+            parser.analyze_keyword_dependencies(list(page_objects.values()), tables)
+            generator.enable_compiler(parser.call_graph, page_objects.values())
+        stale = [page_objects[key] for key in sorted(keys)
+                 if manifest.is_stale(page_objects[key], generator.output_file_for(page_objects[key]), resolver,
+                                      variant)]
+        symbol_tables = {resolver.key(pf.filepath): resolver.symbol_table(pf.filepath) for pf in stale}
+        generator.generate_all(stale, locators_map, symbol_tables, jobs=args.jobs)
+        for pf in stale:
+            output_file = generator.output_file_for(pf)
+            manifest.record(pf, output_file, resolver, variant, generator.uses_variables(output_file))
+        manifest.save(list(page_objects))
+        generator.generate_package_init(page_objects)
+        generator.generate_keyword_registry(keyword_names(page_objects.values()))
+        finish_output(args, generator)
+        return stale
+        
+    def apply_changes(changed):
+        affected = resolver.affected_by(changed)
+        resolver.invalidate(changed)
+        manifest.forget(changed)
+        
+        for path in changed:
+            exists = Path(path).is_file()
+            if str(Path(path).parent) == locator_dir:
+                if exists:
+                    locators_map[path] = parser.parse_variables_file(path).variables
+                else:
+                    locators_map.pop(path, None)
+            if Path(page_dir) in Path(path).parents:
+                if exists:
+                    page_objects[path] = parser.parse_robot_file(path)
+                    resolver.add(page_objects[path])
+                elif path in page_objects:
+                    remove_generated(generator, manifest, page_objects.pop(path))
+                    
+        targets = [key for key in affected if key in page_objects]
+        if any(Path(d).resolve() in Path(path).parents for path in changed for d in VARIABLE_DIRS):
+            manifest.variable_files = write_variables(parser, generator).files
+            # Modules importing rf_variables are stale now (see GenerationManifest.is_stale)
+            targets = list(page_objects)
+        return regenerate(targets), targets
+        
+    page_dir = resolver.key(PAGE_OBJECTS_DIR)
+    locator_dir = resolver.key(LOCATORS_DIR)
+    
+    print("\n🏗️  Step 2: Generating stale modules...")
+    stale = regenerate(list(page_objects))
+    print(f"   ♻️  {len(page_objects) - len(stale)} modules up to date, regenerated {len(stale)}")
+    
+    watcher = PollingWatcher(WATCHED_DIRS, interval=args.poll_interval, debounce=args.debounce)
+    print(f"\n👀 Watching {', '.join(str(d) for d in watcher.directories)} (Ctrl+C to stop)...")
+    
+    try:
+        for changed in watcher.batches(max_batches):
+            print(f"\n🔄 {len(changed)} file(s) changed: {', '.join(sorted(Path(p).name for p in changed))}")
+            try:
+                regenerated, targets = apply_changes(changed)
+            except Exception as error:
+                # Keep watching; the next save usually fixes a half-edited file
+                print(f"   ⚠️  Regeneration failed: {error}")
+                continue
+            print(f"   ✅ Regenerated {len(regenerated)} of {len(targets)} affected modules")
+    except KeyboardInterrupt:
+        print("\n👋 Watch stopped")
+        
+        
+def main(argv=None):
+    args = parse_args(argv)
+    
     print("=" * 70)
     print("🚀 PRODUCTION RF-to-Python Generator")
     print("   Using Robot Framework's Native Parser")
@@ -20,17 +305,34 @@ def main():
     print("   ✅ Ready for 3000+ keywords")
     print("=" * 70)
     
+    parser = RFNativeParser(Path.cwd(), use_cache=not args.no_cache, quiet=args.quiet)
+    metrics = RunMetrics()
+    
+    if args.watch:
+        run_watch(args, parser)
+        return
+        
+    if args.stream:
+        print("\n📁 Step 1: Parsing locator files...")
+        with metrics.phase("locators"):
+            locators_map = load_locators(parser)
+        generated_count, total_kw = run_streaming(args, parser, locators_map, metrics)
+        write_metrics(args, metrics, parser)
+        print_summary(generated_count, total_kw)
+        return
+        
     # Parse using RF's native parser
     print("\n📁 Step 1: Parsing with RF Native Parser...")
-    parser = RFNativeParser(Path.cwd())
-    
-    page_objects = parser.parse_directory("object-repository/page-objects")
+    with metrics.phase("parse"):
+        page_objects = parser.parse_directory(PAGE_OBJECTS_DIR, jobs=args.jobs)
+    metrics.add_files("parse", parser.file_stats)
     total_kw = sum(len(pf.keywords) for pf in page_objects)
+    metrics.count("keywords", total_kw)
     
     print(f"\n📊 Parsed {len(page_objects)} resource files")
     print(f"📊 Found {total_kw} keywords total\n")
     
-    for pf in page_objects:
+    for pf in [] if args.quiet else page_objects:
         print(f"   📄 {pf.filename}")
         print(f"      Keywords: {len(pf.keywords)}")
         print(f"      Variables: {len(pf.variables)}")
@@ -40,29 +342,191 @@ def main():
         
     # Parse locators
     print("📁 Step 2: Parsing locator files...")
-    locators_map = {}
-    locator_dir = Path("object-repository/locators")
-    
-    if locator_dir.exists():
-        for loc_file in locator_dir.glob("*.robot"):
-            parsed_loc = parser.parse_robot_file(loc_file)
-            base_name = loc_file.stem.replace('Locators', '')
-            locators_map[base_name] = parsed_loc.variables
-            print(f"   📍 {loc_file.name}: {len(parsed_loc.variables)} locators")
-            
+    with metrics.phase("locators"):
+        locators_map = load_locators(parser)
+    specs = library_specs(args)
+    generator = SmartCodeGenerator(OUTPUT_DIR, quiet=args.quiet, shard_size=args.shard_size,
+                                   stubs=not args.no_stubs, specs=specs)
+    with metrics.phase("variables"):
+        variables = write_variables(parser, generator)
+    platforms = select_platforms(args, variables)
+    
+    # Resolve resource imports
+    print("\n🔗 Step 3: Resolving resource imports...")
+    with metrics.phase("resolve"):
+        resolver = ResourceResolver(parser)
+        for pf in page_objects:
+            resolver.add(pf)
+        test_files = find_test_files(args.tests or ["test-cases"])
+        resolved = resolver.resolve(test_files + [Path(pf.filepath) for pf in page_objects])
+        symbol_tables = {key: resolver.symbol_table(key) for key in resolved}
+    print(f"   Resolved {len(resolved)} files from {len(test_files)} test suites")
+    for cycle in resolver.cycles:
+        print(f"   ⚠️  Import cycle: {' -> '.join(Path(p).name for p in cycle)}")
+        
     # Analyze dependencies
-    print("\n📊 Step 3: Analyzing keyword dependencies...")
-    dependencies = parser.analyze_keyword_dependencies(page_objects)
+    print("\n📊 Step 4: Analyzing keyword dependencies...")
+    with metrics.phase("analyze"):
+        test_suites = [resolver.load(path) for path in test_files]
+        suite_keywords = [suite for suite in test_suites if suite.keywords] if args.prune else []
+        dependencies = parser.analyze_keyword_dependencies(page_objects + suite_keywords, symbol_tables)
     print(f"   Found {len(dependencies)} keywords with dependencies")
     
+    variant = generation_variant(args)
+    to_prune = []
+    if args.prune:
+        with metrics.phase("prune"):
+            tests = select_tests(test_suites, args.include_tag, args.exclude_tag)
+            pruning = prune_unreachable(parser.call_graph, tests, page_objects)
+        metrics.count("pruned_keywords", pruning.pruned_count)
+        print(f"\n✂️  Pruning to {len(tests)} selected tests: keeping {len(pruning.reachable)} keywords, "
+              f"pruned {pruning.pruned_count}")
+        for source, names in [] if args.quiet else sorted(pruning.pruned.items()):
+            print(f"   {Path(source).name}: pruned {len(names)} ({', '.join(names[:3])}"
+                  f"{', ...' if len(names) > 3 else ''})")
+        if args.prune_report:
+            pruning.write_report(args.prune_report)
+            print(f"   📝 Prune report: {args.prune_report}")
+        variant = " ".join(filter(None, [variant, f"pruned:{pruning.fingerprint()}"]))
+        pruned_objects = [pruning.prune(pf) for pf in page_objects]
+        to_prune = [pf for pf in pruned_objects if not pf.keywords]
+        page_objects = [pf for pf in pruned_objects if pf.keywords]
+        total_kw = sum(len(pf.keywords) for pf in page_objects)
+    
+    if not args.no_compile:
+        generator.enable_compiler(parser.call_graph, page_objects)
+        
+    if args.catalog:
+        with metrics.phase("catalog"), KeywordCatalog(args.catalog) as catalog:
+            result = catalog.update(page_objects, parser.call_graph)
+        print(f"   🗂️  Keyword catalog {args.catalog}: {result['updated']} files updated, "
+              f"{result['removed']} removed")
+    
     # Generate Python wrappers
-    print("\n🏗️  Step 4: Generating Python wrappers...")
-    generator = SmartCodeGenerator("pytest_rf_bridge/production_generated")
-    generated = generator.generate_all(page_objects, locators_map)
+    print("\n🏗️  Step 5: Generating Python wrappers...")
+    with metrics.phase("generate"):
+        generated = write_package(args, generator, page_objects, to_prune, locators_map, symbol_tables,
+                                  resolver, variant, variables)
+    finish_output(args, generator, metrics)
+    record_generated(metrics, generator)
+    
+    for platform in platforms:
+        platform_generator = SmartCodeGenerator(f"{OUTPUT_DIR}_{platform.lower()}", quiet=args.quiet,
+                                                shard_size=args.shard_size, stubs=not args.no_stubs,
+                                                platform=platform, specs=specs)
+        print(f"\n📱 Platform package for {platform.lower()}: {platform_generator.output_dir}/")
+        with metrics.phase(f"platform_{platform.lower()}"):
+            platform_generator.generate_variables_module(variables)
+            platform_generator.enable_compiler(parser.call_graph, page_objects)
+            write_package(args, platform_generator, page_objects, to_prune, locators_map, symbol_tables,
+                          resolver, " ".join([variant, platform_variant(platform_generator)]), variables)
+        finish_output(args, platform_generator)
+        
+    write_metrics(args, metrics, parser, specs)
+    print_summary(len(generated), total_kw)
     
+
+def select_platforms(args, variables):
+    """Platform prefixes (e.g. 'ANDROID') named by --platforms, all of them for a bare --platforms."""
+    if args.platforms is None:
+        return []
+    available = {platform.lower(): platform for platform in variables.platforms()}
+    unknown = [name for name in args.platforms if name.lower() not in available]
+    if unknown:
+        sys.exit(f"❌ Unknown platform(s) {', '.join(unknown)}; configs/ defines "
+                 f"{', '.join(sorted(available)) or 'none'}")
+    return [available[name.lower()] for name in args.platforms] or list(available.values())
+    
+    
+def platform_variant(generator):
+    """Manifest variant of a platform package: folded values change its output (see GenerationManifest)."""
+    values = json.dumps(generator.constant_values, sort_keys=True).encode()
+    return f"platform:{generator.platform.lower()}:{hashlib.sha256(values).hexdigest()[:16]}"
+    
+    
+def write_package(args, generator, page_objects, to_prune, locators_map, symbol_tables, resolver, variant,
+                  variables):
+    """Write the modules, __init__ and keyword registry of one output package; returns the modules written."""
+    manifest = GenerationManifest(generator.output_dir / MANIFEST_NAME, variables.files)
+    
+    for pf in to_prune:
+        # Modules without reachable keywords are dropped from the package
+        output_file = generator.output_file_for(pf)
+        if manifest.owns(pf, output_file) and output_file.exists():
+            for module_file in [output_file] + generator.shard_files_for(output_file):
+                generator.remove_module(module_file)
+            print(f"   🗑️  Removed {output_file.name} (no reachable keywords)")
+            
+    to_generate = page_objects
+    if args.incremental:
+        to_generate = [pf for pf in page_objects
+                       if manifest.is_stale(pf, generator.output_file_for(pf), resolver, variant)]
+        print(f"   ♻️  {len(page_objects) - len(to_generate)} modules up to date, "
+              f"regenerating {len(to_generate)}")
+        
+    generated = generator.generate_all(to_generate, locators_map, symbol_tables, jobs=args.jobs)
+    for pf in to_generate:
+        output_file = generator.output_file_for(pf)
+        manifest.record(pf, output_file, resolver, variant, generator.uses_variables(output_file))
+    manifest.save([pf.filepath for pf in page_objects])
+    generator.generate_package_init(pf.filename for pf in page_objects)
+    generator.generate_keyword_registry(keyword_names(page_objects))
+    return generated
+    
+
+def finish_output(args, generator, metrics=None):
+    """
+    Report skipped writes and byte-compile the modules this run wrote, so
+    the first import starts from warm bytecode.
+    """
+    counts = generator.write_counts
+    if counts["skipped"]:
+        print(f"   💾 {counts['skipped']} unchanged files not rewritten, {counts['written']} written")
+    if metrics is not None:
+        metrics.count("files_written", counts["written"])
+        metrics.count("writes_skipped", counts["skipped"])
+    counts.update(written=0, skipped=0)
+    
+    if args.no_byte_compile:
+        return
+    if metrics is None:
+        count = generator.byte_compile()
+    else:
+        with metrics.phase("byte_compile"):
+            count = generator.byte_compile()
+        metrics.count("byte_compiled", count)
+    if count:
+        print(f"   ⚙️  Byte-compiled {count} modules")
+        
+        
+def record_generated(metrics, generator):
+    """Add the generator's per-module stats and totals to the run metrics."""
+    metrics.add_files("generate", generator.file_stats)
+    metrics.count("modules", len(generator.file_stats))
+    metrics.count("generated_keywords", sum(stats["keywords"] for stats in generator.file_stats.values()))
+    metrics.count("compiled_keywords", sum(stats["compiled"] for stats in generator.file_stats.values()))
+    metrics.count("shards", sum(stats["shards"] for stats in generator.file_stats.values()))
+    metrics.count("placeholders", sum(stats["placeholders"] for stats in generator.file_stats.values()))
+    
+    
+def write_metrics(args, metrics, parser, specs=None):
+    """Write --metrics-json, adding the parse cache, libdoc cache and error counts."""
+    if not args.metrics_json:
+        return
+    metrics.count("parse_errors", len(parser.parse_errors))
+    metrics.count("cache_hits", parser.cache.hits if parser.cache else 0)
+    metrics.count("cache_misses", parser.cache.misses if parser.cache else 0)
+    metrics.count("libdoc_cache_hits", specs.hits if specs else 0)
+    metrics.count("libdoc_cache_misses", specs.misses if specs else 0)
+    metrics.write(args.metrics_json)
+    print(f"\n📈 Metrics: {args.metrics_json}")
+    
+
+def print_summary(generated_count, total_kw):
+    """Print the closing banner."""
     print(f"\n{'=' * 70}")
-    print(f"✅ SUCCESS! Generated {len(generated)} Python wrapper files")
-    print(f"📂 Output directory: pytest_rf_bridge/production_generated/")
+    print(f"✅ SUCCESS! Generated {generated_count} Python wrapper files")
+    print(f"📂 Output directory: {OUTPUT_DIR}/")
     print(f"📊 Total keywords wrapped: {total_kw}")
     print(f"{'=' * 70}")
     
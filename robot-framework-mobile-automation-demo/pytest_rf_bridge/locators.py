@@ -0,0 +1,35 @@
+"""
+Pre-parsed element locators for generated wrapper classes.
+
+The generator resolves a locator such as 'accessibility_id=Login' to its
+AppiumBy strategy and criteria once, and emits it as a Locator constant.
+A Locator is still the RF locator string, so it works wherever AppiumLibrary
+expects one; FastElementFinder, installed on the bridge's AppiumLibrary,
+sends it straight to find_elements instead of parsing it on every lookup.
+"""
+from AppiumLibrary.locators import ElementFinder
+
+
+class Locator(str):
+    """RF locator string carrying its AppiumBy strategy (by) and criteria (value)."""
+
+    def __new__(cls, locator, by, value):
+        self = super().__new__(cls, locator)
+        self.by = by
+        self.value = value
+        return self
+
+    def __repr__(self):
+        return f"Locator({str(self)!r}, {self.by!r}, {self.value!r})"
+
+    def __reduce__(self):
+        return Locator, (str(self), self.by, self.value)
+
+
+class FastElementFinder(ElementFinder):
+    """AppiumLibrary's ElementFinder with a fast path for pre-parsed locators."""
+
+    def find(self, application, locator, tag=None):
+        if tag is None and isinstance(locator, Locator):
+            return self._normalize_result(application.find_elements(by=locator.by, value=locator.value))
+        return super().find(application, locator, tag)
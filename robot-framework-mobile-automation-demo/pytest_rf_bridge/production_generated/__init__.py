@@ -0,0 +1,35 @@
+"""
+Auto-generated package index: 3 keyword classes.
+
+Keyword classes are imported on first access, e.g.
+`from pytest_rf_bridge.production_generated import CommonKeywords` loads common_keywords only.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+# Keyword class -> module defining it
+_CLASSES = {
+    'CommonKeywords': 'common_keywords',
+    'LoginKeywords': 'loginscreen_keywords',
+    'NavigationKeywords': 'navigationbar_keywords',
+}
+
+__all__ = sorted(_CLASSES)
+
+if TYPE_CHECKING:
+    from .common_keywords import CommonKeywords
+    from .loginscreen_keywords import LoginKeywords
+    from .navigationbar_keywords import NavigationKeywords
+
+
+def __getattr__(name):
+    module = _CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CLASSES))
@@ -0,0 +1,23 @@
+# Stub for common_keywords.py (auto-generated)
+from typing import Any
+
+
+class CommonKeywords:
+    bridge: Any
+
+    def __init__(self, bridge: Any) -> None: ...
+    def open_test_application(self) -> None: ...
+    def open_android_application(self) -> None: ...
+    def open_ios_application(self) -> None: ...
+    def get_random_email_address(self) -> Any: ...
+    def get_random_text(self) -> Any: ...
+    def get_current_epoch_time(self) -> Any: ...
+    def element_should_be_contained_in_the_page(self, locator: Any, retry_scale: Any) -> None: ...
+    def element_should_not_be_contained_in_the_page(self, locator: Any, retry_scale: Any) -> None: ...
+    def element_should_be_visible(self, locator: Any, retry_scale: Any) -> None: ...
+    def element_should_not_be_visible(self, locator: Any, retry_scale: Any) -> None: ...
+    def click_element(self, locator: Any, retry_scale: Any) -> None: ...
+    def element_text_should_be(self, locator: Any, text: Any, retry_scale: Any) -> None: ...
+    def input_text(self, text_box_locator: Any, text: Any, retry_scale: Any) -> None: ...
+    def alert_title_should_be(self, alert_title: Any) -> None: ...
+    def alert_message_should_be(self, alert_message: Any) -> None: ...
@@ -0,0 +1,97 @@
+"""
+Auto-generated keyword registry: 24 keywords of 3 resources.
+
+Runs generated keywords by their RF names, e.g.
+`KeywordRegistry(bridge).run_keyword("Navigate To Login Screen")`.
+Names match as in RF (case, spaces and underscores are ignored, and
+`Resource.Keyword Name` selects the resource); keyword classes are
+imported on first use.
+"""
+import importlib
+
+from robot.utils import normalize
+
+# RF-normalized keyword name -> (module, class, method)
+KEYWORDS = {
+    'opentestapplication': ('common_keywords', 'CommonKeywords', 'open_test_application'),
+    'openandroidapplication': ('common_keywords', 'CommonKeywords', 'open_android_application'),
+    'openiosapplication': ('common_keywords', 'CommonKeywords', 'open_ios_application'),
+    'getrandomemailaddress': ('common_keywords', 'CommonKeywords', 'get_random_email_address'),
+    'getrandomtext': ('common_keywords', 'CommonKeywords', 'get_random_text'),
+    'getcurrentepochtime': ('common_keywords', 'CommonKeywords', 'get_current_epoch_time'),
+    'elementshouldbecontainedinthepage': ('common_keywords', 'CommonKeywords', 'element_should_be_contained_in_the_page'),
+    'elementshouldnotbecontainedinthepage': ('common_keywords', 'CommonKeywords', 'element_should_not_be_contained_in_the_page'),
+    'elementshouldbevisible': ('common_keywords', 'CommonKeywords', 'element_should_be_visible'),
+    'elementshouldnotbevisible': ('common_keywords', 'CommonKeywords', 'element_should_not_be_visible'),
+    'clickelement': ('common_keywords', 'CommonKeywords', 'click_element'),
+    'elementtextshouldbe': ('common_keywords', 'CommonKeywords', 'element_text_should_be'),
+    'inputtext': ('common_keywords', 'CommonKeywords', 'input_text'),
+    'alerttitleshouldbe': ('common_keywords', 'CommonKeywords', 'alert_title_should_be'),
+    'alertmessageshouldbe': ('common_keywords', 'CommonKeywords', 'alert_message_should_be'),
+    'signuptotheapplication': ('loginscreen_keywords', 'LoginKeywords', 'sign_up_to_the_application'),
+    'logintotheapplication': ('loginscreen_keywords', 'LoginKeywords', 'login_to_application'),
+    "clickonthe'signup'container": ('loginscreen_keywords', 'LoginKeywords', 'click_on_the_sign_up_container'),
+    'inputemailaddress': ('loginscreen_keywords', 'LoginKeywords', 'input_email_address'),
+    'inputpassword': ('loginscreen_keywords', 'LoginKeywords', 'input_password'),
+    'inputconfirmpassword': ('loginscreen_keywords', 'LoginKeywords', 'input_confirm_password'),
+    "clickonthe'signup'button": ('loginscreen_keywords', 'LoginKeywords', 'click_on_the_sign_up_button'),
+    "clickonthe'login'button": ('loginscreen_keywords', 'LoginKeywords', 'click_on_the_login_button'),
+    'navigatetologinscreen': ('navigationbar_keywords', 'NavigationKeywords', 'navigate_to_login_screen'),
+    'commonpo.opentestapplication': ('common_keywords', 'CommonKeywords', 'open_test_application'),
+    'commonpo.openandroidapplication': ('common_keywords', 'CommonKeywords', 'open_android_application'),
+    'commonpo.openiosapplication': ('common_keywords', 'CommonKeywords', 'open_ios_application'),
+    'commonpo.getrandomemailaddress': ('common_keywords', 'CommonKeywords', 'get_random_email_address'),
+    'commonpo.getrandomtext': ('common_keywords', 'CommonKeywords', 'get_random_text'),
+    'commonpo.getcurrentepochtime': ('common_keywords', 'CommonKeywords', 'get_current_epoch_time'),
+    'commonpo.elementshouldbecontainedinthepage': ('common_keywords', 'CommonKeywords', 'element_should_be_contained_in_the_page'),
+    'commonpo.elementshouldnotbecontainedinthepage': ('common_keywords', 'CommonKeywords', 'element_should_not_be_contained_in_the_page'),
+    'commonpo.elementshouldbevisible': ('common_keywords', 'CommonKeywords', 'element_should_be_visible'),
+    'commonpo.elementshouldnotbevisible': ('common_keywords', 'CommonKeywords', 'element_should_not_be_visible'),
+    'commonpo.clickelement': ('common_keywords', 'CommonKeywords', 'click_element'),
+    'commonpo.elementtextshouldbe': ('common_keywords', 'CommonKeywords', 'element_text_should_be'),
+    'commonpo.inputtext': ('common_keywords', 'CommonKeywords', 'input_text'),
+    'commonpo.alerttitleshouldbe': ('common_keywords', 'CommonKeywords', 'alert_title_should_be'),
+    'commonpo.alertmessageshouldbe': ('common_keywords', 'CommonKeywords', 'alert_message_should_be'),
+    'loginscreenpo.signuptotheapplication': ('loginscreen_keywords', 'LoginKeywords', 'sign_up_to_the_application'),
+    'loginscreenpo.logintotheapplication': ('loginscreen_keywords', 'LoginKeywords', 'login_to_application'),
+    "loginscreenpo.clickonthe'signup'container": ('loginscreen_keywords', 'LoginKeywords', 'click_on_the_sign_up_container'),
+    'loginscreenpo.inputemailaddress': ('loginscreen_keywords', 'LoginKeywords', 'input_email_address'),
+    'loginscreenpo.inputpassword': ('loginscreen_keywords', 'LoginKeywords', 'input_password'),
+    'loginscreenpo.inputconfirmpassword': ('loginscreen_keywords', 'LoginKeywords', 'input_confirm_password'),
+    "loginscreenpo.clickonthe'signup'button": ('loginscreen_keywords', 'LoginKeywords', 'click_on_the_sign_up_button'),
+    "loginscreenpo.clickonthe'login'button": ('loginscreen_keywords', 'LoginKeywords', 'click_on_the_login_button'),
+    'navigationbarpo.navigatetologinscreen': ('navigationbar_keywords', 'NavigationKeywords', 'navigate_to_login_screen'),
+}
+
+
+class KeywordRegistry:
+    """Generated keywords by RF name, bound to one bridge."""
+
+    def __init__(self, bridge):
+        self.bridge = bridge
+        self._instances = {}
+        self._callables = {}
+
+    def get_keyword(self, name):
+        """Bound method implementing the RF keyword name."""
+        try:
+            return self._callables[name]
+        except KeyError:
+            pass
+        entry = KEYWORDS.get(normalize(name, ignore='_'))
+        if entry is None:
+            raise KeyError(f"No keyword with name '{name}' found.")
+        module, class_name, method = entry
+        if class_name not in self._instances:
+            keyword_class = getattr(importlib.import_module(f".{module}", __package__), class_name)
+            self._instances[class_name] = keyword_class(self.bridge)
+        # Later calls with the same spelling skip normalization
+        self._callables[name] = getattr(self._instances[class_name], method)
+        return self._callables[name]
+
+    def run_keyword(self, name, *args, **kwargs):
+        """Run the RF keyword name with Python arguments."""
+        return self.get_keyword(name)(*args, **kwargs)
+
+    def __contains__(self, name):
+        return normalize(name, ignore='_') in KEYWORDS
@@ -0,0 +1,12 @@
+# Stub for keyword_registry.py (auto-generated)
+from typing import Any, Dict
+
+KEYWORDS: Dict[str, Any]
+
+
+class KeywordRegistry:
+    bridge: Any
+
+    def __init__(self, bridge: Any) -> None: ...
+    def get_keyword(self, name: Any) -> Any: ...
+    def run_keyword(self, name: Any, *args: Any, **kwargs: Any) -> Any: ...
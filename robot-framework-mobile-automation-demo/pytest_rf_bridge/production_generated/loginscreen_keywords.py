@@ -5,6 +5,8 @@ Libraries:
 
 Generated using RF native parser - handles ALL RF syntax correctly.
 """
+from appium.webdriver.common.appiumby import AppiumBy
+from pytest_rf_bridge.locators import Locator
 
 
 class LoginKeywords:
@@ -15,12 +17,12 @@ class LoginKeywords:
     """
     
     # Locators
-    SIGNUP_CONTAINER = "accessibility_id=button-sign-up-container"
-    EMAIL_ADDRESS_TEXTBOX = "accessibility_id=input-email"
-    PASSWORD_TEXTBOX = "accessibility_id=input-password"
-    CONFIRM_PASSWORD_TEXTBOX = "accessibility_id=input-repeat-password"
-    SIGNUP_BUTTON = "accessibility_id=button-SIGN UP"
-    LOGIN_BUTTON = "accessibility_id=button-LOGIN"
+    SIGNUP_CONTAINER = Locator("accessibility_id=button-sign-up-container", AppiumBy.ACCESSIBILITY_ID, "button-sign-up-container")
+    EMAIL_ADDRESS_TEXTBOX = Locator("accessibility_id=input-email", AppiumBy.ACCESSIBILITY_ID, "input-email")
+    PASSWORD_TEXTBOX = Locator("accessibility_id=input-password", AppiumBy.ACCESSIBILITY_ID, "input-password")
+    CONFIRM_PASSWORD_TEXTBOX = Locator("accessibility_id=input-repeat-password", AppiumBy.ACCESSIBILITY_ID, "input-repeat-password")
+    SIGNUP_BUTTON = Locator("accessibility_id=button-SIGN UP", AppiumBy.ACCESSIBILITY_ID, "button-SIGN UP")
+    LOGIN_BUTTON = Locator("accessibility_id=button-LOGIN", AppiumBy.ACCESSIBILITY_ID, "button-LOGIN")
 
     def __init__(self, bridge):
         """Initialize with RF bridge."""
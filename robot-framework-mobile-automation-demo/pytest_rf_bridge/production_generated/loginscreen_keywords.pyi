@@ -0,0 +1,23 @@
+# Stub for loginscreen_keywords.py (auto-generated)
+from typing import Any
+from pytest_rf_bridge.locators import Locator
+
+
+class LoginKeywords:
+    SIGNUP_CONTAINER: Locator
+    EMAIL_ADDRESS_TEXTBOX: Locator
+    PASSWORD_TEXTBOX: Locator
+    CONFIRM_PASSWORD_TEXTBOX: Locator
+    SIGNUP_BUTTON: Locator
+    LOGIN_BUTTON: Locator
+    bridge: Any
+
+    def __init__(self, bridge: Any) -> None: ...
+    def sign_up_to_the_application(self, email_address: Any, password: Any, confirm_password: Any) -> None: ...
+    def login_to_application(self, email_address: Any, password: Any) -> None: ...
+    def click_on_the_sign_up_container(self) -> None: ...
+    def input_email_address(self, email_address: Any) -> None: ...
+    def input_password(self, password: Any) -> None: ...
+    def input_confirm_password(self, confirm_password: Any) -> None: ...
+    def click_on_the_sign_up_button(self) -> None: ...
+    def click_on_the_login_button(self) -> None: ...
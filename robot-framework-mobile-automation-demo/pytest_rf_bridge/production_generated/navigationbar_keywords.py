@@ -5,6 +5,8 @@ Libraries:
 
 Generated using RF native parser - handles ALL RF syntax correctly.
 """
+from appium.webdriver.common.appiumby import AppiumBy
+from pytest_rf_bridge.locators import Locator
 
 
 class NavigationKeywords:
@@ -15,7 +17,7 @@ class NavigationKeywords:
     """
     
     # Locators
-    LOGIN_ICON = "accessibility_id=Login"
+    LOGIN_ICON = Locator("accessibility_id=Login", AppiumBy.ACCESSIBILITY_ID, "Login")
 
     def __init__(self, bridge):
         """Initialize with RF bridge."""
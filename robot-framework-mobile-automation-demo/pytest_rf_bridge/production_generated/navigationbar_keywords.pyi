@@ -0,0 +1,11 @@
+# Stub for navigationbar_keywords.py (auto-generated)
+from typing import Any
+from pytest_rf_bridge.locators import Locator
+
+
+class NavigationKeywords:
+    LOGIN_ICON: Locator
+    bridge: Any
+
+    def __init__(self, bridge: Any) -> None: ...
+    def navigate_to_login_screen(self) -> None: ...
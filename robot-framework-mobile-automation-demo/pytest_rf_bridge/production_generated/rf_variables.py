@@ -0,0 +1,63 @@
+"""
+Auto-generated from: configs/AppiumConfigs.robot, configs/ApplicationConfigs.robot, constants/AlertConstants.robot, constants/LoginConstants.robot
+Total variables: 26
+
+Resolved at generation time; environment variables are read on import.
+"""
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# configs/AppiumConfigs.robot
+APPIUM_SERVER_URL = 'http://localhost:4723'
+PLATFORM_NAME = 'android'
+ANDROID_AUTOMATION_NAME = 'UIAutomator2'
+ANDROID_APP = os.path.join(PROJECT_ROOT, 'apps', 'wdioNativeDemoApp.apk')
+ANDROID_PLATFORM_NAME = 'android'
+ANDROID_PLATFORM_VERSION = os.environ.get('ANDROID_PLATFORM_VERSION', '13')
+ANDROID_APP_PACKAGE = 'com.wdiodemoapp'
+ANDROID_APP_ACTIVITY = '.MainActivity'
+ANDROID_DEVICE_NAME = 'Pixel 6'
+IOS_AUTOMATION_NAME = 'XCUITest'
+IOS_APP = os.path.join(PROJECT_ROOT, 'apps', 'wdioNativeDemoApp.app')
+IOS_PLATFORM_NAME = 'ios'
+IOS_PLATFORM_VERSION = os.environ.get('IOS_PLATFORM_VERSION', '16.1')
+IOS_APP_BUNDLE_ID = 'com.wdiodemoapp'
+IOS_DEVICE_NAME = 'iPhone 14'
+
+# configs/ApplicationConfigs.robot
+SMALL_RETRY_COUNT = '2x'
+MEDIUM_RETRY_COUNT = '3x'
+LARGE_RETRY_COUNT = '5x'
+RETRY_DELAY = '1 s'
+TIMEOUT = '60'
+
+# constants/AlertConstants.robot
+SIGNED_UP_SUCCESS_ALERT_TITLE = 'Signed Up!'
+SIGNED_UP_SUCCESS_ALERT_MESSAGE = 'You successfully signed up!'
+LOGIN_SUCCESS_ALERT_TITLE = 'Success'
+LOGIN_SUCCESS_ALERT_MESSAGE = 'You are logged in!'
+
+# constants/LoginConstants.robot
+EMAIL_ADDRESS = 'osanda@mailinator.com'
+PASSWORD = 'osanda@SL'
+
+PLATFORMS = {
+    'android': {
+        'PLATFORM_NAME': ANDROID_PLATFORM_NAME,
+        'AUTOMATION_NAME': ANDROID_AUTOMATION_NAME,
+        'APP': ANDROID_APP,
+        'PLATFORM_VERSION': ANDROID_PLATFORM_VERSION,
+        'APP_PACKAGE': ANDROID_APP_PACKAGE,
+        'APP_ACTIVITY': ANDROID_APP_ACTIVITY,
+        'DEVICE_NAME': ANDROID_DEVICE_NAME,
+    },
+    'ios': {
+        'PLATFORM_NAME': IOS_PLATFORM_NAME,
+        'AUTOMATION_NAME': IOS_AUTOMATION_NAME,
+        'APP': IOS_APP,
+        'PLATFORM_VERSION': IOS_PLATFORM_VERSION,
+        'APP_BUNDLE_ID': IOS_APP_BUNDLE_ID,
+        'DEVICE_NAME': IOS_DEVICE_NAME,
+    },
+}
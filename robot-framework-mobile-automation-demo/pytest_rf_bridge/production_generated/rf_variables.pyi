@@ -0,0 +1,31 @@
+# Stub for rf_variables.py (auto-generated)
+from typing import Any, Dict
+
+PROJECT_ROOT: str
+APPIUM_SERVER_URL: str
+PLATFORM_NAME: str
+ANDROID_AUTOMATION_NAME: str
+ANDROID_APP: str
+ANDROID_PLATFORM_NAME: str
+ANDROID_PLATFORM_VERSION: str
+ANDROID_APP_PACKAGE: str
+ANDROID_APP_ACTIVITY: str
+ANDROID_DEVICE_NAME: str
+IOS_AUTOMATION_NAME: str
+IOS_APP: str
+IOS_PLATFORM_NAME: str
+IOS_PLATFORM_VERSION: str
+IOS_APP_BUNDLE_ID: str
+IOS_DEVICE_NAME: str
+SMALL_RETRY_COUNT: str
+MEDIUM_RETRY_COUNT: str
+LARGE_RETRY_COUNT: str
+RETRY_DELAY: str
+TIMEOUT: str
+SIGNED_UP_SUCCESS_ALERT_TITLE: str
+SIGNED_UP_SUCCESS_ALERT_MESSAGE: str
+LOGIN_SUCCESS_ALERT_TITLE: str
+LOGIN_SUCCESS_ALERT_MESSAGE: str
+EMAIL_ADDRESS: str
+PASSWORD: str
+PLATFORMS: Dict[str, Dict[str, Any]]
@@ -5,6 +5,8 @@ Provides setup and teardown functionality for tests.
 import pytest
 import os
 from pytest_rf_bridge.rf_keyword_bridge import RobotKeywordBridge
+from pytest_rf_bridge.production_generated import rf_variables
+from pytest_rf_bridge.production_generated.keyword_registry import KeywordRegistry
 
 
 @pytest.fixture(scope="function")
@@ -34,25 +36,34 @@ def rf_bridge():
         pass  # Ignore errors during teardown
 
 
+@pytest.fixture(scope="function")
+def rf_keywords(rf_bridge):
+    """
+    Fixture that runs generated keywords by their RF names, e.g.
+    rf_keywords.run_keyword("Navigate To Login Screen").
+    """
+    return KeywordRegistry(rf_bridge)
+
+
 @pytest.fixture(scope="session")
 def test_credentials():
     """
-    Fixture that provides test credentials.
+    Fixture that provides test credentials (constants/LoginConstants.robot).
     """
     return {
-        "email": "osanda@mailinator.com",
-        "password": "osanda@SL"
+        "email": rf_variables.EMAIL_ADDRESS,
+        "password": rf_variables.PASSWORD
     }
 
 
 @pytest.fixture(scope="session")
 def alert_messages():
     """
-    Fixture that provides expected alert messages.
+    Fixture that provides expected alert messages (constants/AlertConstants.robot).
     """
     return {
-        "login_success_title": "Success",
-        "login_success_message": "You are logged in!",
-        "signup_success_title": "Signed Up!",
-        "signup_success_message": "You successfully signed up!"
+        "login_success_title": rf_variables.LOGIN_SUCCESS_ALERT_TITLE,
+        "login_success_message": rf_variables.LOGIN_SUCCESS_ALERT_MESSAGE,
+        "signup_success_title": rf_variables.SIGNED_UP_SUCCESS_ALERT_TITLE,
+        "signup_success_message": rf_variables.SIGNED_UP_SUCCESS_ALERT_MESSAGE
     }
\ No newline at end of file
@@ -2,13 +2,24 @@
 Core bridge that wraps Robot Framework's AppiumLibrary for use in pytest.
 This allows pytest tests to use RF keywords directly.
 """
-import os
+import importlib
+import re
 from AppiumLibrary import AppiumLibrary
+from robot.libraries import STDLIBS
 from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import Matcher, timestr_to_secs
 import string
 import random
 import time
 
+from pytest_rf_bridge.locators import FastElementFinder
+from pytest_rf_bridge.production_generated import rf_variables
+
+
+def retry_count(value):
+    """Number of attempts from an RF retry value such as '2x' or '3 times'."""
+    return int(re.match(r'\s*(\d+)', str(value)).group(1))
+
 
 class RobotKeywordBridge:
     """
@@ -17,26 +28,36 @@ class RobotKeywordBridge:
     
     def __init__(self):
         self.appium = AppiumLibrary()
-        self.timeout = 60
-        self.retry_delay = 1  # seconds
+        # Generated Locator constants skip AppiumLibrary's per-call locator parsing
+        self.appium._element_finder = FastElementFinder()
+        self._libraries = {'AppiumLibrary': self.appium}
+        # Values come from configs/ and constants/ via the generated rf_variables module
+        self.timeout = timestr_to_secs(rf_variables.TIMEOUT)
+        self.retry_delay = timestr_to_secs(rf_variables.RETRY_DELAY)  # seconds
         
         # Android configuration
-        self.appium_server_url = "http://localhost:4723"
-        self.android_automation_name = "UIAutomator2"
-        self.android_platform_name = "android"
-        self.android_platform_version = os.getenv("ANDROID_PLATFORM_VERSION", "13")
-        self.android_device_name = "Pixel 6"
+        android = rf_variables.PLATFORMS['android']
+        self.appium_server_url = rf_variables.APPIUM_SERVER_URL
+        self.android_automation_name = android['AUTOMATION_NAME']
+        self.android_platform_name = android['PLATFORM_NAME']
+        self.android_platform_version = android['PLATFORM_VERSION']
+        self.android_device_name = android['DEVICE_NAME']
+        self.android_app = android['APP']
+        self.android_app_package = android['APP_PACKAGE']
+        self.android_app_activity = android['APP_ACTIVITY']
         
-        # Get the app path relative to the project root
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.android_app = os.path.join(project_root, "apps", "wdioNativeDemoApp.apk")
-        self.android_app_package = "com.wdiodemoapp"
-        self.android_app_activity = ".MainActivity"
+        # iOS configuration
+        ios = rf_variables.PLATFORMS['ios']
+        self.ios_automation_name = ios['AUTOMATION_NAME']
+        self.ios_platform_name = ios['PLATFORM_NAME']
+        self.ios_platform_version = ios['PLATFORM_VERSION']
+        self.ios_device_name = ios['DEVICE_NAME']
+        self.ios_app = ios['APP']
         
         # Retry counts
-        self.small_retry_count = 2
-        self.medium_retry_count = 3
-        self.large_retry_count = 5
+        self.small_retry_count = retry_count(rf_variables.SMALL_RETRY_COUNT)
+        self.medium_retry_count = retry_count(rf_variables.MEDIUM_RETRY_COUNT)
+        self.large_retry_count = retry_count(rf_variables.LARGE_RETRY_COUNT)
         
     def open_android_application(self):
         """Open the Android application."""
@@ -52,6 +73,18 @@ class RobotKeywordBridge:
         )
         self.appium.set_appium_timeout(self.timeout)
         
+    def open_ios_application(self):
+        """Open the iOS application."""
+        self.appium.open_application(
+            self.appium_server_url,
+            automationName=self.ios_automation_name,
+            platformName=self.ios_platform_name,
+            platformVersion=self.ios_platform_version,
+            deviceName=self.ios_device_name,
+            app=self.ios_app
+        )
+        self.appium.set_appium_timeout(self.timeout)
+        
     def close_application(self):
         """Close the application."""
         self.appium.close_application()
@@ -133,3 +166,63 @@ class RobotKeywordBridge:
         """Verify alert message (Android specific)."""
         android_alert_message_locator = "id=android:id/message"
         self.element_text_should_be(android_alert_message_locator, expected_message, self.small_retry_count)
+        
+    # Runtime support for compiled keyword bodies
+    
+    def library(self, name):
+        """RF library instance used by compiled keywords, created on first use."""
+        if name not in self._libraries:
+            module = importlib.import_module(f"robot.libraries.{name}" if name in STDLIBS else name)
+            library = getattr(module, name.split('.')[-1], module)
+            self._libraries[name] = library() if isinstance(library, type) else library
+        return self._libraries[name]
+        
+    def wait_until_keyword_succeeds(self, retry, retry_interval, keyword, *args, **kwargs):
+        """
+        Python counterpart of BuiltIn's Wait Until Keyword Succeeds.
+        
+        retry is an attempt count ('2x', '3 times') or a timeout ('1 min');
+        the last failure is re-raised once retries are exhausted.
+        """
+        match = re.fullmatch(r'\s*(\d+)\s*(x|times?)\s*', str(retry), re.IGNORECASE)
+        interval = timestr_to_secs(retry_interval)
+        deadline = None if match else time.monotonic() + timestr_to_secs(retry)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return keyword(*args, **kwargs)
+            except Exception:
+                if match and attempt >= int(match.group(1)):
+                    raise
+                if deadline is not None and time.monotonic() + interval > deadline:
+                    raise
+            time.sleep(interval)
+            
+    def run_keyword_and_ignore_error(self, keyword, *args, **kwargs):
+        """('PASS', result) or ('FAIL', error message), like BuiltIn."""
+        try:
+            return 'PASS', keyword(*args, **kwargs)
+        except Exception as error:
+            return 'FAIL', str(error)
+            
+    def run_keyword_and_return_status(self, keyword, *args, **kwargs):
+        """True if the keyword passes, False if it fails, like BuiltIn."""
+        return self.run_keyword_and_ignore_error(keyword, *args, **kwargs)[0] == 'PASS'
+        
+    def error_matches(self, error, patterns, pattern_type=None):
+        """True if an error message matches EXCEPT patterns (LITERAL, GLOB, REGEXP or START)."""
+        message = str(error)
+        pattern_type = (pattern_type or 'LITERAL').upper()
+        for pattern in patterns:
+            if pattern_type == 'GLOB':
+                matched = Matcher(pattern, caseless=False, spaceless=False).match(message)
+            elif pattern_type == 'REGEXP':
+                matched = re.fullmatch(pattern, message) is not None
+            elif pattern_type == 'START':
+                matched = message.startswith(pattern)
+            else:
+                matched = message == pattern
+            if matched:
+                return True
+        return False
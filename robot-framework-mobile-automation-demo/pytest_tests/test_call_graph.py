@@ -0,0 +1,97 @@
+"""
+Tests of the keyword call graph (rf_auto_generator/call_graph.py).
+"""
+import pytest
+
+from rf_auto_generator.call_graph import KeywordCallGraph
+from rf_auto_generator.rf_native_parser import RFNativeParser
+
+
+@pytest.fixture
+def call_graph(tmp_path):
+    """Build a call graph from {file name: keyword table text}."""
+    def build(resources):
+        for name, keywords in resources.items():
+            (tmp_path / name).write_text(f"*** Keywords ***\n{keywords}")
+        parser = RFNativeParser(tmp_path, use_cache=False, quiet=True)
+        return KeywordCallGraph(parser.parse_directory(tmp_path))
+    return build
+
+
+def test_calls_resolve_ignoring_case_spaces_and_underscores(call_graph):
+    """Call sites resolve like RF: exact, or ignoring case, spaces and underscores."""
+    graph = call_graph({"CommonPo.robot": """Open The App
+    Log    opened
+
+Exact
+    Open The App
+
+Other Case
+    open the APP
+
+No Spaces
+    OpenTheApp
+
+Underscores
+    Open_The_App
+"""})
+    for caller in ("Exact", "Other Case", "No Spaces", "Underscores"):
+        assert graph.callees_of(f"CommonPo.{caller}") == {"CommonPo.Open The App"}
+        assert not graph.unresolved[f"CommonPo.{caller}"]
+    assert graph.callers_of("CommonPo.Open The App") == {
+        "CommonPo.Exact", "CommonPo.Other Case", "CommonPo.No Spaces", "CommonPo.Underscores"}
+    assert graph.unresolved["CommonPo.Open The App"] == {"Log"}
+
+
+def test_qualified_calls_resolve_to_the_named_resource(call_graph):
+    """Resource.Keyword calls the keyword of that resource, even when another resource has the same name."""
+    graph = call_graph({
+        "CommonPo.robot": "Tap Back\n    Log    common\n",
+        "LoginPo.robot": """Tap Back
+    Log    login
+
+Leave
+    CommonPo.Tap Back
+    commonpo.tap_back
+    UnknownPo.Tap Back
+""",
+    })
+    assert graph.callees_of("LoginPo.Leave") == {"CommonPo.Tap Back"}
+    assert graph.unresolved["LoginPo.Leave"] == {"UnknownPo.Tap Back"}
+
+
+def test_keyword_name_contained_in_another_is_not_a_call(call_graph):
+    """A keyword whose name is a substring of the called one is not a dependency (the old scan's bug)."""
+    graph = call_graph({"CommonPo.robot": """Login
+    Log    plain
+
+Login With Retry
+    Log    retry
+
+Sign In
+    Login With Retry
+
+Mention
+    Log    Login
+"""})
+    assert graph.callees_of("CommonPo.Sign In") == {"CommonPo.Login With Retry"}
+    assert graph.callers_of("CommonPo.Login") == set()
+    assert graph.callees_of("CommonPo.Mention") == set()
+
+
+def test_run_keyword_variants_and_transitive_reach(call_graph):
+    """Keywords passed to run-keyword variants are calls; reachable_from follows them transitively."""
+    graph = call_graph({"CommonPo.robot": """Step A
+    Step B
+
+Step B
+    Log    b
+
+Step C
+    Log    c
+
+Start
+    Run Keyword If    True    Step A    ELSE    Step C
+"""})
+    assert graph.callees_of("CommonPo.Start") == {"CommonPo.Step A", "CommonPo.Step C"}
+    assert graph.reachable_from("CommonPo.Start") == {"CommonPo.Step A", "CommonPo.Step B", "CommonPo.Step C"}
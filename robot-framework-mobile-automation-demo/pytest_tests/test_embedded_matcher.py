@@ -0,0 +1,72 @@
+"""
+Tests of the embedded-argument matcher (rf_auto_generator/embedded_matcher.py)
+and of how the call graph picks among matching patterns.
+"""
+from robot.running.arguments.embedded import EmbeddedArguments
+
+from rf_auto_generator.call_graph import KeywordCallGraph
+from rf_auto_generator.embedded_matcher import EmbeddedMatcher
+from rf_auto_generator.rf_native_parser import RFNativeParser
+
+PATTERNS = [
+    "Tap ${target}",
+    "Tap On ${target}",
+    "Tap On Button ${label}",
+    "Tap On Button ${label} Twice",
+    "Type ${text} Into ${field}",
+    "Click Element [Arguments] ${locator} ${retryScale}",
+]
+
+
+def matcher_for(patterns):
+    matcher = EmbeddedMatcher()
+    for pattern in patterns:
+        matcher.add(pattern, pattern)
+    return matcher
+
+
+def test_overlapping_literal_prefixes():
+    """Patterns sharing literal prefixes are all tried; matches come in the order they were added."""
+    matcher = matcher_for(PATTERNS)
+    assert matcher.matches("Tap On Button OK") == ["Tap ${target}", "Tap On ${target}", "Tap On Button ${label}"]
+    assert matcher.matches("Tap On Button OK Twice") == PATTERNS[:4]
+    assert matcher.matches("Tap Home") == ["Tap ${target}"]
+    assert matcher.matches("Type x Into y") == ["Type ${text} Into ${field}"]
+    assert matcher.matches("Tapping") == []
+
+
+def test_matches_agree_with_trying_every_pattern():
+    """The trie only narrows the candidates: results equal a linear scan with RF's patterns."""
+    matcher = matcher_for(PATTERNS)
+    patterns = [(pattern, EmbeddedArguments.from_name(pattern)) for pattern in PATTERNS]
+    names = ["TAP on button ok", "Tap\tOn Button OK", "Tap  On  Button OK", "tap_on ok",
+             "Click Element [Arguments] id=x ${2}", "Click  Element [Arguments] id=x 2",
+             "Click\tElement  [arguments] id=x 2", "Type  a b  Into c"]
+    for name in names:
+        assert matcher.matches(name) == [pattern for pattern, embedded in patterns if embedded.matches(name)], name
+
+
+def test_whitespace_runs_in_the_call_name_reach_the_patterns():
+    """A call name with a whitespace run inside the literal prefix still finds the pattern in the trie."""
+    matcher = matcher_for(["Open ${app} App"])
+    candidates = [target for _, _, target in matcher._candidates("Open  Demo App")]
+    assert candidates == ["Open ${app} App"]
+    assert [target for _, _, target in matcher._candidates("Open\t\tDemo App")] == ["Open ${app} App"]
+
+
+def test_most_specific_embedded_match_wins(tmp_path):
+    """Among several matching patterns the call resolves to the most specific one, like RF."""
+    keywords = "".join(f"{pattern}\n    Log    {pattern}\n\n" for pattern in PATTERNS[:4])
+    (tmp_path / "TapPo.robot").write_text(f"""*** Keywords ***
+{keywords}Use
+    Tap On Button OK
+    Tap On Button OK Twice
+    Tap On Menu
+    Tap Home
+""")
+    parser = RFNativeParser(tmp_path, use_cache=False, quiet=True)
+    graph = KeywordCallGraph(parser.parse_directory(tmp_path))
+    assert graph.resolve("Tap On Button OK", str(tmp_path / "TapPo.robot")) == "TapPo.Tap On Button ${label}"
+    assert graph.callees_of("TapPo.Use") == {
+        "TapPo.Tap On Button ${label}", "TapPo.Tap On Button ${label} Twice", "TapPo.Tap On ${target}",
+        "TapPo.Tap ${target}"}
@@ -0,0 +1,58 @@
+"""
+Tests of incremental regeneration (rf_auto_generator/incremental.py) through
+generate_production_wrappers.py --incremental in a small project.
+"""
+import json
+import re
+
+import pytest
+
+import generate_production_wrappers
+from rf_auto_generator.incremental import MANIFEST_NAME
+
+CONFIG = """*** Variables ***
+${PLATFORM_NAME}            ${ANDROID_PLATFORM_NAME}
+${ANDROID_PLATFORM_NAME}    android
+${IOS_PLATFORM_NAME}        ios
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project with one page object using a constant and one that does not."""
+    for directory in ("configs", "constants", "test-cases", "object-repository/locators",
+                      "object-repository/page-objects"):
+        (tmp_path / directory).mkdir(parents=True)
+    (tmp_path / "configs" / "Configs.robot").write_text(CONFIG)
+    (tmp_path / "constants" / "TextConstants.robot").write_text("*** Variables ***\n${GREETING}    hello\n")
+    (tmp_path / "object-repository/page-objects/GreetingPo.robot").write_text(
+        "*** Keywords ***\nGreet\n    Log    ${GREETING}\n")
+    (tmp_path / "object-repository/page-objects/PlainPo.robot").write_text(
+        "*** Keywords ***\nPlain\n    Log    plain\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def regenerated(capsys):
+    """Run an incremental generation; returns how many modules it regenerated."""
+    generate_production_wrappers.main(["-q", "--no-cache", "--incremental"])
+    return int(re.search(r"regenerating (\d+)", capsys.readouterr().out).group(1))
+
+
+def test_constant_change_regenerates_modules_using_rf_variables(project, capsys):
+    """Editing a constants/ file makes modules importing rf_variables stale, and only those."""
+    assert regenerated(capsys) == 2
+    assert regenerated(capsys) == 0
+
+    output_dir = project / generate_production_wrappers.OUTPUT_DIR
+    manifest = json.loads((output_dir / MANIFEST_NAME).read_text())["sources"]
+    greeting = manifest[str(project / "object-repository/page-objects/GreetingPo.robot")]
+    plain = manifest[str(project / "object-repository/page-objects/PlainPo.robot")]
+    assert "rf_variables.GREETING" in (output_dir / "greeting_keywords.py").read_text()
+    assert sorted(greeting["variables"]) == [str(project / "configs/Configs.robot"),
+                                             str(project / "constants/TextConstants.robot")]
+    assert "variables" not in plain
+
+    (project / "constants" / "TextConstants.robot").write_text("*** Variables ***\n${GREETING}    hi\n")
+    assert regenerated(capsys) == 1
+    assert regenerated(capsys) == 0
@@ -0,0 +1,259 @@
+"""
+Tests of the keyword body compiler (rf_auto_generator/keyword_compiler.py).
+
+Each test writes a small page-object resource, generates its package like
+generate_production_wrappers.py does, imports the module and runs the
+compiled keywords against a recording bridge. No device or Appium server
+is needed.
+"""
+import importlib
+import re
+import sys
+
+import pytest
+
+from pytest_rf_bridge.rf_keyword_bridge import RobotKeywordBridge
+from rf_auto_generator.rf_native_parser import RFNativeParser
+from rf_auto_generator.smart_code_generator import SmartCodeGenerator
+from rf_auto_generator.variable_resolver import VariableResolver
+
+CONFIG = """*** Variables ***
+${PLATFORM_NAME}            ${ANDROID_PLATFORM_NAME}
+${ANDROID_PLATFORM_NAME}    android
+${IOS_PLATFORM_NAME}        ios
+${RETRY_DELAY}              0 s
+"""
+
+
+class RecordingLibrary:
+    """Library whose keywords record their calls and return configured results."""
+
+    def __init__(self, bridge, name):
+        self._bridge = bridge
+        self._name = name
+
+    def __getattr__(self, method):
+        def keyword(*args, **kwargs):
+            self._bridge.calls.append((self._name, method, args, kwargs))
+            result = self._bridge.results.get(method)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return keyword
+
+
+class RecordingBridge:
+    """Bridge with the runtime helpers of RobotKeywordBridge and recording libraries."""
+
+    wait_until_keyword_succeeds = RobotKeywordBridge.wait_until_keyword_succeeds
+    run_keyword_and_ignore_error = RobotKeywordBridge.run_keyword_and_ignore_error
+    run_keyword_and_return_status = RobotKeywordBridge.run_keyword_and_return_status
+    error_matches = RobotKeywordBridge.error_matches
+
+    def __init__(self, **results):
+        self.calls = []
+        self.results = results
+        self.appium = RecordingLibrary(self, 'AppiumLibrary')
+
+    def library(self, name):
+        return RecordingLibrary(self, name)
+
+
+@pytest.fixture
+def compile_keywords(tmp_path):
+    """Generate a module from keyword table text; returns (keyword class, module source)."""
+    def generate(keywords, settings="Library    AppiumLibrary\n"):
+        (tmp_path / "configs").mkdir()
+        (tmp_path / "configs" / "Configs.robot").write_text(CONFIG)
+        (tmp_path / "page-objects").mkdir()
+        (tmp_path / "page-objects" / "SnippetPo.robot").write_text(
+            f"*** Settings ***\n{settings}\n*** Keywords ***\n{keywords}")
+
+        parser = RFNativeParser(tmp_path, use_cache=False, quiet=True)
+        parsed_files = parser.parse_directory(tmp_path / "page-objects")
+        parser.analyze_keyword_dependencies(parsed_files)
+        package = re.sub(r'\W', '_', f"generated_{tmp_path.name}")
+        generator = SmartCodeGenerator(tmp_path / package, quiet=True, stubs=False)
+        generator.generate_variables_module(VariableResolver(parser, tmp_path))
+        generator.enable_compiler(parser.call_graph, parsed_files)
+        generator.generate_all(parsed_files)
+        generator.generate_package_init(pf.filename for pf in parsed_files)
+
+        sys.path.insert(0, str(tmp_path))
+        try:
+            module = importlib.import_module(f"{package}.snippet_keywords")
+        finally:
+            sys.path.remove(str(tmp_path))
+        return module.SnippetKeywords, (tmp_path / package / "snippet_keywords.py").read_text()
+    return generate
+
+
+def test_library_calls_with_named_and_typed_arguments(compile_keywords):
+    """Library keywords call the library; int parameters get int literals, named arguments stay named."""
+    keywords, _ = compile_keywords("""Use Libraries
+    Flick    10    20
+    Should Be Equal    a    b    ignore_case=True
+    AppiumLibrary.Click Element    id=foo
+""")
+    bridge = RecordingBridge()
+    keywords(bridge).use_libraries()
+    assert bridge.calls == [
+        ('AppiumLibrary', 'flick', (10, 20), {}),
+        ('BuiltIn', 'should_be_equal', ('a', 'b'), {'ignore_case': 'True'}),
+        ('AppiumLibrary', 'click_element', ('id=foo',), {}),
+    ]
+
+
+def test_user_keyword_calls_with_embedded_arguments(compile_keywords):
+    """Embedded-argument call sites call the matching method with the embedded values."""
+    keywords, _ = compile_keywords("""Tap Twice
+    Tap On [Arguments] id=login ${2}
+
+Tap On [Arguments] ${locator} ${times}
+    Tap    ${locator}    count=${times}
+""")
+    bridge = RecordingBridge()
+    keywords(bridge).tap_twice()
+    assert bridge.calls == [('AppiumLibrary', 'tap', ('id=login',), {'count': 2})]
+
+
+def test_if_else_if_else(compile_keywords):
+    """IF branches compare quoted arguments as strings."""
+    keywords, _ = compile_keywords("""Choose [Arguments] ${value}
+    IF    '${value}' == 'a'
+        Log    first
+    ELSE IF    '${value}' == 'b'
+        Log    second
+    ELSE
+        Log    other
+    END
+""")
+    for value, expected in (('a', 'first'), ('b', 'second'), ('c', 'other')):
+        bridge = RecordingBridge()
+        keywords(bridge).choose(value)
+        assert bridge.calls == [('BuiltIn', 'log', (expected,), {})]
+
+
+def test_for_loops_and_var(compile_keywords):
+    """FOR IN RANGE, FOR IN and VAR become Python loops and assignments."""
+    keywords, _ = compile_keywords("""Loop
+    VAR    ${prefix}    item
+    FOR    ${index}    IN RANGE    2
+        Log    ${prefix}-${index}
+    END
+    FOR    ${name}    IN    x    y
+        Log    ${name}
+    END
+""")
+    bridge = RecordingBridge()
+    keywords(bridge).loop()
+    assert [call[2] for call in bridge.calls] == [('item-0',), ('item-1',), ('x',), ('y',)]
+
+
+def test_try_except_else_finally(compile_keywords):
+    """TRY/EXCEPT matches error messages like RF and keeps the message in AS."""
+    keywords, _ = compile_keywords("""Guarded
+    TRY
+        Click Element    id=missing
+    EXCEPT    Element*not found    type=GLOB    AS    ${error}
+        Log    ${error}
+    ELSE
+        Log    clicked
+    FINALLY
+        Log    done
+    END
+""")
+    bridge = RecordingBridge(click_element=AssertionError("Element 'id=missing' not found"))
+    keywords(bridge).guarded()
+    assert [call[1:3] for call in bridge.calls[1:]] == [
+        ('log', ("Element 'id=missing' not found",)), ('log', ('done',))]
+
+    bridge = RecordingBridge(click_element=AssertionError("Other failure"))
+    with pytest.raises(AssertionError, match="Other failure"):
+        keywords(bridge).guarded()
+    assert bridge.calls[-1][1:3] == ('log', ('done',))
+
+
+def test_while_loop_limit_fails_like_rf(compile_keywords):
+    """A WHILE that does not finish within its limit fails instead of running forever."""
+    keywords, _ = compile_keywords("""Spin
+    WHILE    True    limit=3
+        Swipe    1    2    3    4
+    END
+
+Spin With Message
+    WHILE    True    limit=2 times    on_limit_message=Still spinning
+        Swipe    1    2    3    4
+    END
+""")
+    bridge = RecordingBridge()
+    with pytest.raises(RuntimeError, match="did not finish within the limit of 3 iterations"):
+        keywords(bridge).spin()
+    assert len(bridge.calls) == 3
+
+    with pytest.raises(RuntimeError, match="^Still spinning$"):
+        keywords(RecordingBridge()).spin_with_message()
+
+
+def test_while_loop_on_limit_pass_and_default_limit(compile_keywords):
+    """on_limit=PASS ends the loop quietly; without limit RF's 10 000 iterations apply."""
+    keywords, source = compile_keywords("""Spin Quietly
+    WHILE    True    limit=2    on_limit=PASS
+        Swipe    1    2    3    4
+    END
+
+Count Down [Arguments] ${n}
+    VAR    ${left}    ${n}
+    WHILE    $left > 0
+        ${left}=    Evaluate    $left - 1
+    END
+    RETURN    ${left}
+""")
+    bridge = RecordingBridge()
+    keywords(bridge).spin_quietly()
+    assert len(bridge.calls) == 2
+    assert keywords(bridge).count_down(3) == 0
+    assert "for _ in range(10000):" in source
+
+
+def test_run_keyword_if_and_unless(compile_keywords):
+    """Run Keyword If/ELSE IF/ELSE and Run Keyword Unless become if statements."""
+    keywords, _ = compile_keywords("""Branch [Arguments] ${value}
+    Run Keyword If    '${value}' == 'a'    Log    if    ELSE IF    '${value}' == 'b'    Log    elif    ELSE    Log    else
+    Run Keyword Unless    '${value}' == 'a'    Log    unless
+""")
+    for value, expected in (('a', ['if']), ('b', ['elif', 'unless']), ('c', ['else', 'unless'])):
+        bridge = RecordingBridge()
+        keywords(bridge).branch(value)
+        assert [call[2][0] for call in bridge.calls] == expected
+
+
+def test_unquoted_variable_in_condition_is_not_compiled(compile_keywords):
+    """RF evaluates an unquoted ${flag} as text ('False' is false); such keywords keep their old body."""
+    _, source = compile_keywords("""Maybe Log [Arguments] ${flag}
+    Run Keyword Unless    ${flag}    Log    hi
+""")
+    assert "# Not compiled: unquoted variable in condition" in source
+
+
+def test_strings_with_environment_variables(compile_keywords, monkeypatch):
+    """%{ENV=default} inside a longer value compiles to valid Python (no quotes inside an f-string)."""
+    keywords, _ = compile_keywords("""App Path [Arguments] ${name}
+    ${path}=    Set Variable    %{RF_COMPILER_TEST_HOME=/tmp}/apps/${name}${SPACE}x
+    RETURN    ${path}
+""")
+    monkeypatch.delenv("RF_COMPILER_TEST_HOME", raising=False)
+    assert keywords(RecordingBridge()).app_path('demo') == '/tmp/apps/demo x'
+    monkeypatch.setenv("RF_COMPILER_TEST_HOME", "/home/me")
+    assert keywords(RecordingBridge()).app_path('demo') == '/home/me/apps/demo x'
+
+
+def test_wait_until_keyword_succeeds_retries(compile_keywords):
+    """Wait Until Keyword Succeeds retries the compiled call through the bridge helper."""
+    keywords, _ = compile_keywords("""Click When Ready [Arguments] ${locator}
+    Wait Until Keyword Succeeds    2x    ${RETRY_DELAY}    Click Element    ${locator}
+""")
+    bridge = RecordingBridge(click_element=AssertionError("not yet"))
+    with pytest.raises(AssertionError, match="not yet"):
+        keywords(bridge).click_when_ready('id=ok')
+    assert len(bridge.calls) == 2
@@ -0,0 +1,45 @@
+"""
+Tests of library keyword specs (rf_auto_generator/library_specs.py) and the
+generator's non-compiled fallback that classifies keywords with them.
+"""
+import pytest
+
+from rf_auto_generator.library_specs import LibrarySpecs, needs_context
+from rf_auto_generator.rf_native_parser import ParsedKeyword
+from rf_auto_generator.smart_code_generator import SmartCodeGenerator
+
+
+@pytest.fixture(scope="module")
+def specs(tmp_path_factory):
+    return LibrarySpecs(cache_dir=str(tmp_path_factory.mktemp("libdoc")))
+
+
+def test_context_comes_from_the_explicit_keyword_list():
+    """Only BuiltIn keywords off CONTEXT_FREE_KEYWORDS need RF's execution context."""
+    assert needs_context("BuiltIn", "Set Test Variable")
+    assert needs_context("BuiltIn", "Should Be True")
+    assert needs_context("BuiltIn", "Run Keyword If")
+    assert not needs_context("BuiltIn", "Should Be Equal")
+    assert not needs_context("BuiltIn", "should_be_equal")
+    assert not needs_context("AppiumLibrary", "Get Contexts")
+    assert not needs_context("AppiumLibrary", "Switch To Context")
+
+
+def test_built_specs_carry_the_context_flag(specs):
+    """Specs built through libdoc mark keywords with needs_context()."""
+    assert specs.keyword("BuiltIn", "Set Test Variable").needs_context
+    assert not specs.keyword("BuiltIn", "Log").needs_context
+    assert not specs.keyword("String", "Generate Random String").needs_context
+
+
+def test_fallback_detects_library_calls_from_the_spec(tmp_path, specs):
+    """Without the compiler, keywords directly calling AppiumLibrary keywords are library calls."""
+    generator = SmartCodeGenerator(tmp_path / "out", quiet=True, specs=specs)
+    direct = ParsedKeyword("Tap Login", body=("Click Element",))
+    qualified = ParsedKeyword("Type Name", body=("AppiumLibrary.Input Text",))
+    lookalike = ParsedKeyword("Open Login", body=("Click Element [Arguments] ${loginButton} ${SMALL_RETRY_COUNT}",))
+    builtin = ParsedKeyword("Note", body=("Log",))
+    assert generator.infer_keyword_type(direct) == "library_call"
+    assert generator.infer_keyword_type(qualified) == "library_call"
+    assert generator.infer_keyword_type(lookalike) == "action"
+    assert generator.infer_keyword_type(builtin) == "action"
@@ -0,0 +1,79 @@
+"""
+Tests of pre-parsed locators (pytest_rf_bridge/locators.py): a generated
+Locator constant must reach the driver exactly as AppiumLibrary's own
+ElementFinder would send the plain RF locator string.
+"""
+from collections import namedtuple
+
+import pytest
+from AppiumLibrary import AppiumLibrary
+from AppiumLibrary.locators import ElementFinder
+from appium.webdriver.common.appiumby import AppiumBy
+
+from pytest_rf_bridge.locators import FastElementFinder, Locator
+from pytest_rf_bridge.rf_keyword_bridge import RobotKeywordBridge
+from rf_auto_generator.smart_code_generator import parse_locator
+
+
+Element = namedtuple("Element", "by value tag_name")
+
+
+class StubDriver:
+    """Records find_elements calls; returns one fake element per call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def find_elements(self, by, value):
+        self.calls.append((by, value))
+        return [Element(by, value, "button")]
+
+
+def generated(locator):
+    """The Locator constant the generator emits for an RF locator string."""
+    by, criteria = parse_locator(locator)
+    return Locator(locator, getattr(AppiumBy, by), criteria)
+
+
+def find_through(finder, locator):
+    """(driver calls, found elements) for an AppiumLibrary lookup going through finder."""
+    library = AppiumLibrary()
+    library._element_finder = finder
+    driver = StubDriver()
+    library._current_application = lambda: driver
+    return driver.calls, library._element_find(locator, False, True)
+
+
+@pytest.mark.parametrize("locator", [
+    "id=com.example:id/login",
+    "ID = login",
+    "xpath=//android.widget.Button[@text='Log in']",
+    "accessibility_id=button-login",
+    "login",
+    "//android.widget.Button",
+    "name=Log in",
+    "class=android.widget.EditText",
+    "android=new UiSelector().text(\"Log in\")",
+])
+def test_locator_constants_make_the_same_driver_calls(locator):
+    """The fast path sends the strategy and criteria the stock ElementFinder parses out of the string."""
+    expected = find_through(ElementFinder(), locator)
+    assert find_through(FastElementFinder(), generated(locator)) == expected
+    assert find_through(FastElementFinder(), locator) == expected
+    assert len(expected[0]) == 1
+
+
+def test_tag_constrained_lookups_use_the_stock_finder():
+    """With a tag the Locator is parsed like any string, so constraints still apply."""
+    for tag, found in (("button", 1), ("link", 0)):
+        stock, fast = StubDriver(), StubDriver()
+        expected = list(ElementFinder().find(stock, "id=login", tag))
+        assert list(FastElementFinder().find(fast, generated("id=login"), tag)) == expected
+        assert fast.calls == stock.calls == [(AppiumBy.ID, "login")]
+        assert len(expected) == found
+
+
+def test_bridge_installs_the_fast_finder():
+    """AppiumLibrary looks elements up through _element_finder; the bridge replaces it."""
+    assert isinstance(AppiumLibrary()._element_finder, ElementFinder)
+    assert isinstance(RobotKeywordBridge().appium._element_finder, FastElementFinder)
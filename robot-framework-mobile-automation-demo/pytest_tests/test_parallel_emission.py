@@ -0,0 +1,49 @@
+"""
+Tests that parallel module emission (SmartCodeGenerator._emit_parallel)
+writes exactly what the serial path writes.
+"""
+import multiprocessing
+
+import pytest
+
+from benchmarks.synthetic_corpus import write_corpus
+from rf_auto_generator.rf_native_parser import RFNativeParser
+from rf_auto_generator.smart_code_generator import SmartCodeGenerator
+
+
+def generate(project, output_dir, jobs):
+    """Parse the corpus and generate it with compiled bodies and shards; returns the generator."""
+    parser = RFNativeParser(project, use_cache=False, quiet=True)
+    parsed_files = parser.parse_directory(project / "page-objects")
+    parser.analyze_keyword_dependencies(parsed_files)
+    generator = SmartCodeGenerator(output_dir, quiet=True, shard_size=10)
+    generator.enable_compiler(parser.call_graph, parsed_files)
+    generator.generate_all(parsed_files, jobs=jobs)
+    return generator
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="emission needs fork")
+def test_parallel_emission_matches_serial_output(tmp_path, monkeypatch):
+    """Modules, shards and stubs from jobs=3 are byte-identical to jobs=1, with the same stats order."""
+    write_corpus(tmp_path / "page-objects", 300, embedded_ratio=0.8, fan_in=2)
+    serial = generate(tmp_path, tmp_path / "serial", jobs=1)
+
+    calls = []
+    emit_parallel = SmartCodeGenerator._emit_parallel
+
+    def spy(self, parsed_files, locators_map, symbol_tables, jobs):
+        calls.append(jobs)
+        return emit_parallel(self, parsed_files, locators_map, symbol_tables, jobs)
+    monkeypatch.setattr(SmartCodeGenerator, "_emit_parallel", spy)
+    parallel = generate(tmp_path, tmp_path / "parallel", jobs=3)
+    assert calls == [3]
+
+    serial_files = sorted(path.relative_to(tmp_path / "serial") for path in (tmp_path / "serial").rglob("*.py*"))
+    parallel_files = sorted(path.relative_to(tmp_path / "parallel")
+                            for path in (tmp_path / "parallel").rglob("*.py*"))
+    assert serial_files == parallel_files
+    assert any("_shard" in path.name for path in serial_files)
+    for path in serial_files:
+        assert (tmp_path / "parallel" / path).read_bytes() == (tmp_path / "serial" / path).read_bytes(), path
+    assert [stats["keywords"] for stats in parallel.file_stats.values()] == \
+        [stats["keywords"] for stats in serial.file_stats.values()]
@@ -0,0 +1,65 @@
+"""
+Tests of the on-disk parse cache (rf_auto_generator/parse_cache.py) as used
+by RFNativeParser.parse_robot_file.
+"""
+import pytest
+
+from rf_auto_generator import parse_cache
+from rf_auto_generator.rf_native_parser import RFNativeParser
+
+
+@pytest.fixture
+def resource(tmp_path):
+    path = tmp_path / "CommonPo.robot"
+    path.write_text("*** Keywords ***\nFirst Keyword\n    Log    one\n")
+    return path
+
+
+def parse(tmp_path, path):
+    """Parse with a fresh parser (as a new run would); returns (parsed, cache)."""
+    parser = RFNativeParser(tmp_path, cache_dir=str(tmp_path / "cache"), quiet=True)
+    return parser.parse_robot_file(path), parser.cache
+
+
+def test_unchanged_file_hits(tmp_path, resource):
+    """A second run reads the stored result instead of reparsing."""
+    _, cache = parse(tmp_path, resource)
+    assert (cache.hits, cache.misses) == (0, 1)
+    parsed, cache = parse(tmp_path, resource)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert [kw.name for kw in parsed.keywords] == ["First Keyword"]
+
+
+def test_content_change_misses(tmp_path, resource):
+    """Changed content gets a new key, so the new keywords are parsed."""
+    parse(tmp_path, resource)
+    resource.write_text("*** Keywords ***\nSecond Keyword\n    Log    two\n")
+    parsed, cache = parse(tmp_path, resource)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert [kw.name for kw in parsed.keywords] == ["Second Keyword"]
+
+
+def test_format_version_bump_misses(tmp_path, resource, monkeypatch):
+    """Entries written with another CACHE_FORMAT_VERSION are never loaded."""
+    parse(tmp_path, resource)
+    monkeypatch.setattr(parse_cache, "CACHE_FORMAT_VERSION", parse_cache.CACHE_FORMAT_VERSION + 1)
+    _, cache = parse(tmp_path, resource)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: data[:len(data) // 2],
+    lambda data: b"not a pickle",
+    lambda data: b"",
+], ids=["truncated", "garbage", "empty"])
+def test_corrupt_entry_is_reparsed(tmp_path, resource, damage):
+    """A damaged entry counts as a miss: the file is reparsed and the entry rewritten."""
+    parse(tmp_path, resource)
+    [entry] = (tmp_path / "cache").rglob("*.pickle")
+    entry.write_bytes(damage(entry.read_bytes()))
+
+    parsed, cache = parse(tmp_path, resource)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert [kw.name for kw in parsed.keywords] == ["First Keyword"]
+    _, cache = parse(tmp_path, resource)
+    assert (cache.hits, cache.misses) == (1, 0)
@@ -0,0 +1,91 @@
+"""
+Tests of reachability-based pruning (rf_auto_generator/reachability.py)
+through generate_production_wrappers.py --tests/--include-tag/--exclude-tag.
+"""
+import json
+
+import pytest
+
+import generate_production_wrappers
+
+CONFIG = """*** Variables ***
+${PLATFORM_NAME}            ${ANDROID_PLATFORM_NAME}
+${ANDROID_PLATFORM_NAME}    android
+${IOS_PLATFORM_NAME}        ios
+"""
+
+PAGE_OBJECT = """*** Keywords ***
+Login As Admin
+    Enter Credentials
+
+Enter Credentials
+    Type Into Field
+
+Type Into Field
+    Log    typing
+
+Open Settings
+    Log    settings
+
+Unused Keyword
+    Log    never called
+"""
+
+TESTS = """*** Settings ***
+Resource    ../object-repository/page-objects/AppPo.robot
+
+*** Test Cases ***
+Admin Login
+    [Tags]    smoke    login
+    Login As Admin
+
+Settings Screen
+    [Tags]    settings    slow
+    Open Settings
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    for directory in ("configs", "test-cases", "object-repository/locators", "object-repository/page-objects"):
+        (tmp_path / directory).mkdir(parents=True)
+    (tmp_path / "configs" / "Configs.robot").write_text(CONFIG)
+    (tmp_path / "object-repository/page-objects/AppPo.robot").write_text(PAGE_OBJECT)
+    (tmp_path / "test-cases" / "AppTests.robot").write_text(TESTS)
+    (tmp_path / "test-cases" / "OtherTests.robot").write_text(
+        TESTS.replace("Admin Login", "Other Login").replace("Settings Screen", "Other Settings")
+             .replace("    Open Settings\n", "    Log    nothing\n"))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def kept_keywords(project, *options):
+    """Generate with pruning options; returns the kept keyword names from the prune report."""
+    report = project / "prune.json"
+    generate_production_wrappers.main(["-q", "--no-cache", "--prune-report", str(report), *options])
+    pruned = json.loads(report.read_text())["pruned"]
+    names = ["Login As Admin", "Enter Credentials", "Type Into Field", "Open Settings", "Unused Keyword"]
+    pruned_names = {name for names in pruned.values() for name in names}
+    return [name for name in names if name not in pruned_names]
+
+
+def test_excluded_tests_do_not_keep_their_keywords(project):
+    """A keyword only reachable from an excluded test is pruned; transitive callees of kept tests stay."""
+    assert kept_keywords(project, "--exclude-tag", "slow") == ["Login As Admin", "Enter Credentials", "Type Into Field"]
+    module = (project / generate_production_wrappers.OUTPUT_DIR / "app_keywords.py").read_text()
+    assert "def type_into_field(" in module
+    assert "def open_settings(" not in module
+
+
+def test_include_tag_patterns(project):
+    """--include-tag takes RF tag patterns; --exclude-tag wins over --include-tag."""
+    assert kept_keywords(project, "--include-tag", "set*") == ["Open Settings"]
+    assert kept_keywords(project, "--include-tag", "smokeORsettings", "--exclude-tag", "login") == ["Open Settings"]
+
+
+def test_tests_option_selects_test_files(project):
+    """--tests only takes the tests of the given files."""
+    assert kept_keywords(project, "--tests", "test-cases/OtherTests.robot") == [
+        "Login As Admin", "Enter Credentials", "Type Into Field"]
+    assert kept_keywords(project, "--tests", "test-cases") == [
+        "Login As Admin", "Enter Credentials", "Type Into Field", "Open Settings"]
@@ -0,0 +1,92 @@
+"""
+Tests of Resource import resolution and symbol tables
+(rf_auto_generator/resource_resolver.py).
+"""
+from pathlib import Path
+
+import pytest
+
+from rf_auto_generator.resource_resolver import ResourceResolver
+from rf_auto_generator.rf_native_parser import RFNativeParser
+
+
+def resource(imports=(), keywords="", variables=""):
+    settings = "".join(f"Resource    {name}\n" for name in imports)
+    return (f"*** Settings ***\n{settings}\n*** Variables ***\n{variables}\n"
+            f"*** Keywords ***\n{keywords}")
+
+
+@pytest.fixture
+def diamond(tmp_path):
+    """TopPo imports LeftPo then RightPo; both import BasePo. LeftPo and RightPo define the same keyword."""
+    files = {
+        "TopPo.robot": resource(["LeftPo.robot", "RightPo.robot"], "Own Keyword\n    Log    top\n"),
+        "LeftPo.robot": resource(["BasePo.robot"], "Shared Keyword\n    Log    left\n",
+                                 "${SHARED}    left\n"),
+        "RightPo.robot": resource(["BasePo.robot"],
+                                  "Shared Keyword\n    Log    right\n\nOwn Keyword\n    Log    right\n",
+                                  "${SHARED}    right\n${RIGHT_ONLY}    right\n"),
+        "BasePo.robot": resource([], "Base Keyword\n    Log    base\n\nShared Keyword\n    Log    base\n"),
+    }
+    for name, text in files.items():
+        (tmp_path / name).write_text(text)
+    return tmp_path
+
+
+def counting_parser(root):
+    """Parser that counts how often each file is parsed."""
+    parser = RFNativeParser(root, use_cache=False, quiet=True)
+    parser.parsed_counts = {}
+    parse = parser.parse_robot_file
+
+    def parse_robot_file(path):
+        parser.parsed_counts[Path(path).name] = parser.parsed_counts.get(Path(path).name, 0) + 1
+        return parse(path)
+    parser.parse_robot_file = parse_robot_file
+    return parser
+
+
+def test_diamond_import_is_resolved_once_in_dependency_order(diamond):
+    """A resource imported along two paths is parsed and listed once, imports before importers."""
+    parser = counting_parser(diamond)
+    resolver = ResourceResolver(parser)
+    order = [Path(path).name for path in resolver.resolve([diamond / "TopPo.robot"])]
+    assert order == ["BasePo.robot", "LeftPo.robot", "RightPo.robot", "TopPo.robot"]
+    assert parser.parsed_counts == {"TopPo.robot": 1, "LeftPo.robot": 1, "RightPo.robot": 1, "BasePo.robot": 1}
+    assert resolver.cycles == []
+
+    visible = [Path(path).name for path in resolver.visible_files(diamond / "TopPo.robot")]
+    assert visible == ["TopPo.robot", "LeftPo.robot", "RightPo.robot", "BasePo.robot"]
+    assert {Path(path).name for path in resolver.affected_by([diamond / "BasePo.robot"])} == {
+        "BasePo.robot", "LeftPo.robot", "RightPo.robot", "TopPo.robot"}
+
+
+def test_first_visible_definition_wins(diamond):
+    """Own definitions win, then imports in declaration order (breadth first), like RF's lookup."""
+    resolver = ResourceResolver(RFNativeParser(diamond, use_cache=False, quiet=True))
+    table = resolver.symbol_table(diamond / "TopPo.robot")
+
+    def defined_in(name):
+        return Path(table.keywords[name].source_file).name
+
+    assert defined_in("ownkeyword") == "TopPo.robot"
+    assert defined_in("sharedkeyword") == "LeftPo.robot"
+    assert defined_in("basekeyword") == "BasePo.robot"
+    assert table.variables["SHARED"] == "left"
+    assert Path(table.variable_sources["RIGHT_ONLY"]).name == "RightPo.robot"
+
+    # Seen from RightPo, its own definition wins over BasePo's
+    assert Path(resolver.symbol_table(diamond / "RightPo.robot").keywords["sharedkeyword"].source_file).name \
+        == "RightPo.robot"
+
+
+def test_import_cycles_are_recorded_not_raised(tmp_path):
+    """A cycle is reported once and every file is still resolved."""
+    (tmp_path / "APo.robot").write_text(resource(["BPo.robot"]))
+    (tmp_path / "BPo.robot").write_text(resource(["APo.robot"]))
+    resolver = ResourceResolver(RFNativeParser(tmp_path, use_cache=False, quiet=True))
+    order = [Path(path).name for path in resolver.resolve([tmp_path / "APo.robot"])]
+    assert order == ["BPo.robot", "APo.robot"]
+    assert [[Path(path).name for path in cycle] for cycle in resolver.cycles] == [
+        ["APo.robot", "BPo.robot", "APo.robot"]]
+    assert [Path(path).name for path in resolver.visible_files(tmp_path / "BPo.robot")] == ["BPo.robot", "APo.robot"]
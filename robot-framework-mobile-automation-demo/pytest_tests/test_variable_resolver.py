@@ -0,0 +1,72 @@
+"""
+Tests of config/constant variable resolution (rf_auto_generator/variable_resolver.py).
+"""
+import pytest
+
+from rf_auto_generator.rf_native_parser import RFNativeParser
+from rf_auto_generator.variable_resolver import VariableResolutionError, VariableResolver, python_expression
+
+
+@pytest.fixture
+def variables(tmp_path):
+    """Resolver over configs/Configs.robot with the given variable table lines."""
+    def resolver(*lines):
+        (tmp_path / "configs").mkdir()
+        (tmp_path / "configs" / "Configs.robot").write_text("*** Variables ***\n" + "\n".join(lines) + "\n")
+        return VariableResolver(RFNativeParser(tmp_path, use_cache=False, quiet=True), tmp_path)
+    return resolver
+
+
+def test_reference_cycle_raises(variables):
+    """A cycle between variables is reported with its path instead of recursing forever."""
+    resolver = variables("${FIRST}    ${SECOND}", "${SECOND}    x${first}", "${OTHER}    fine")
+    with pytest.raises(VariableResolutionError, match="FIRST -> SECOND -> FIRST"):
+        resolver.resolve_all()
+
+
+def test_nested_variable_names(variables):
+    """${${PLATFORM}_APP} resolves the inner name first, for every platform."""
+    resolver = variables("${PLATFORM_NAME}    ${ANDROID_PLATFORM_NAME}",
+                         "${ANDROID_PLATFORM_NAME}    ANDROID", "${IOS_PLATFORM_NAME}    IOS",
+                         "${ANDROID_APP}    demo.apk", "${IOS_APP}    demo.ipa",
+                         "${APP}    ${${PLATFORM_NAME}_APP}")
+    assert resolver.values(environ={})["APP"] == "demo.apk"
+    assert resolver.values("ios", environ={})["APP"] == "demo.ipa"
+
+
+def test_environment_variables_with_defaults(variables):
+    """%{NAME=default} uses the environment when set; %{NAME} without default must be set."""
+    resolver = variables("${VERSION}    %{RF_TEST_VERSION=13}", "${HOST}    %{RF_TEST_HOST}")
+    value = resolver.resolve_all()["VERSION"]
+    assert python_expression(value, resolver.project_root) == "os.environ.get('RF_TEST_VERSION', '13')"
+    assert resolver.values(environ={"RF_TEST_HOST": "h"})["VERSION"] == "13"
+    assert resolver.values(environ={"RF_TEST_HOST": "h", "RF_TEST_VERSION": "14"})["VERSION"] == "14"
+    with pytest.raises(VariableResolutionError, match="RF_TEST_HOST"):
+        resolver.values(environ={})
+
+
+def test_curdir_becomes_a_path_under_the_project_root(variables, tmp_path):
+    """${CURDIR} is the defining file's directory; rendered relative to PROJECT_ROOT."""
+    resolver = variables("${ANDROID_APP}    ${CURDIR}/../apps/demo.apk")
+    resolved = resolver.resolve_all()
+    assert python_expression(resolved["ANDROID_APP"], resolver.project_root) == \
+        "os.path.join(PROJECT_ROOT, 'apps', 'demo.apk')"
+    assert resolver.values(environ={})["ANDROID_APP"] == f"{tmp_path / 'configs'}/../apps/demo.apk"
+
+
+def test_builtin_variables_including_newline(variables):
+    """${\\n}, ${SPACE}, ${EMPTY} and friends resolve to their values, in any case."""
+    resolver = variables("${LINES}    a${\\n}b", "${PADDED}    x${space}y${EMPTY}", "${FLAG}    ${TRUE}")
+    values = resolver.values(environ={})
+    assert values["LINES"] == "a\nb"
+    assert values["PADDED"] == "x y"
+    assert values["FLAG"] == "True"
+
+
+def test_backslash_escapes_are_removed_like_rf(variables):
+    """\\${x} is literal text and \\\\ one backslash; an escaped backslash does not escape the reference."""
+    resolver = variables("${NAME}    demo", "${LITERAL}    \\${NAME} costs \\\\5",
+                         "${AFTER_BACKSLASH}    C:\\\\${NAME}")
+    values = resolver.values(environ={})
+    assert values["LITERAL"] == "${NAME} costs \\5"
+    assert values["AFTER_BACKSLASH"] == "C:\\demo"
@@ -0,0 +1,50 @@
+"""
+Tests of SmartCodeGenerator.write_if_changed: unchanged files are not
+touched, changed files are replaced atomically with their mode kept.
+"""
+import os
+import stat
+
+from rf_auto_generator.smart_code_generator import SmartCodeGenerator
+
+
+def test_same_content_keeps_mtime_and_mode(tmp_path):
+    """Writing identical text twice leaves the file (mtime, mode, inode) untouched."""
+    generator = SmartCodeGenerator(tmp_path / "out", quiet=True)
+    path = tmp_path / "out" / "module.py"
+    assert generator.write_if_changed(path, "VALUE = 1\n")
+    os.chmod(path, 0o640)
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    before = path.stat()
+
+    assert not generator.write_if_changed(path, "VALUE = 1\n")
+    after = path.stat()
+    assert after.st_mtime_ns == before.st_mtime_ns == 1_000_000_000
+    assert after.st_mode == before.st_mode
+    assert after.st_ino == before.st_ino
+    assert generator.write_counts == {"written": 1, "skipped": 1}
+
+
+def test_changed_content_is_replaced_with_the_same_mode(tmp_path):
+    """New content replaces the file through a rename, keeping its permission bits."""
+    generator = SmartCodeGenerator(tmp_path / "out", quiet=True)
+    path = tmp_path / "out" / "module.py"
+    generator.write_if_changed(path, "VALUE = 1\n")
+    os.chmod(path, 0o640)
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    assert generator.write_if_changed(path, "VALUE = 2\n")
+    assert path.read_text() == "VALUE = 2\n"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    assert path.stat().st_mtime_ns != 1_000_000_000
+    assert sorted(p.name for p in path.parent.iterdir()) == ["module.py"]
+
+
+def test_new_file_gets_the_umask_mode(tmp_path):
+    """A new file is created with the mode open() would give it, not mkstemp's 0600."""
+    umask = os.umask(0o022)
+    os.umask(umask)
+    generator = SmartCodeGenerator(tmp_path / "out", quiet=True)
+    path = tmp_path / "out" / "module.py"
+    generator.write_if_changed(path, "VALUE = 1\n")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
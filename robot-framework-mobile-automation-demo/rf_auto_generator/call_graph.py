@@ -0,0 +1,242 @@
+"""
+Keyword call graph built from parsed keyword bodies.
+
+Call sites are resolved the way RF resolves them: through an index of
+normalized keyword names (case, space and underscore insensitive), then
+through an EmbeddedMatcher over embedded-argument patterns such as
+"Click Element [Arguments] ${locator} ${retryScale}", where the most
+specific of several matching patterns wins. Keywords passed to
+BuiltIn run-keyword variants (Run Keyword If, Wait Until Keyword Succeeds,
+...) count as calls too.
+"""
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from robot.running.arguments.embedded import EmbeddedArguments
+from robot.utils import normalize
+
+from rf_auto_generator.embedded_matcher import EmbeddedMatcher
+from rf_auto_generator.rf_native_parser import ParsedKeyword, ParsedResource, ParsedStep
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a keyword name like RF does (ignore case, spaces, underscores)."""
+    return normalize(name, ignore='_')
+
+
+# BuiltIn keywords that take another keyword as an argument, mapped to the
+# index of that argument
+RUN_KEYWORD_VARIANTS = {normalize_name(name): index for name, index in {
+    'Run Keyword': 0,
+    'Run Keyword If': 1,
+    'Run Keyword Unless': 1,
+    'Run Keyword And Return': 0,
+    'Run Keyword And Return If': 1,
+    'Run Keyword And Return Status': 0,
+    'Run Keyword And Ignore Error': 0,
+    'Run Keyword And Continue On Failure': 0,
+    'Run Keyword And Warn On Failure': 0,
+    'Run Keyword And Expect Error': 1,
+    'Run Keyword If Test Failed': 0,
+    'Run Keyword If Test Passed': 0,
+    'Run Keyword If Timeout Occurred': 0,
+    'Run Keyword If All Tests Passed': 0,
+    'Run Keyword If Any Tests Failed': 0,
+    'Wait Until Keyword Succeeds': 2,
+    'Repeat Keyword': 1,
+}.items()}
+
+_RUN_KEYWORD_IF = {normalize_name('Run Keyword If'), normalize_name('Run Keyword Unless')}
+_RUN_KEYWORDS = normalize_name('Run Keywords')
+
+
+def iter_step_calls(steps: List[ParsedStep]) -> Iterator[Tuple[str, List[str]]]:
+    """Yield (keyword name, args) for every call site in a step tree."""
+    for step in steps:
+        if step.kind == 'KEYWORD' and step.name:
+            yield from _expand_call(step.name, step.args)
+        yield from iter_step_calls(step.body)
+        if step.orelse:
+            yield from iter_step_calls([step.orelse])
+
+
+def _expand_call(name: str, args: List[str]) -> Iterator[Tuple[str, List[str]]]:
+    """Yield the call itself plus any keywords it runs through a run-keyword variant."""
+    yield name, args
+    normalized = normalize_name(name)
+
+    if normalized == _RUN_KEYWORDS:
+        if 'AND' in args:
+            group: List[str] = []
+            for arg in list(args) + ['AND']:
+                if arg == 'AND':
+                    if group:
+                        yield from _expand_call(group[0], group[1:])
+                    group = []
+                else:
+                    group.append(arg)
+        else:
+            for arg in args:
+                yield from _expand_call(arg, [])
+        return
+
+    index = RUN_KEYWORD_VARIANTS.get(normalized)
+    if index is None or len(args) <= index:
+        return
+
+    if normalized not in _RUN_KEYWORD_IF:
+        yield from _expand_call(args[index], args[index + 1:])
+        return
+
+    # Run Keyword If  cond  KW  args  ELSE IF  cond  KW  args  ELSE  KW  args
+    rest = args[index:]
+    while rest:
+        markers = [i for i, arg in enumerate(rest) if arg in ('ELSE IF', 'ELSE')]
+        end = markers[0] if markers else len(rest)
+        yield from _expand_call(rest[0], rest[1:end])
+        if not markers:
+            break
+        marker = rest[end]
+        rest = rest[end + 2:] if marker == 'ELSE IF' else rest[end + 1:]
+
+
+class KeywordCallGraph:
+    """
+    Call graph over user keywords with forward and reverse adjacency.
+
+    Keywords are identified by "<resource stem>.<keyword name>", e.g.
+    "CommonPo.Click Element". Calls that do not resolve to a user keyword
+    (library keywords, typos) are kept per caller in `unresolved`.
+
+    With symbol_tables (resolved file path -> SymbolTable from
+    ResourceResolver) a call only resolves to keywords visible in the
+    caller's file through its resource imports.
+    """
+
+    def __init__(self, parsed_files: List[ParsedResource], symbol_tables: Optional[Dict] = None):
+        self.symbol_tables = symbol_tables
+        self._source_keys: Dict[str, str] = {}
+        self._visible: Dict[str, Optional[Set[str]]] = {}
+        self.keywords: Dict[str, ParsedKeyword] = {}
+        self.calls: Dict[str, Set[str]] = {}
+        self.callers: Dict[str, Set[str]] = {}
+        self.unresolved: Dict[str, Set[str]] = {}
+
+        self._exact: Dict[str, List[str]] = {}
+        self._embedded: EmbeddedMatcher[str] = EmbeddedMatcher()
+        self._embedded_by_id: Dict[str, EmbeddedArguments] = {}
+        self._reach: Dict[str, Set[str]] = {}
+        self._resolved: Dict[Tuple[str, str], Optional[str]] = {}
+
+        for pf in parsed_files:
+            for kw in pf.keywords:
+                self._add_keyword(kw)
+
+        for kw_id, kw in self.keywords.items():
+            for name, _ in iter_step_calls(kw.steps):
+                target = self.resolve(name, kw.source_file)
+                if target:
+                    self.calls[kw_id].add(target)
+                    self.callers[target].add(kw_id)
+                else:
+                    self.unresolved[kw_id].add(name)
+
+    @staticmethod
+    def keyword_id(kw: ParsedKeyword) -> str:
+        """Qualified identifier of a keyword."""
+        return f"{Path(kw.source_file).stem}.{kw.name}"
+
+    def _add_keyword(self, kw: ParsedKeyword):
+        kw_id = self.keyword_id(kw)
+        self.keywords[kw_id] = kw
+        self.calls[kw_id] = set()
+        self.callers[kw_id] = set()
+        self.unresolved[kw_id] = set()
+
+        rf_name = kw.rf_name or kw.name
+        embedded = self._embedded.add(rf_name, kw_id)
+        if embedded:
+            self._embedded_by_id[kw_id] = embedded
+        else:
+            self._exact.setdefault(normalize_name(rf_name), []).append(kw_id)
+
+    def resolve(self, name: str, caller_source: str = "") -> Optional[str]:
+        """Resolve a call site to a keyword id, or None for library/unknown keywords (memoized)."""
+        key = (name, caller_source)
+        if key not in self._resolved:
+            self._resolved[key] = self._resolve(name, caller_source)
+        return self._resolved[key]
+
+    def _resolve(self, name: str, caller_source: str) -> Optional[str]:
+        candidates = self._exact.get(normalize_name(name))
+        if not candidates and '.' in name:
+            # Qualified call: "CommonPo.Click Element"
+            owner, short_name = name.split('.', 1)
+            candidates = [c for c in self._exact.get(normalize_name(short_name), [])
+                          if normalize_name(c.split('.', 1)[0]) == normalize_name(owner)]
+        if not candidates:
+            candidates = self._embedded.matches(name)
+        if candidates and self.symbol_tables is not None:
+            visible = self._visible_files(caller_source)
+            if visible is not None:
+                candidates = [c for c in candidates
+                              if self._source_key(self.keywords[c].source_file) in visible]
+        if not candidates:
+            return None
+
+        # Like RF, prefer keywords from the caller's own file, then the most
+        # specific embedded match
+        candidates = [c for c in candidates if self.keywords[c].source_file == caller_source] or candidates
+        if len(candidates) > 1 and candidates[0] in self._embedded_by_id:
+            candidates = [c for c in candidates
+                          if not any(self._is_better_match(other, c) for other in candidates if other != c)
+                          ] or candidates
+        return candidates[0]
+
+    def _is_better_match(self, kw_id: str, other: str) -> bool:
+        """Like RF: an embedded match is better if the other pattern matches its name but not vice versa."""
+        return (self._embedded_by_id[other].matches(self._rf_name(kw_id))
+                and not self._embedded_by_id[kw_id].matches(self._rf_name(other)))
+
+    def _rf_name(self, kw_id: str) -> str:
+        kw = self.keywords[kw_id]
+        return kw.rf_name or kw.name
+
+    def embedded_arguments(self, kw_id: str) -> Optional[EmbeddedArguments]:
+        """Embedded-argument pattern of a keyword (None for plain names)."""
+        return self._embedded_by_id.get(kw_id)
+
+    def _source_key(self, source_file: str) -> str:
+        """Resolved path of a source file, as used for symbol table keys."""
+        if source_file not in self._source_keys:
+            self._source_keys[source_file] = str(Path(source_file).resolve())
+        return self._source_keys[source_file]
+
+    def _visible_files(self, source_file: str) -> Optional[Set[str]]:
+        """Files whose keywords are visible from source_file (None if unknown)."""
+        if source_file not in self._visible:
+            table = self.symbol_tables.get(self._source_key(source_file))
+            self._visible[source_file] = set(table.visible_files) if table else None
+        return self._visible[source_file]
+
+    def callees_of(self, kw_id: str) -> Set[str]:
+        """Keywords called directly by kw_id."""
+        return self.calls.get(kw_id, set())
+
+    def callers_of(self, kw_id: str) -> Set[str]:
+        """Keywords that call kw_id directly."""
+        return self.callers.get(kw_id, set())
+
+    def reachable_from(self, kw_id: str) -> Set[str]:
+        """Every keyword kw_id reaches transitively (computed once, then cached)."""
+        if kw_id not in self._reach:
+            seen: Set[str] = set()
+            pending = list(self.callees_of(kw_id))
+            while pending:
+                current = pending.pop()
+                if current in seen:
+                    continue
+                seen.add(current)
+                pending.extend(self.callees_of(current))
+            self._reach[kw_id] = seen
+        return self._reach[kw_id]
@@ -0,0 +1,77 @@
+"""
+Combined matcher for embedded-argument keyword names.
+
+Every page-object keyword here is named like
+"Click Element [Arguments] ${locator} ${retryScale}", which RF treats as
+embedded arguments, so resolving a call site by trying each keyword's
+pattern in turn costs time linear in the number of keywords. The matcher
+indexes the patterns in a trie keyed by the literal text before their
+first argument ("click element [arguments] "), folded case-insensitively
+with whitespace runs as one space. A lookup walks the trie along the
+folded call name and only tries the patterns whose prefix the name starts
+with; RF's own pattern match decides whether a candidate matches.
+"""
+from typing import Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+import re
+
+from robot.running.arguments.embedded import EmbeddedArguments
+from robot.variables import VariableMatches
+
+T = TypeVar("T")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def literal_prefix(rf_name: str) -> str:
+    """Text of a keyword name before its first embedded argument, as matched by the trie."""
+    name = " ".join(rf_name.split())
+    first = next(iter(VariableMatches(name, identifiers="$")), None)
+    return _fold(first.before if first else name)
+
+
+def _fold(text: str) -> str:
+    """Case-insensitive form of text with every whitespace run as a single space."""
+    return "".join(char.lower() if len(char.lower()) == 1 else char
+                   for char in _WHITESPACE.sub(" ", text))
+
+
+class _Node:
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.entries: List[Tuple[int, EmbeddedArguments, object]] = []
+
+
+class EmbeddedMatcher(Generic[T]):
+    """Embedded-argument patterns of many keywords, each mapped to a target (e.g. a keyword id)."""
+
+    def __init__(self):
+        self._root = _Node()
+        self._count = 0
+
+    def add(self, rf_name: str, target: T) -> Optional[EmbeddedArguments]:
+        """Index the keyword name rf_name; returns its pattern, or None if it has no embedded arguments."""
+        embedded = EmbeddedArguments.from_name(rf_name)
+        if embedded:
+            node = self._root
+            for char in literal_prefix(rf_name):
+                node = node.children.setdefault(char, _Node())
+            node.entries.append((self._count, embedded, target))
+            self._count += 1
+        return embedded
+
+    def _candidates(self, name: str) -> Iterator[Tuple[int, EmbeddedArguments, T]]:
+        """Entries whose literal prefix the call name starts with."""
+        node = self._root
+        yield from node.entries
+        for char in _fold(name):
+            node = node.children.get(char)
+            if node is None:
+                return
+            yield from node.entries
+
+    def matches(self, name: str) -> List[T]:
+        """Targets of every pattern matching the call name, in the order they were added."""
+        return [target for _, embedded, target in sorted(self._candidates(name), key=lambda entry: entry[0])
+                if embedded.matches(name)]
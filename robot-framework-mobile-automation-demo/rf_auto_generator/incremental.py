@@ -0,0 +1,132 @@
+"""
+Incremental regeneration support.
+
+A manifest next to the generated modules records, for every page-object
+source, the content hash of the source and of every resource it imports
+(transitively), plus the hashes of the configs/ and constants/ files when
+the module imports rf_variables (compiled bodies use those values). A
+module only needs regenerating when one of those hashes changes, the
+output is missing, or the generator itself changed.
+"""
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import hashlib
+import json
+
+from rf_auto_generator.resource_resolver import ResourceResolver
+from rf_auto_generator.rf_native_parser import ParsedResource
+
+MANIFEST_NAME = ".generation_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's content."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+GENERATOR_MODULES = ("smart_code_generator.py", "keyword_compiler.py", "library_specs.py", "stub_generator.py")
+
+
+def generator_fingerprint() -> str:
+    """Hash of the code generator sources, so generator changes force a rebuild."""
+    digest = hashlib.sha256()
+    for name in GENERATOR_MODULES:
+        digest.update(file_hash(Path(__file__).parent / name).encode())
+    return digest.hexdigest()
+
+
+class GenerationManifest:
+    """Source hashes and resource-import edges of the last generation run."""
+
+    def __init__(self, path: str, variable_files: Iterable[str] = ()):
+        self.path = Path(path)
+        # configs/ and constants/ files behind rf_variables (VariableResolver.files)
+        self.variable_files = list(variable_files)
+        self.generator = generator_fingerprint()
+        self.sources: Dict[str, Dict] = {}
+        self._hashes: Dict[Path, str] = {}
+
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+            except ValueError:
+                data = {}
+            # A manifest from another generator version describes stale outputs
+            if data.get("version") == MANIFEST_VERSION and data.get("generator") == self.generator:
+                self.sources = data.get("sources", {})
+
+    def _hash(self, path: Path) -> str:
+        if path not in self._hashes:
+            self._hashes[path] = file_hash(path)
+        return self._hashes[path]
+
+    def forget(self, paths: List[str]):
+        """Drop memoized hashes of files that changed on disk."""
+        for path in paths:
+            self._hashes.pop(Path(path), None)
+
+    def dependency_hashes(self, parsed: ParsedResource, resolver: ResourceResolver) -> Dict[str, str]:
+        """Hashes of every resource reachable through the source's imports."""
+        source = resolver.key(parsed.filepath)
+        return {path: self._hash(Path(path)) for path in sorted(resolver.visible_files(source))
+                if path != source}
+
+    def variable_hashes(self) -> Dict[str, str]:
+        """Hashes of the files rf_variables is generated from."""
+        resolved = sorted(Path(path).resolve() for path in self.variable_files)
+        return {str(path): self._hash(path) for path in resolved}
+
+    def is_stale(self, parsed: ParsedResource, output_file: Path, resolver: ResourceResolver,
+                 variant: str = "") -> bool:
+        """
+        True if the module generated from parsed must be rewritten.
+
+        variant identifies generation settings that change the output for the
+        same inputs (e.g. the pruned keyword set); a different variant is stale.
+        """
+        source = Path(parsed.filepath).resolve()
+        entry = self.sources.get(str(source))
+        if entry is None or not output_file.exists():
+            return True
+        if entry.get("output") != str(output_file) or entry.get("hash") != self._hash(source):
+            return True
+        if entry.get("variant", "") != variant:
+            return True
+        if "variables" in entry and entry["variables"] != self.variable_hashes():
+            return True
+        return entry.get("dependencies") != self.dependency_hashes(parsed, resolver)
+
+    def owns(self, parsed: ParsedResource, output_file: Path) -> bool:
+        """True if output_file was written by the generator for parsed."""
+        entry = self.sources.get(str(Path(parsed.filepath).resolve()))
+        return entry is not None and entry.get("output") == str(output_file)
+
+    def record(self, parsed: ParsedResource, output_file: Path, resolver: ResourceResolver,
+               variant: str = "", uses_variables: bool = False):
+        """Remember the inputs a module was generated from (uses_variables: it imports rf_variables)."""
+        source = Path(parsed.filepath).resolve()
+        self.sources[str(source)] = {
+            "hash": self._hash(source),
+            "output": str(output_file),
+            "imports": resolver.imports.get(str(source), []),
+            "dependencies": self.dependency_hashes(parsed, resolver),
+        }
+        if variant:
+            self.sources[str(source)]["variant"] = variant
+        if uses_variables:
+            self.sources[str(source)]["variables"] = self.variable_hashes()
+
+    def save(self, live_sources: Optional[List[str]] = None):
+        """Write the manifest, dropping sources that no longer exist."""
+        if live_sources is not None:
+            live = {str(Path(s).resolve()) for s in live_sources}
+            self.sources = {k: v for k, v in self.sources.items() if k in live}
+
+        data = {
+            "version": MANIFEST_VERSION,
+            "generator": self.generator,
+            "sources": dict(sorted(self.sources.items())),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=2) + "\n")
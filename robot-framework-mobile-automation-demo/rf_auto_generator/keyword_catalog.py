@@ -0,0 +1,192 @@
+"""
+On-disk keyword catalog with full-text search.
+
+A SQLite database holding every parsed keyword (name, RF-normalized name,
+arguments, documentation, tags, source file and call sites) with an FTS5
+index over them, plus the resolved call-graph edges. Rows are keyed by the
+content hash of their source file, so updating the catalog only rewrites
+the keywords of files that changed.
+"""
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import sqlite3
+
+from rf_auto_generator.call_graph import KeywordCallGraph, iter_step_calls, normalize_name
+from rf_auto_generator.incremental import file_hash
+from rf_auto_generator.rf_native_parser import ParsedResource
+
+CATALOG_NAME = ".rf_keyword_catalog.db"
+CATALOG_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, hash TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS keywords (
+    id INTEGER PRIMARY KEY,
+    kw_id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    rf_name TEXT NOT NULL,
+    args TEXT NOT NULL,
+    doc TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    source_file TEXT NOT NULL,
+    file TEXT NOT NULL,
+    calls TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS keywords_normalized ON keywords (normalized);
+CREATE INDEX IF NOT EXISTS keywords_file ON keywords (file);
+CREATE VIRTUAL TABLE IF NOT EXISTS keywords_fts USING fts5 (
+    name, normalized, args, doc, tags, source_file, calls,
+    content='keywords', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS keywords_ai AFTER INSERT ON keywords BEGIN
+    INSERT INTO keywords_fts (rowid, name, normalized, args, doc, tags, source_file, calls)
+    VALUES (new.id, new.name, new.normalized, new.args, new.doc, new.tags, new.source_file, new.calls);
+END;
+CREATE TRIGGER IF NOT EXISTS keywords_ad AFTER DELETE ON keywords BEGIN
+    INSERT INTO keywords_fts (keywords_fts, rowid, name, normalized, args, doc, tags, source_file, calls)
+    VALUES ('delete', old.id, old.name, old.normalized, old.args, old.doc, old.tags, old.source_file, old.calls);
+END;
+CREATE TABLE IF NOT EXISTS calls (
+    caller TEXT NOT NULL,
+    callee TEXT NOT NULL,
+    resolved INTEGER NOT NULL,
+    PRIMARY KEY (caller, callee)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS calls_callee ON calls (callee);
+"""
+
+_COLUMNS = ("kw_id", "name", "normalized", "rf_name", "args", "doc", "tags", "source_file", "file", "calls")
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must match as a prefix."""
+    terms = [term.replace('"', '""') for term in text.split()]
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+class KeywordCatalog:
+    """SQLite keyword catalog, updated incrementally from parsed resources."""
+
+    def __init__(self, path: str = CATALOG_NAME):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.row_factory = sqlite3.Row
+
+        version = None
+        if self._has_table("meta"):
+            row = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            version = row[0] if row else None
+        if version is not None and version != str(CATALOG_VERSION):
+            # Catalogs from another layout are rebuilt from scratch
+            self.db.close()
+            self.path.unlink()
+            self.db = sqlite3.connect(str(self.path))
+            self.db.row_factory = sqlite3.Row
+
+        # Keeps the FTS index in sync when INSERT OR REPLACE drops a row
+        self.db.execute("PRAGMA recursive_triggers = ON")
+        with self.db:
+            self.db.executescript(_SCHEMA)
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(CATALOG_VERSION),))
+
+    def _has_table(self, name: str) -> bool:
+        return self.db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                               (name,)).fetchone() is not None
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def update(self, parsed_files: List[ParsedResource], call_graph: Optional[KeywordCallGraph] = None,
+               prune: bool = True) -> Dict[str, int]:
+        """
+        Bring the catalog in line with parsed_files.
+
+        Only files whose content hash changed are rewritten; with prune,
+        files missing from parsed_files are dropped. Call edges are
+        re-derived from call_graph (built from parsed_files if not given)
+        whenever anything changed, since a changed file can change how
+        calls in other files resolve.
+        """
+        known = {row["path"]: row["hash"] for row in self.db.execute("SELECT path, hash FROM files")}
+        current = {str(Path(pf.filepath).resolve()): pf for pf in parsed_files}
+
+        changed = {}
+        for path, pf in current.items():
+            digest = file_hash(Path(path))
+            if known.get(path) != digest:
+                changed[path] = (pf, digest)
+        removed = [path for path in known if path not in current] if prune else []
+
+        if changed or removed:
+            with self.db:
+                for path in list(changed) + removed:
+                    self.db.execute("DELETE FROM keywords WHERE file = ?", (path,))
+                    self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+                for path, (pf, digest) in changed.items():
+                    self.db.executemany(
+                        f"INSERT OR REPLACE INTO keywords ({', '.join(_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                        self._keyword_rows(pf, path))
+                    self.db.execute("INSERT INTO files VALUES (?, ?)", (path, digest))
+                self._write_calls(call_graph or KeywordCallGraph(parsed_files))
+
+        return {"files": len(current), "updated": len(changed), "removed": len(removed)}
+
+    @staticmethod
+    def _keyword_rows(pf: ParsedResource, path: str) -> Iterable[tuple]:
+        for kw in pf.keywords:
+            rf_name = kw.rf_name or kw.name
+            call_names = sorted({name for name, _ in iter_step_calls(kw.steps)})
+            yield (KeywordCallGraph.keyword_id(kw), kw.name, normalize_name(kw.name), rf_name,
+                   " ".join(kw.args), kw.doc, " ".join(kw.tags), kw.source_file, path,
+                   "\n".join(call_names))
+
+    def _write_calls(self, call_graph: KeywordCallGraph):
+        self.db.execute("DELETE FROM calls")
+        self.db.executemany("INSERT OR IGNORE INTO calls VALUES (?, ?, 1)",
+                            ((caller, callee) for caller, callees in call_graph.calls.items()
+                             for callee in callees))
+        self.db.executemany("INSERT OR IGNORE INTO calls VALUES (?, ?, 0)",
+                            ((caller, name) for caller, names in call_graph.unresolved.items()
+                             for name in names))
+
+    def search(self, text: str, limit: int = 20) -> List[sqlite3.Row]:
+        """Keywords matching every word of text, best (bm25) first."""
+        query = fts_query(text)
+        if not query:
+            return []
+        return self.db.execute(
+            "SELECT k.* FROM keywords_fts JOIN keywords k ON k.id = keywords_fts.rowid "
+            "WHERE keywords_fts MATCH ? ORDER BY bm25(keywords_fts) LIMIT ?",
+            (query, limit)).fetchall()
+
+    def lookup(self, name: str) -> List[sqlite3.Row]:
+        """Keywords whose RF-normalized name (without embedded arguments) or id equals name."""
+        return self.db.execute(
+            "SELECT * FROM keywords WHERE normalized = ? OR kw_id = ? ORDER BY kw_id",
+            (normalize_name(name), name)).fetchall()
+
+    def callers(self, kw_id: str) -> List[str]:
+        """Keywords calling kw_id directly."""
+        return [row[0] for row in self.db.execute(
+            "SELECT caller FROM calls WHERE callee = ? AND resolved = 1 ORDER BY caller", (kw_id,))]
+
+    def callees(self, kw_id: str, resolved: bool = True) -> List[str]:
+        """User keywords (or, with resolved=False, library/unknown calls) kw_id calls."""
+        return [row[0] for row in self.db.execute(
+            "SELECT callee FROM calls WHERE caller = ? AND resolved = ? ORDER BY callee",
+            (kw_id, int(resolved)))]
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts of the catalog tables."""
+        return {table: self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("files", "keywords", "calls")}
@@ -0,0 +1,781 @@
+"""
+Compiler from RF keyword bodies to Python call chains.
+
+The ParsedStep tree of a user keyword is turned into statements that call
+the generated keyword classes, the bridge and RF libraries directly:
+
+- user keywords (resolved through the call graph, embedded arguments
+  included) become method calls on the same class or on a sibling class,
+- library keywords become calls on the library instance (AppiumLibrary
+  through bridge.appium), with name=value arguments checked against the
+  keyword's libdoc spec (see library_specs),
+- Run Keyword (If/Unless/And Return/And Ignore Error/And Return Status),
+  Run Keywords, Wait Until Keyword Succeeds, Return From Keyword (If),
+  Set Variable and Evaluate are compiled inline,
+- IF/ELSE IF/ELSE, FOR, WHILE, TRY/EXCEPT/ELSE/FINALLY, RETURN, BREAK,
+  CONTINUE and VAR become the equivalent Python statements.
+
+Variables resolve to locals, the class's locator constants or the
+generated rf_variables module. Anything without a faithful translation
+(suite/test scoped variables, extended variable syntax, BuiltIn keywords
+that need a running RF context, ...) raises CompileError, and the
+generator keeps its pattern-based body for that keyword.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import ast
+import builtins
+import keyword
+import re
+
+from robot.libraries import STDLIBS
+from robot.utils import unescape
+from robot.variables import search_variable
+
+from rf_auto_generator.call_graph import KeywordCallGraph, normalize_name
+from rf_auto_generator.library_specs import KeywordSpec, LibrarySpecs
+from rf_auto_generator.rf_native_parser import ParsedKeyword, ParsedResource, ParsedStep
+
+# Module written by SmartCodeGenerator.generate_variables_module
+VARIABLES_MODULE = "rf_variables"
+
+# ${...} built-ins with an object value (RF's ${True}, ${EMPTY}, ...)
+BUILTIN_OBJECTS = {
+    normalize_name('EMPTY'): "''",
+    normalize_name('SPACE'): "' '",
+    normalize_name('True'): "True",
+    normalize_name('False'): "False",
+    normalize_name('None'): "None",
+    normalize_name('null'): "None",
+    '\\n': "'\\n'",
+}
+
+_NUMBER = re.compile(r'-?(\d+|\d*\.\d+|0[xob][0-9a-f]+)$', re.IGNORECASE)
+_NAMED_ARG = re.compile(r'([A-Za-z_]\w*)=(.*)$', re.DOTALL)
+_DOLLAR_NAME = re.compile(r'(?<![\\\w$])\$([A-Za-z_]\w*)')
+_RESERVED = {'self', 'os', VARIABLES_MODULE}
+
+# Iterations RF allows a WHILE loop without an explicit limit (robot.running.bodyrunner)
+_WHILE_LIMIT = 10_000
+_WHILE_COUNT = re.compile(r'(\d+)\s*(?:times|x)?$', re.IGNORECASE)
+
+# AST nodes a condition over constants may contain to be folded at generation time
+_FOLDABLE_NODES = (ast.Expression, ast.Constant, ast.Compare, ast.BoolOp, ast.UnaryOp, ast.Tuple, ast.List,
+                   ast.Name, ast.Load, ast.cmpop, ast.boolop, ast.Not)
+
+
+class CompileError(ValueError):
+    """A keyword body uses something the compiler cannot translate faithfully."""
+
+
+@dataclass
+class CompiledKeyword:
+    """Method body of a compiled keyword plus what its module needs."""
+    lines: List[str]
+    imports: Set[str] = field(default_factory=set)  # e.g. "import os", "from . import rf_variables"
+    collaborators: Dict[str, Tuple[str, str]] = field(default_factory=dict)  # attribute -> (module, class)
+
+
+class _Context:
+    """State of one keyword being compiled."""
+
+    def __init__(self, kw: ParsedKeyword, locators: Dict[str, str]):
+        self.kw = kw
+        self.locators = locators  # normalized RF name -> class constant
+        self.locals: Dict[str, str] = {}  # normalized RF name -> Python name
+        self.result = CompiledKeyword(lines=[])
+
+    def emit(self, depth: int, line: str):
+        self.result.lines.append("    " * depth + line)
+
+
+class KeywordCompiler:
+    """
+    Compiles keyword bodies for SmartCodeGenerator.
+
+    generator provides the naming scheme of the generated code (method,
+    parameter, module and class names) and the rf_variables constants;
+    parsed_files are the resources that get a generated class, so only
+    their keywords can be called directly. specs provides the library
+    keywords (by default built in memory, without the on-disk cache).
+    """
+
+    def __init__(self, generator, call_graph: KeywordCallGraph, parsed_files: Iterable[ParsedResource],
+                 specs: Optional[LibrarySpecs] = None):
+        self.generator = generator
+        self.call_graph = call_graph
+        self.specs = specs or LibrarySpecs(cache_dir=None)
+        self.sources: Set[str] = set()
+        libraries = []
+        for pf in parsed_files:
+            self.sources.add(str(Path(pf.filepath).resolve()))
+            libraries.extend(name for name in pf.library_imports if name not in libraries)
+        # RF prefers imported libraries over standard ones; BuiltIn is always there
+        self.libraries = sorted(libraries, key=lambda name: name in STDLIBS) + ['BuiltIn']
+        self._source_keys: Dict[str, str] = {}
+        self._library_keywords: Dict[str, Tuple[str, KeywordSpec]] = {}
+
+    def preload_libraries(self):
+        """Load (or build) the library specs up front (e.g. before forking workers)."""
+        for name in self.libraries:
+            self.specs.get(name)
+
+    def compile(self, kw: ParsedKeyword, locators: Dict[str, str]) -> CompiledKeyword:
+        """Compile a keyword body; raises CompileError if any step cannot be translated."""
+        ctx = _Context(kw, {normalize_name(name): self.generator._locator_to_const(name) for name in locators})
+        for arg in kw.args:
+            ctx.locals[normalize_name(arg)] = self.generator.convert_arg_name(arg)
+        self._block(kw.steps, ctx, 0)
+        try:
+            compile("def _keyword():\n" + "".join(f"    {line}\n" for line in ctx.result.lines), kw.name, 'exec')
+        except SyntaxError as error:
+            raise CompileError(f"generated body is not valid Python: {error.msg}") from None
+        return ctx.result
+
+    # Statements
+
+    def _block(self, steps: Iterable[ParsedStep], ctx: _Context, depth: int):
+        start = len(ctx.result.lines)
+        for step in steps:
+            self._step(step, ctx, depth)
+        if len(ctx.result.lines) == start:
+            ctx.emit(depth, "pass")
+
+    def _step(self, step: ParsedStep, ctx: _Context, depth: int):
+        if step.kind == 'KEYWORD':
+            self._keyword_statement(step.name, list(step.args), list(step.assign), ctx, depth)
+        elif step.kind == 'IF':
+            self._if(step, ctx, depth)
+        elif step.kind == 'FOR':
+            self._for(step, ctx, depth)
+        elif step.kind == 'WHILE':
+            self._while(step, ctx, depth)
+        elif step.kind == 'TRY':
+            self._try(step, ctx, depth)
+        elif step.kind == 'RETURN':
+            ctx.emit(depth, f"return {self._values(step.args, ctx)}" if step.args else "return")
+        elif step.kind in ('BREAK', 'CONTINUE'):
+            ctx.emit(depth, step.kind.lower())
+        elif step.kind == 'VAR':
+            self._var(step, ctx, depth)
+        elif step.kind == 'GROUP':
+            for child in step.body:
+                self._step(child, ctx, depth)
+        else:
+            raise CompileError(f"unsupported {step.kind} step")
+
+    def _if(self, step: ParsedStep, ctx: _Context, depth: int):
+        if step.assign:
+            raise CompileError("inline IF with assignment")
+        branches = []
+        branch = step
+        while branch:
+            condition = None if branch.kind == 'ELSE' else branch.args[0]
+            branches.append((condition, lambda d, body=branch.body: self._block(body, ctx, d)))
+            branch = branch.orelse
+        self._branches(branches, False, ctx, depth)
+
+    def _while(self, step: ParsedStep, ctx: _Context, depth: int):
+        """
+        WHILE as a loop counting its iterations like RF: more than limit
+        (default 10 000) fails the loop, or just ends it with on_limit=PASS.
+        """
+        if not step.args:
+            raise CompileError("WHILE without a condition")
+        options = dict(option.split('=', 1) for option in step.assign)
+        if any(search_variable(value) for value in options.values()):
+            raise CompileError("WHILE options from variables")
+        condition = self._condition(step.args[0], ctx)
+        limit = options.get('limit', '').strip()
+        if limit.upper() == 'NONE':
+            ctx.emit(depth, f"while {condition}:")
+            self._block(step.body, ctx, depth + 1)
+            return
+        count = _WHILE_COUNT.match(limit) if limit else None
+        if limit and not count:
+            raise CompileError(f"WHILE limit '{limit}' (only iteration counts are compiled)")
+        count = int(count.group(1)) if count else _WHILE_LIMIT
+        if options.get('on_limit', 'FAIL').upper() not in ('PASS', 'FAIL') or count <= 0:
+            raise CompileError("invalid WHILE options")
+        ctx.emit(depth, f"for _ in range({count}):")
+        ctx.emit(depth + 1, f"if not ({condition}):")
+        ctx.emit(depth + 2, "break")
+        self._block(step.body, ctx, depth + 1)
+        if options.get('on_limit', 'FAIL').upper() == 'FAIL':
+            message = options.get('on_limit_message') or (
+                f"WHILE loop was aborted because it did not finish within the limit of {count} iterations. "
+                f"Use the 'limit' argument to increase or remove the limit if needed.")
+            ctx.emit(depth, "else:")
+            ctx.emit(depth + 1, f"if {condition}:")
+            ctx.emit(depth + 2, f"raise RuntimeError({unescape(message)!r})")
+
+    def _branches(self, branches: List[Tuple[Optional[str], Callable[[int], None]]], negate: bool,
+                  ctx: _Context, depth: int):
+        """
+        Emit an if/elif/else chain of (RF condition or None for ELSE, body emitter).
+
+        Conditions that fold to a constant (see _constant_condition) emit no
+        test: false branches are dropped and a true one ends the chain, its
+        body running unconditionally (or as the else of the branches before).
+        """
+        opened = False
+        for condition, body in branches:
+            if condition is not None:
+                imports = set(ctx.result.imports)
+                expression = self._condition(condition, ctx)
+                expression = f"not ({expression})" if negate else expression
+                value = self._constant_condition(expression)
+                if value is None:
+                    ctx.emit(depth, f"{'elif' if opened else 'if'} {expression}:")
+                    body(depth + 1)
+                    opened = True
+                    continue
+                ctx.result.imports = imports  # Folded away: the condition's variables are not used
+                if not value:
+                    continue
+            if opened:
+                ctx.emit(depth, "else:")
+            body(depth + 1 if opened else depth)
+            return
+
+    def _constant_condition(self, expression: str) -> Optional[bool]:
+        """
+        Value of a compiled condition that only compares generation-time
+        constants, or None. Only platform-specialized packages have
+        constants to fold (generator.constant_values: rf_variables name ->
+        value); elsewhere rf_variables stays patchable at run time.
+        """
+        values = self.generator.constant_values
+        if not values:
+            return None
+        tree = ast.parse(expression, mode='eval')
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Attribute):
+                if not (isinstance(node.value, ast.Name) and node.value.id == VARIABLES_MODULE
+                        and node.attr in values):
+                    return None
+            elif not isinstance(node, _FOLDABLE_NODES) or \
+                    (isinstance(node, ast.Name) and node.id != VARIABLES_MODULE):
+                return None
+        namespace = {VARIABLES_MODULE: SimpleNamespace(**values)}
+        return bool(eval(compile(tree, '<condition>', 'eval'), {'__builtins__': {}}, namespace))
+
+    def _for(self, step: ParsedStep, ctx: _Context, depth: int):
+        flavor = step.name.upper() or 'IN'
+        if any(_NAMED_ARG.match(arg) and arg.split('=', 1)[0] in ('start', 'mode', 'fill') for arg in step.args):
+            raise CompileError(f"FOR {flavor} options")
+        values = [self._expression(arg, ctx) for arg in step.args]
+
+        if flavor == 'IN':
+            if len(step.assign) != 1:
+                raise CompileError("FOR IN with several loop variables")
+            iterable = _iterable(values)
+        elif flavor == 'IN RANGE':
+            if not 1 <= len(values) <= 3 or any(v.startswith('*') for v in values):
+                raise CompileError("FOR IN RANGE arguments")
+            bounds = [str(int(arg)) if arg.lstrip('-').isdigit() else f"int({value})"
+                      for arg, value in zip(step.args, values)]
+            iterable = f"range({', '.join(bounds)})"
+        elif flavor == 'IN ENUMERATE':
+            iterable = f"enumerate({_iterable(values)})"
+        elif flavor == 'IN ZIP':
+            iterable = f"zip({', '.join(v[1:] if v.startswith('*') else v for v in values)})"
+        else:
+            raise CompileError(f"FOR {flavor}")
+
+        targets = [self._target(name, ctx) for name in step.assign]
+        ctx.emit(depth, f"for {', '.join(targets)} in {iterable}:")
+        self._block(step.body, ctx, depth + 1)
+
+    def _try(self, step: ParsedStep, ctx: _Context, depth: int):
+        ctx.emit(depth, "try:")
+        self._block(step.body, ctx, depth + 1)
+
+        handlers, orelse, final = [], None, None
+        branch = step.orelse
+        while branch:
+            if branch.kind == 'EXCEPT':
+                handlers.append(branch)
+            elif branch.kind == 'ELSE':
+                orelse = branch
+            elif branch.kind == 'FINALLY':
+                final = branch
+            branch = branch.orelse
+
+        if handlers:
+            catch_all = len(handlers) == 1 and not handlers[0].args
+            ctx.emit(depth, "except Exception as _error:")
+            for index, handler in enumerate(handlers):
+                inner = depth + 1
+                if handler.args:
+                    patterns = ', '.join(self._expression(p, ctx) for p in handler.args)
+                    pattern_type = repr(handler.name) if handler.name else "None"
+                    ctx.emit(depth + 1, f"{'if' if index == 0 else 'elif'} "
+                                        f"self.bridge.error_matches(_error, ({patterns},), {pattern_type}):")
+                    inner = depth + 2
+                elif not catch_all:
+                    ctx.emit(depth + 1, "else:")
+                    inner = depth + 2
+                if handler.assign:
+                    ctx.emit(inner, f"{self._target(handler.assign[0], ctx)} = str(_error)")
+                self._block(handler.body, ctx, inner)
+            if handlers[-1].args:
+                ctx.emit(depth + 1, "else:")
+                ctx.emit(depth + 2, "raise")
+        if orelse:
+            ctx.emit(depth, "else:")
+            self._block(orelse.body, ctx, depth + 1)
+        if final:
+            ctx.emit(depth, "finally:")
+            self._block(final.body, ctx, depth + 1)
+        if not handlers and not final:
+            raise CompileError("TRY without EXCEPT or FINALLY")
+
+    def _var(self, step: ParsedStep, ctx: _Context, depth: int):
+        options = dict(option.split('=', 1) for option in step.assign)
+        if options.get('scope', 'LOCAL').upper() != 'LOCAL' or 'separator' in options:
+            raise CompileError("VAR with scope or separator")
+        match = search_variable(step.name)
+        if match.identifier == '&':
+            items = []
+            for arg in step.args:
+                named = _NAMED_ARG.match(arg)
+                if not named:
+                    raise CompileError("VAR &{dict} item without name=value")
+                items.append(f"{named.group(1)!r}: {self._expression(named.group(2), ctx)}")
+            value = f"{{{', '.join(items)}}}"
+        elif match.identifier == '@':
+            value = f"[{', '.join(self._expression(arg, ctx) for arg in step.args)}]"
+        elif len(step.args) == 1:
+            value = self._expression(step.args[0], ctx)
+        else:
+            value = self._string(' '.join(step.args), ctx)
+        ctx.emit(depth, f"{self._target(step.name, ctx)} = {value}")
+
+    def _keyword_statement(self, name: str, args: List[str], assign: List[str], ctx: _Context, depth: int):
+        """Compile a keyword call used as a statement (some BuiltIn keywords become control flow)."""
+        normalized = normalize_name(name)
+
+        if normalized in ('runkeywordif', 'runkeywordunless'):
+            if assign:
+                raise CompileError(f"assigning the result of {name}")
+            self._run_keyword_if(args, normalized == 'runkeywordunless', ctx, depth)
+        elif normalized == 'runkeywords':
+            if assign:
+                raise CompileError("assigning the result of Run Keywords")
+            for group_name, group_args in _run_keywords_groups(args):
+                self._keyword_statement(group_name, group_args, [], ctx, depth)
+        elif normalized == 'returnfromkeyword':
+            ctx.emit(depth, f"return {self._values(args, ctx)}" if args else "return")
+        elif normalized == 'returnfromkeywordif':
+            self._branches([(args[0], lambda d: ctx.emit(d, f"return {self._values(args[1:], ctx)}"
+                                                         if args[1:] else "return"))], False, ctx, depth)
+        elif normalized == 'runkeywordandreturn':
+            ctx.emit(depth, f"return {self._call(args[0], args[1:], ctx)}")
+        elif normalized == 'runkeywordandreturnif':
+            self._branches([(args[0], lambda d: ctx.emit(d, f"return {self._call(args[1], args[2:], ctx)}"))],
+                           False, ctx, depth)
+        else:
+            call = self._call(name, args, ctx)
+            if assign:
+                ctx.emit(depth, f"{self._assign_targets(assign, ctx)} = {call}")
+            else:
+                ctx.emit(depth, call)
+
+    def _run_keyword_if(self, args: List[str], unless: bool, ctx: _Context, depth: int):
+        # Run Keyword If  cond  KW  args  ELSE IF  cond  KW  args  ELSE  KW  args
+        branches = []
+        rest, is_else = list(args), False
+        while rest:
+            condition, body = (None, rest) if is_else else (rest[0], rest[1:])
+            markers = [i for i, arg in enumerate(body) if arg in ('ELSE IF', 'ELSE')]
+            end = markers[0] if markers else len(body)
+            if not body[:end]:
+                raise CompileError("Run Keyword If without a keyword")
+            branches.append((condition, lambda d, call=body[:end]: self._keyword_statement(
+                call[0], call[1:], [], ctx, d)))
+            if not markers:
+                break
+            if unless:
+                raise CompileError("Run Keyword Unless with ELSE")
+            is_else = body[end] == 'ELSE'
+            rest = body[end + 1:]
+        self._branches(branches, unless, ctx, depth)
+
+    # Calls
+
+    def _call(self, name: str, args: List[str], ctx: _Context) -> str:
+        """Python expression calling a keyword (Set Variable/Evaluate become the value itself)."""
+        normalized = normalize_name(name)
+        if normalized in _VALUE_KEYWORDS:
+            return self._value_keyword(normalized, args, ctx)
+        if normalized == 'runkeyword' and args:
+            return self._call(args[0], args[1:], ctx)
+        function, arguments = self._callable(name, args, ctx)
+        return f"{function}({', '.join(arguments)})"
+
+    def _callable(self, name: str, args: List[str], ctx: _Context) -> Tuple[str, List[str]]:
+        """(callable expression, argument expressions) of a keyword call."""
+        normalized = normalize_name(name)
+
+        if normalized in _VALUE_KEYWORDS:
+            return f"(lambda: {self._value_keyword(normalized, args, ctx)})", []
+        if normalized == 'runkeyword' or normalized in _WRAPPERS:
+            return self._builtin_callable(normalized, args, ctx)
+
+        target = self.call_graph.resolve(name, ctx.kw.source_file)
+        if target:
+            return self._user_keyword_callable(name, target, args, ctx)
+        return self._library_callable(name, args, ctx)
+
+    def _value_keyword(self, normalized: str, args: List[str], ctx: _Context) -> str:
+        """Set Variable / Evaluate as a plain expression."""
+        if normalized == _VALUE_KEYWORDS[0]:
+            return self._values(args, ctx) if args else "''"
+        if len(args) != 1:
+            raise CompileError("Evaluate with modules or namespace")
+        return f"({self._condition(args[0], ctx)})"
+
+    def _builtin_callable(self, normalized: str, args: List[str], ctx: _Context) -> Tuple[str, List[str]]:
+        if normalized == 'runkeyword':
+            if not args:
+                raise CompileError("Run Keyword without a keyword")
+            return self._callable(args[0], args[1:], ctx)
+
+        bridge_method, index = _WRAPPERS[normalized]
+        if len(args) <= index:
+            raise CompileError(f"{bridge_method} without a keyword")
+        function, arguments = self._callable(args[index], args[index + 1:], ctx)
+        leading = [self._expression(arg, ctx) for arg in args[:index]]
+        return f"self.bridge.{bridge_method}", leading + [function] + arguments
+
+    def _user_keyword_callable(self, name: str, target: str, args: List[str],
+                               ctx: _Context) -> Tuple[str, List[str]]:
+        callee = self.call_graph.keywords[target]
+        if self._source_key(callee.source_file) not in self.sources:
+            raise CompileError(f"'{name}' is defined in {Path(callee.source_file).name}, which is not generated")
+
+        arguments = []
+        embedded = self.call_graph.embedded_arguments(target)
+        if embedded:
+            if tuple(embedded.args) != tuple(callee.args[:len(embedded.args)]):
+                raise CompileError(f"embedded arguments of '{callee.name}' do not map to its parameters")
+            arguments.extend(self._expression(value, ctx) for value in embedded.parse_args(name))
+
+        params = [normalize_name(arg) for arg in callee.args]
+        named = False
+        for arg in args:
+            match = _NAMED_ARG.match(arg)
+            if match and normalize_name(match.group(1)) in params:
+                named = True
+                param = callee.args[params.index(normalize_name(match.group(1)))]
+                arguments.append(f"{self.generator.convert_arg_name(param)}="
+                                 f"{self._expression(match.group(2), ctx)}")
+            elif named:
+                raise CompileError(f"positional argument after named arguments in '{name}'")
+            else:
+                value = self._expression(arg, ctx)
+                if value.startswith('*'):
+                    raise CompileError(f"list/dict expansion in a call to user keyword '{name}'")
+                arguments.append(value)
+        if len(arguments) != len(callee.args):
+            raise CompileError(f"'{name}' called with {len(arguments)} arguments, "
+                               f"the generated method takes {len(callee.args)}")
+
+        method = self.generator.sanitize_name(callee.name)
+        if self._source_key(callee.source_file) == self._source_key(ctx.kw.source_file):
+            return f"self.{method}", arguments
+
+        filename = Path(callee.source_file).name
+        module = self.generator.module_name_for(filename)
+        attribute = f"_{module}"
+        ctx.result.collaborators[attribute] = (module, self.generator.class_name_for(filename))
+        return f"self.{attribute}.{method}", arguments
+
+    def _source_key(self, source_file: str) -> str:
+        if source_file not in self._source_keys:
+            self._source_keys[source_file] = str(Path(source_file).resolve())
+        return self._source_keys[source_file]
+
+    def _library_callable(self, name: str, args: List[str], ctx: _Context) -> Tuple[str, List[str]]:
+        if search_variable(name):
+            raise CompileError(f"keyword name from a variable: {name}")
+        library, spec = self._library_keyword(name)
+
+        arguments = []
+        named = False
+        for arg in args:
+            match = _NAMED_ARG.match(arg)
+            if match and spec.accepts_named(match.group(1)):
+                named = True
+                arguments.append(f"{match.group(1)}={self._typed_literal(spec, match.group(1), match.group(2), ctx)}")
+            elif named:
+                raise CompileError(f"positional argument after named arguments in '{name}'")
+            else:
+                parameter = spec.positional_parameter(len(arguments))
+                arguments.append(self._typed_literal(spec, parameter, arg, ctx))
+
+        if library == 'AppiumLibrary':
+            return f"self.bridge.appium.{spec.method}", arguments
+        return f"self.bridge.library({library!r}).{spec.method}", arguments
+
+    def _library_keyword(self, name: str) -> Tuple[str, KeywordSpec]:
+        """(library, keyword spec) of a library keyword."""
+        normalized = normalize_name(name)
+        if normalized in self._library_keywords:
+            return self._library_keywords[normalized]
+
+        owner = None
+        if '.' in name:
+            # Qualified call: "AppiumLibrary.Click Element"
+            library, short_name = name.rsplit('.', 1)
+            spec = self.specs.keyword(library, short_name) if library in self.libraries else None
+            if spec:
+                owner = (library, spec)
+        if owner is None:
+            for library in self.libraries:
+                spec = self.specs.keyword(library, name)
+                if spec:
+                    owner = (library, spec)
+                    break
+        if owner is None:
+            raise CompileError(f"unknown keyword '{name}'")
+        if owner[1].needs_context:
+            raise CompileError(f"'{name}' needs a running Robot Framework context")
+        self._library_keywords[normalized] = owner
+        return owner
+
+    def _typed_literal(self, spec: KeywordSpec, parameter: Optional[str], value: str, ctx: _Context) -> str:
+        """Argument expression; literals for int/float/bool parameters are converted like RF would."""
+        expression = self._expression(value, ctx)
+        annotation = spec.parameter_type(parameter)
+        if annotation is None or search_variable(value):
+            return expression
+        text = unescape(value)
+        if annotation in ('int', 'float') and _NUMBER.match(text):
+            return repr({'int': int, 'float': float}[annotation](ast.literal_eval(text)))
+        if annotation == 'bool' and text.upper() in ('TRUE', 'FALSE'):
+            return str(text.upper() == 'TRUE')
+        return expression
+
+    # Values
+
+    def _values(self, args: List[str], ctx: _Context) -> str:
+        """One value, or a list of several (RF returns/sets lists for multiple values)."""
+        values = [self._expression(arg, ctx) for arg in args]
+        if len(values) == 1 and not values[0].startswith('*'):
+            return values[0]
+        return f"[{', '.join(values)}]"
+
+    def _expression(self, text: str, ctx: _Context) -> str:
+        """
+        Python expression for an RF argument.
+
+        A lone ${var} keeps its object, @{list}/&{dict} become */** expansions
+        and anything mixing text and variables becomes a string.
+        """
+        match = search_variable(text)
+        if match and match.start == 0 and match.end == len(text):
+            value = self._variable(match, ctx)
+            if match.identifier == '@':
+                return f"*{value}"
+            if match.identifier == '&':
+                return f"**{value}"
+            return value
+        return self._string(text, ctx)
+
+    def _string(self, text: str, ctx: _Context) -> str:
+        """String expression (literal or f-string) for text containing variables."""
+        pieces = []
+        literal = False
+        rest = text
+        while True:
+            match = search_variable(rest)
+            if not match:
+                break
+            if match.identifier != '$' and match.identifier != '%':
+                raise CompileError(f"list/dict variable inside a string: {text}")
+            pieces.append(("text", unescape(match.before)))
+            pieces.append(("value", self._variable(match, ctx)))
+            rest = match.after
+        pieces.append(("text", unescape(rest)))
+
+        # String constants (${EMPTY}, ${SPACE}, ...) are part of the text
+        pieces = [("text", ast.literal_eval(value)) if kind == "value" and value.startswith("'") else (kind, value)
+                  for kind, value in pieces]
+        if not any(kind == "value" for kind, _ in pieces):
+            return repr(''.join(value for _, value in pieces))
+        if any(kind == "value" and ("'" in value or "\\" in value) for kind, value in pieces):
+            # Quotes and backslashes are not allowed in f-string expressions before Python 3.12
+            return " + ".join(repr(value) if kind == "text" else value if _is_text(value) else f"str({value})"
+                              for kind, value in pieces if value)
+        body = ''
+        for kind, value in pieces:
+            if kind == "value":
+                body += f"{{{value}}}"
+            else:
+                literal = literal or bool(value)
+                body += (value.encode('unicode_escape').decode('ascii')
+                         .replace("'", "\\'").replace('{', '{{').replace('}', '}}'))
+        if not literal and len(pieces) == 3:
+            return f"str({pieces[1][1]})"
+        return f"f'{body}'"
+
+    def _variable(self, match, ctx: _Context) -> str:
+        """Python expression for a ${var}, @{var}, &{var} or %{ENV} reference."""
+        if match.items:
+            raise CompileError(f"item access {match.match}")
+        base = match.base
+        if search_variable(base):
+            raise CompileError(f"nested variable {match.match}")
+
+        if match.identifier == '%':
+            name, has_default, default = base.partition('=')
+            ctx.result.imports.add("import os")
+            return f"os.environ.get({name!r}, {default!r})" if has_default else f"os.environ[{name!r}]"
+
+        normalized = normalize_name(base)
+        if normalized in ctx.locals:
+            return ctx.locals[normalized]
+        if normalized in ctx.locators:
+            return f"self.{ctx.locators[normalized]}"
+        constants = self.generator.variable_constants
+        if normalized in constants:
+            ctx.result.imports.add(f"from . import {VARIABLES_MODULE}")
+            return f"{VARIABLES_MODULE}.{constants[normalized]}"
+        if match.identifier == '$' and _NUMBER.match(base):
+            return repr(ast.literal_eval(base.lower() if base.lower().startswith(('0x', '0o', '0b')) else base))
+        if normalized in BUILTIN_OBJECTS:
+            return BUILTIN_OBJECTS[normalized]
+        if normalized == 'empty' and match.identifier in '@&':
+            return "()" if match.identifier == '@' else "{}"
+        raise CompileError(f"unknown variable {match.match} (set at run time or extended syntax)")
+
+    def _condition(self, text: str, ctx: _Context) -> str:
+        """
+        Python expression for an RF condition or Evaluate expression.
+
+        '${var}' (quoted) compares the variable's string value, $var uses
+        the object. An unquoted ${var} is not compiled: RF evaluates its
+        text form (an argument 'False' is false), which the object does not
+        reproduce (the string 'False' is truthy).
+        """
+        out = ''
+        state = None  # Quote left open by the text so far
+        rest = text
+        while True:
+            match = search_variable(rest)
+            if not match:
+                break
+            before = match.before
+            quote = _scan_quotes(before, state)
+            value = self._variable(match, ctx)
+            if quote:
+                # Only '${var}' as a whole string literal has a direct translation
+                if before.endswith(quote) and match.after.startswith(quote) and \
+                        _scan_quotes(before[:-1], state) is None:
+                    out += before[:-1] + (value if _is_text(value) else f"str({value})")
+                    rest = match.after[1:]
+                    state = None
+                    continue
+                raise CompileError(f"variable inside a longer string in condition: {text}")
+            raise CompileError(f"unquoted variable in condition (RF evaluates its text form): {text}")
+        out += rest
+
+        expression = _DOLLAR_NAME.sub(lambda m: self._dollar_variable(m.group(1), ctx), out)
+        try:
+            tree = ast.parse(expression, mode='eval')
+        except SyntaxError:
+            raise CompileError(f"condition is not a Python expression: {text}") from None
+        known = set(ctx.locals.values()) | {'self', 'str', VARIABLES_MODULE, 'os'}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and node.id not in known and not hasattr(builtins, node.id):
+                raise CompileError(f"condition uses '{node.id}' (modules are only auto-imported by RF)")
+        return expression
+
+    def _dollar_variable(self, name: str, ctx: _Context) -> str:
+        match = search_variable(f"${{{name}}}")
+        return self._variable(match, ctx)
+
+    def _target(self, name: str, ctx: _Context) -> str:
+        """Python local for an assignment target such as ${x}, ${x}= or @{items}."""
+        match = search_variable(name.rstrip('= ').strip())
+        if not match.is_assign() or match.items:
+            raise CompileError(f"cannot assign to {name}")
+        normalized = normalize_name(match.base)
+        if normalized not in ctx.locals:
+            local = self.generator.convert_arg_name(match.base)
+            if not local or local[0].isdigit():
+                local = f"_{local}"
+            while (keyword.iskeyword(local) or hasattr(builtins, local) or local in _RESERVED
+                   or local in ctx.locals.values()):
+                local += "_"
+            ctx.locals[normalized] = local
+        return ctx.locals[normalized]
+
+    def _assign_targets(self, assign: List[str], ctx: _Context) -> str:
+        targets = []
+        for name in assign:
+            target = self._target(name, ctx)
+            identifier = name.strip()[0]
+            if identifier == '&' or (identifier == '@' and len(assign) == 1):
+                raise CompileError(f"list/dict assignment {name}")
+            targets.append(f"*{target}" if identifier == '@' else target)
+        return ', '.join(targets)
+
+
+# BuiltIn keywords compiled to the value they produce
+_VALUE_KEYWORDS = (normalize_name('Set Variable'), normalize_name('Evaluate'))
+
+# BuiltIn keywords that run another keyword, compiled to bridge helpers:
+# normalized name -> (bridge method, index of the keyword argument)
+_WRAPPERS = {
+    normalize_name('Wait Until Keyword Succeeds'): ('wait_until_keyword_succeeds', 2),
+    normalize_name('Run Keyword And Ignore Error'): ('run_keyword_and_ignore_error', 0),
+    normalize_name('Run Keyword And Return Status'): ('run_keyword_and_return_status', 0),
+}
+
+
+def _run_keywords_groups(args: List[str]) -> Iterable[Tuple[str, List[str]]]:
+    """(name, args) of the keywords run by Run Keywords."""
+    if 'AND' not in args:
+        return [(arg, []) for arg in args]
+    groups, group = [], []
+    for arg in args + ['AND']:
+        if arg == 'AND':
+            if group:
+                groups.append((group[0], group[1:]))
+            group = []
+        else:
+            group.append(arg)
+    return groups
+
+
+def _iterable(values: List[str]) -> str:
+    """Loop iterable of FOR values: a lone @{list} as is, otherwise a tuple."""
+    if len(values) == 1 and values[0].startswith('*') and not values[0].startswith('**'):
+        return values[0][1:]
+    return f"({', '.join(values)},)"
+
+
+def _scan_quotes(text: str, quote: Optional[str]) -> Optional[str]:
+    """Quote character still open after text, starting in state quote."""
+    escaped = False
+    for char in text:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif quote:
+            if char == quote:
+                quote = None
+        elif char in '\'"':
+            quote = char
+    return quote
+
+
+def _is_text(expression: str) -> bool:
+    """True for expressions known to be strings (rf_variables values, locators, literals)."""
+    return expression.startswith((f"{VARIABLES_MODULE}.", "self.", "'", "f'", "os.environ"))
@@ -0,0 +1,225 @@
+"""
+Keyword specs of RF libraries, built with libdoc and cached as JSON.
+
+To call library keywords directly, the keyword compiler needs, for every
+keyword of AppiumLibrary, BuiltIn, String, OperatingSystem, ... the method
+implementing it, its arguments (kind, default, type) and whether it needs
+a running RF context (see CONTEXT_FREE_KEYWORDS). Building that imports
+the library (AppiumLibrary pulls in selenium and the Appium client), so a
+spec is built once through robot.libdocpkg and cached as
+<library>-<version>.json. The version comes from the installed
+distribution (RF's own version for standard libraries) without importing
+the library, so repeat runs load the JSON instead, and upgrading a library
+gets it a new spec.
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+import importlib.metadata
+import importlib.util
+import json
+import os
+import re
+import tempfile
+
+import robot
+from robot.libraries import STDLIBS
+
+from rf_auto_generator.call_graph import normalize_name
+
+# Bump when the layout of the cached JSON changes
+SPEC_FORMAT_VERSION = 2
+
+DEFAULT_CACHE_DIR = ".rf_libdoc_cache"
+
+# Libraries built on RF's execution context (variables, namespace, running
+# keywords by name), mapped to the keywords known to work when called
+# directly. Keywords of other libraries never need the context.
+CONTEXT_FREE_KEYWORDS = {
+    'BuiltIn': {normalize_name(name) for name in (
+        'Call Method', 'Catenate', 'Comment', 'Convert To Binary', 'Convert To Boolean', 'Convert To Bytes',
+        'Convert To Hex', 'Convert To Integer', 'Convert To Number', 'Convert To Octal', 'Convert To String',
+        'Create List', 'Fail', 'Get Count', 'Get Length', 'Get Time', 'Length Should Be', 'Log',
+        'Log To Console', 'No Operation', 'Regexp Escape', 'Set Variable', 'Should Be Empty', 'Should Be Equal',
+        'Should Be Equal As Integers', 'Should Be Equal As Numbers', 'Should Be Equal As Strings',
+        'Should Contain', 'Should Contain Any', 'Should Contain X Times', 'Should End With', 'Should Match',
+        'Should Match Regexp', 'Should Not Be Empty', 'Should Not Be Equal', 'Should Not Be Equal As Integers',
+        'Should Not Be Equal As Numbers', 'Should Not Be Equal As Strings', 'Should Not Contain',
+        'Should Not Contain Any', 'Should Not End With', 'Should Not Match', 'Should Not Match Regexp',
+        'Should Not Start With', 'Should Start With', 'Sleep',
+    )},
+}
+
+# Argument kinds (libdoc's) that accept name=value
+_NAMED_KINDS = ('POSITIONAL_OR_NAMED', 'NAMED_ONLY')
+_POSITIONAL_KINDS = ('POSITIONAL_ONLY', 'POSITIONAL_OR_NAMED')
+
+_UNSAFE = re.compile(r'[^\w.+-]')
+
+
+@dataclass
+class KeywordSpec:
+    """One library keyword: RF name, Python method and libdoc argument specs."""
+    name: str
+    method: str
+    args: List[Dict] = field(default_factory=list)  # libdoc: name, kind, type, defaultValue, required
+    needs_context: bool = False
+
+    def accepts_named(self, name: str) -> bool:
+        """True if name=value is a named argument of this keyword (like RF decides it)."""
+        for arg in self.args:
+            if arg['name'] == name:
+                return arg['kind'] in _NAMED_KINDS
+        return any(arg['kind'] == 'VAR_NAMED' for arg in self.args)
+
+    def positional_parameter(self, index: int) -> Optional[str]:
+        """Name of the parameter receiving the index-th positional argument."""
+        positional = [arg['name'] for arg in self.args if arg['kind'] in _POSITIONAL_KINDS]
+        return positional[index] if index < len(positional) else None
+
+    def parameter_type(self, name: Optional[str]) -> Optional[str]:
+        """Type name of a parameter with a single, non-union type (e.g. 'int'), else None."""
+        for arg in self.args:
+            if arg['name'] == name and arg['type'] and not arg['type']['union'] and not arg['type']['nested']:
+                return arg['type']['name']
+        return None
+
+
+@dataclass
+class LibrarySpec:
+    """Keyword specs of one library, by normalized keyword name."""
+    name: str
+    version: str
+    keywords: Dict[str, KeywordSpec] = field(default_factory=dict)
+
+    def keyword(self, name: str) -> Optional[KeywordSpec]:
+        return self.keywords.get(normalize_name(name))
+
+    def to_dict(self) -> Dict:
+        return {
+            "format": SPEC_FORMAT_VERSION,
+            "name": self.name,
+            "version": self.version,
+            "keywords": [vars(kw) for kw in self.keywords.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LibrarySpec":
+        spec = cls(data["name"], data["version"])
+        for kw in data["keywords"]:
+            spec.keywords.setdefault(normalize_name(kw["name"]), KeywordSpec(**kw))
+        return spec
+
+
+def library_version(name: str) -> Optional[str]:
+    """Version of an importable library, found without importing it (None if unknown)."""
+    if name in STDLIBS:
+        return f"robot-{robot.__version__}"
+    top_level = name.split('.')[0]
+    for distribution in _distributions().get(top_level, ()):
+        try:
+            return f"{distribution}-{importlib.metadata.version(distribution)}"
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    try:
+        module = importlib.util.find_spec(top_level)
+    except (ImportError, ValueError):
+        return None
+    if module is None or not module.origin or not os.path.exists(module.origin):
+        return None
+    # Not installed as a distribution (e.g. a library module in the project)
+    stat = os.stat(module.origin)
+    return f"file-{stat.st_mtime_ns}-{stat.st_size}"
+
+
+@lru_cache(maxsize=None)
+def _distributions() -> Dict[str, List[str]]:
+    return importlib.metadata.packages_distributions()
+
+
+def build_spec(name: str, version: str = "") -> Optional[LibrarySpec]:
+    """Import a library and build its spec with libdoc; None if it cannot be imported here."""
+    from robot.libdocpkg.robotbuilder import KeywordDocBuilder
+    from robot.running import TestLibrary
+
+    try:
+        library = TestLibrary.from_name(name, create_keywords=True)
+    except Exception:
+        return None
+    spec = LibrarySpec(name, version or library.version or "")
+    builder = KeywordDocBuilder()
+    for kw in library.keywords:
+        method = getattr(kw, 'method_name', None)
+        if method is None:
+            continue  # Dynamic library keywords have no method to call
+        doc = builder.build_keyword(kw).to_dictionary()
+        args = [{key: arg[key] for key in ('name', 'kind', 'type', 'defaultValue', 'required')}
+                for arg in doc['args']]
+        spec.keywords.setdefault(normalize_name(kw.name), KeywordSpec(
+            kw.name, method, args, needs_context(name, kw.name)))
+    return spec
+
+
+def needs_context(library: str, keyword: str) -> bool:
+    """True if a library keyword only works inside a running RF execution context."""
+    context_free = CONTEXT_FREE_KEYWORDS.get(library)
+    return context_free is not None and normalize_name(keyword) not in context_free
+
+
+class LibrarySpecs:
+    """
+    Library specs for the compiler: loaded from cache_dir, or built and
+    stored there on a miss. cache_dir None never touches the disk.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+        self._specs: Dict[str, Optional[LibrarySpec]] = {}
+
+    def get(self, name: str) -> Optional[LibrarySpec]:
+        """Spec of a library, or None if it cannot be imported here."""
+        if name not in self._specs:
+            self._specs[name] = self._load(name)
+        return self._specs[name]
+
+    def keyword(self, library: str, name: str) -> Optional[KeywordSpec]:
+        spec = self.get(library)
+        return spec.keyword(name) if spec else None
+
+    def _path(self, name: str, version: str) -> Path:
+        return self.cache_dir / _UNSAFE.sub('_', f"{name}-{version}.json")
+
+    def _load(self, name: str) -> Optional[LibrarySpec]:
+        version = library_version(name)
+        if self.cache_dir is None or version is None:
+            return build_spec(name, version or "")
+        path = self._path(name, version)
+        try:
+            data = json.loads(path.read_text())
+            if data.get("format") == SPEC_FORMAT_VERSION and data.get("name") == name:
+                self.hits += 1
+                return LibrarySpec.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing or unreadable - build it again
+
+        self.misses += 1
+        spec = build_spec(name, version)
+        if spec is not None:
+            self._store(path, spec)
+        return spec
+
+    def _store(self, path: Path, spec: LibrarySpec):
+        """Write a spec atomically so concurrent runs never see partial files."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(spec.to_dict(), f, indent=1)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
@@ -0,0 +1,91 @@
+"""
+Run metrics for the generator: wall time, CPU time and peak memory per
+phase and per file, plus counters, written as JSON with --metrics-json.
+"""
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+import json
+import os
+import resource
+import sys
+import time
+
+METRICS_VERSION = 1
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process so far."""
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def cpu_seconds() -> float:
+    """CPU time of this process plus its finished children (e.g. parse workers)."""
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time() + children.ru_utime + children.ru_stime
+
+
+@contextmanager
+def measure() -> Iterator[Dict]:
+    """Fill a dict with seconds, cpu_seconds and peak_rss_bytes of the enclosed block."""
+    stats: Dict = {}
+    wall, cpu = time.perf_counter(), cpu_seconds()
+    try:
+        yield stats
+    finally:
+        stats["seconds"] = round(time.perf_counter() - wall, 6)
+        stats["cpu_seconds"] = round(cpu_seconds() - cpu, 6)
+        stats["peak_rss_bytes"] = peak_rss_bytes()
+
+
+class RunMetrics:
+    """Collects phase timings, per-file timings and counters of one generator run."""
+
+    def __init__(self):
+        self.phases: Dict[str, Dict] = {}
+        self.files: Dict[str, Dict[str, Dict]] = {}  # phase -> file -> stats
+        self.counts: Dict[str, int] = {}
+        self._start = time.perf_counter()
+        self._cpu_start = cpu_seconds()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Dict]:
+        """Time a phase; a phase entered again accumulates time."""
+        with measure() as stats:
+            yield stats
+        previous = self.phases.get(name)
+        if previous:
+            stats["seconds"] = round(stats["seconds"] + previous["seconds"], 6)
+            stats["cpu_seconds"] = round(stats["cpu_seconds"] + previous["cpu_seconds"], 6)
+        self.phases[name] = stats
+
+    def add_files(self, phase: str, file_stats: Dict[str, Dict]):
+        """Record per-file stats (as collected by the parser or generator) under a phase."""
+        self.files.setdefault(phase, {}).update(file_stats)
+
+    def count(self, name: str, value: int = 1):
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": METRICS_VERSION,
+            "total": {
+                "seconds": round(time.perf_counter() - self._start, 6),
+                "cpu_seconds": round(cpu_seconds() - self._cpu_start, 6),
+                "peak_rss_bytes": peak_rss_bytes(),
+            },
+            "phases": self.phases,
+            "counts": dict(sorted(self.counts.items())),
+            "files": self.files,
+        }
+
+    def write(self, path: str):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+
+def quiet_requested() -> bool:
+    """True if progress output is switched off (RF_GENERATOR_QUIET=1 or --quiet)."""
+    return os.environ.get("RF_GENERATOR_QUIET", "") not in ("", "0")
@@ -0,0 +1,62 @@
+"""
+Persistent on-disk cache for parsed RF resource files.
+Entries are keyed by file content hash, file path and RF version.
+"""
+from pathlib import Path
+from typing import Optional
+import hashlib
+import os
+import pickle
+import tempfile
+
+import robot
+
+# Bump when the layout of ParsedResource/ParsedKeyword changes
+CACHE_FORMAT_VERSION = 7
+
+
+class ParseCache:
+    """Stores serialized ParsedResource results under a cache directory."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, filepath: Path, content: bytes) -> str:
+        """Build the cache key for a file's current content."""
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_FORMAT_VERSION}|{robot.__version__}|{filepath.resolve()}|".encode())
+        digest.update(content)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pickle"
+
+    def load(self, key: str) -> Optional[object]:
+        """Return the cached ParsedResource for key, or None on a miss."""
+        try:
+            with open(self._entry_path(key), 'rb') as f:
+                parsed = pickle.load(f)
+        except Exception:
+            # Missing, corrupt or incompatible entry - reparse the file
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return parsed
+
+    def store(self, key: str, parsed) -> None:
+        """Write an entry atomically so concurrent workers never see partial files."""
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
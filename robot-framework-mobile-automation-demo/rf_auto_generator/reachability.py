@@ -0,0 +1,90 @@
+"""
+Reachability-based pruning.
+
+Selects test cases (by file and/or RF tag patterns), resolves the keywords
+their steps, setups and teardowns call, and walks the keyword call graph
+from there. Only reachable keywords need wrappers; everything else is
+reported as pruned.
+"""
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+import hashlib
+import json
+
+from robot.model.tags import TagPatterns
+
+from rf_auto_generator.call_graph import KeywordCallGraph, iter_step_calls
+from rf_auto_generator.rf_native_parser import ParsedResource, ParsedTestCase
+
+
+def select_tests(test_files: Iterable[ParsedResource], include_tags: Sequence[str] = (),
+                 exclude_tags: Sequence[str] = ()) -> List[ParsedTestCase]:
+    """Tests matching RF's --include/--exclude tag pattern semantics."""
+    include = TagPatterns(include_tags)
+    exclude = TagPatterns(exclude_tags)
+    return [test for pf in test_files for test in pf.tests
+            if (not include_tags or include.match(test.tags)) and not exclude.match(test.tags)]
+
+
+@dataclass
+class PruneResult:
+    """Keywords kept and pruned for a test selection."""
+    tests: List[ParsedTestCase]
+    entry_points: Set[str] = field(default_factory=set)
+    reachable: Set[str] = field(default_factory=set)
+    pruned: Dict[str, List[str]] = field(default_factory=dict)  # source file -> keyword names
+    unresolved: Dict[str, Set[str]] = field(default_factory=dict)  # test -> calls to non-user keywords
+
+    @property
+    def pruned_count(self) -> int:
+        return sum(len(names) for names in self.pruned.values())
+
+    def fingerprint(self) -> str:
+        """Hash of the kept keyword set, so outputs generated for another selection go stale."""
+        return hashlib.sha256("\n".join(sorted(self.reachable)).encode()).hexdigest()[:16]
+
+    def prune(self, parsed: ParsedResource) -> ParsedResource:
+        """A copy of parsed holding only the reachable keywords."""
+        keywords = [kw for kw in parsed.keywords if KeywordCallGraph.keyword_id(kw) in self.reachable]
+        return replace(parsed, keywords=keywords)
+
+    def report(self) -> Dict:
+        """JSON-serializable summary of the pruning."""
+        return {
+            "tests": [{"name": t.name, "file": t.source_file, "tags": list(t.tags)} for t in self.tests],
+            "entry_points": sorted(self.entry_points),
+            "kept": len(self.reachable),
+            "pruned_count": self.pruned_count,
+            "pruned": {source: sorted(names) for source, names in sorted(self.pruned.items())},
+            "unresolved_test_calls": {test: sorted(calls) for test, calls in sorted(self.unresolved.items())},
+        }
+
+    def write_report(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(self.report(), indent=2) + "\n")
+
+
+def prune_unreachable(call_graph: KeywordCallGraph, tests: List[ParsedTestCase],
+                      parsed_files: Optional[Iterable[ParsedResource]] = None) -> PruneResult:
+    """Walk the call graph from the tests' calls; keywords of parsed_files not reached are pruned."""
+    result = PruneResult(tests=tests)
+
+    for test in tests:
+        steps = list(test.steps) + [fixture for fixture in (test.setup, test.teardown) if fixture]
+        for name, _ in iter_step_calls(steps):
+            target = call_graph.resolve(name, test.source_file)
+            if target:
+                result.entry_points.add(target)
+            else:
+                result.unresolved.setdefault(test.name, set()).add(name)
+
+    for kw_id in result.entry_points:
+        result.reachable.add(kw_id)
+        result.reachable |= call_graph.reachable_from(kw_id)
+
+    for pf in parsed_files or ():
+        names = [kw.name for kw in pf.keywords if KeywordCallGraph.keyword_id(kw) not in result.reachable]
+        if names:
+            result.pruned[pf.filepath] = names
+    return result
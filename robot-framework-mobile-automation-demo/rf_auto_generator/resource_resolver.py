@@ -0,0 +1,181 @@
+"""
+Transitive `Resource` import resolution.
+
+Builds the resource import graph starting from test-case (or page-object)
+files, parses every shared resource exactly once, reports import cycles and
+exposes a per-resource symbol table of the keywords and variables visible
+in it, using RF's lookup order: the file's own definitions first, then its
+imports in the order they are declared.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from rf_auto_generator.call_graph import normalize_name
+from rf_auto_generator.rf_native_parser import ParsedKeyword, ParsedResource, RFNativeParser
+
+
+def resolve_import_path(importer: str, import_name: str) -> Optional[Path]:
+    """Resolve a `Resource` setting value relative to the importing file."""
+    base_dir = Path(importer).resolve().parent
+    import_name = import_name.replace('${CURDIR}', str(base_dir))
+    path = (base_dir / import_name).resolve()
+    return path if path.is_file() else None
+
+
+@dataclass
+class SymbolTable:
+    """Keywords and variables visible inside one resource file."""
+    path: str
+    visible_files: List[str] = field(default_factory=list)
+    keywords: Dict[str, ParsedKeyword] = field(default_factory=dict)  # normalized RF name -> keyword
+    variables: Dict[str, str] = field(default_factory=dict)
+    variable_sources: Dict[str, str] = field(default_factory=dict)
+
+
+class ResourceResolver:
+    """Resolves the resource import DAG with memoized per-file parsing."""
+
+    def __init__(self, parser: RFNativeParser, keep_resources: bool = True):
+        self.parser = parser
+        # With keep_resources=False only import edges are kept in memory and
+        # files are re-read through the parser (and its disk cache) on demand
+        self.keep_resources = keep_resources
+        self.resources: Dict[str, ParsedResource] = {}
+        self.imports: Dict[str, List[str]] = {}
+        self.importers: Dict[str, List[str]] = {}
+        self.cycles: List[List[str]] = []
+        self._tables: Dict[str, SymbolTable] = {}
+        self._visible: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def key(path) -> str:
+        """Canonical key of a file (its resolved absolute path)."""
+        return str(Path(path).resolve())
+
+    def add(self, parsed: ParsedResource):
+        """Register an already parsed file so it is not parsed again."""
+        key = self.key(parsed.filepath)
+        if self.keep_resources:
+            self.resources.setdefault(key, parsed)
+        if key not in self.imports:
+            self._record_imports(key, parsed)
+
+    def load(self, path) -> ParsedResource:
+        """Parse a file once and return the memoized result."""
+        key = self.key(path)
+        parsed = self.resources.get(key)
+        if parsed is None:
+            parsed = self.parser.parse_robot_file(key)
+            if self.keep_resources:
+                self.resources[key] = parsed
+        return parsed
+
+    def resolve(self, entry_files: Iterable) -> List[str]:
+        """
+        Walk the import graph from the entry files.
+
+        Returns every reached file in dependency order (imports before their
+        importers). Cycles are recorded in self.cycles rather than raised,
+        since RF itself imports each resource only once.
+        """
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        for entry in entry_files:
+            root = self.key(entry)
+            if root in state:
+                continue
+            # Iterative DFS; a 'visiting' node seen again closes a cycle
+            stack = [(root, iter(self._import_keys(root)))]
+            path = [root]
+            state[root] = 'visiting'
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    path.pop()
+                    state[node] = 'done'
+                    order.append(node)
+                elif state.get(child) == 'visiting':
+                    self.cycles.append(path[path.index(child):] + [child])
+                elif child not in state:
+                    state[child] = 'visiting'
+                    path.append(child)
+                    stack.append((child, iter(self._import_keys(child))))
+
+        return order
+
+    def _import_keys(self, key: str) -> List[str]:
+        if key not in self.imports:
+            self._record_imports(key, self.load(key))
+        return self.imports[key]
+
+    def _record_imports(self, key: str, parsed: ParsedResource):
+        resolved = [resolve_import_path(key, imp) for imp in parsed.imports]
+        self.imports[key] = [str(p) for p in resolved if p]
+        for imported in self.imports[key]:
+            self.importers.setdefault(imported, []).append(key)
+
+    def affected_by(self, paths: Iterable) -> Set[str]:
+        """The given files plus every file importing one of them, transitively."""
+        affected: Set[str] = set()
+        pending = [self.key(p) for p in paths]
+        while pending:
+            current = pending.pop()
+            if current in affected:
+                continue
+            affected.add(current)
+            pending.extend(self.importers.get(current, []))
+        return affected
+
+    def invalidate(self, paths: Iterable):
+        """Forget changed files so they are re-read on next use."""
+        for key in (self.key(p) for p in paths):
+            self.resources.pop(key, None)
+            for imported in self.imports.pop(key, []):
+                importers = self.importers.get(imported, [])
+                if key in importers:
+                    importers.remove(key)
+        # Visibility and symbol tables can depend on any changed file
+        self._visible.clear()
+        self._tables.clear()
+
+    def visible_files(self, path) -> List[str]:
+        """The file itself followed by everything it imports, transitively."""
+        key = self.key(path)
+        if key in self._visible:
+            return self._visible[key]
+
+        visible = []
+        seen = set()
+        pending = [key]
+        while pending:
+            current = pending.pop(0)
+            if current in seen:
+                continue
+            seen.add(current)
+            visible.append(current)
+            pending.extend(self._import_keys(current))
+        self._visible[key] = visible
+        return visible
+
+    def symbol_table(self, path) -> SymbolTable:
+        """Symbols visible in a file: its own definitions, then its imports'."""
+        key = self.key(path)
+        if key in self._tables:
+            return self._tables[key]
+
+        table = SymbolTable(path=key, visible_files=self.visible_files(key))
+        for visible in table.visible_files:
+            parsed = self.load(visible)
+            for kw in parsed.keywords:
+                table.keywords.setdefault(normalize_name(kw.rf_name or kw.name), kw)
+            for name, value in parsed.variables.items():
+                if name not in table.variables:
+                    table.variables[name] = value
+                    table.variable_sources[name] = visible
+
+        self._tables[key] = table
+        return table
@@ -2,29 +2,112 @@
 Production-ready RF parser with CORRECT argument extraction.
 Compatible with Robot Framework 7.3.x
 """
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
-import re
+import os
+import sys
+import traceback
 
+from robot.api import Token, get_tokens
+from robot.errors import DataError
 from robot.parsing import get_model
+from robot.parsing.model.blocks import For, If, Try, While
+from robot.running.arguments.embedded import EmbeddedArguments
 
-print("✅ Robot Framework imports successful!")
+from rf_auto_generator.metrics import measure, quiet_requested
+from rf_auto_generator.parse_cache import ParseCache
 
+if not quiet_requested():
+    print("✅ Robot Framework imports successful!")
 
-@dataclass
+
+def _interned(values) -> Tuple[str, ...]:
+    """Tuple of interned strings, so repeated names share one object."""
+    return tuple(sys.intern(str(v)) for v in values)
+
+
+@dataclass(slots=True)
+class ParsedStep:
+    """
+    Represents one step of a keyword body.
+    
+    kind is 'KEYWORD' for keyword calls (name/args/assign) or the RF control
+    structure type ('IF', 'ELSE IF', 'ELSE', 'FOR', 'WHILE', 'TRY', 'EXCEPT',
+    'FINALLY', 'RETURN', 'VAR', 'BREAK', 'CONTINUE', ...). Blocks keep their
+    nested steps in body, and IF/TRY chain their next branch through orelse.
+    VAR keeps its scope/separator options and WHILE its limit/on_limit/
+    on_limit_message options as "option=value" in assign.
+    """
+    kind: str
+    name: str = ""
+    args: Tuple[str, ...] = ()
+    assign: Tuple[str, ...] = ()
+    body: Tuple['ParsedStep', ...] = ()
+    orelse: Optional['ParsedStep'] = None
+    
+    def __post_init__(self):
+        self.kind = sys.intern(self.kind)
+        self.name = sys.intern(self.name)
+        self.args = _interned(self.args)
+        self.assign = _interned(self.assign)
+        self.body = tuple(self.body)
+        
+
+@dataclass(slots=True)
 class ParsedKeyword:
-    """Represents a parsed RF keyword."""
+    """
+    Represents a parsed RF keyword.
+    
+    Stored compactly: no per-instance __dict__, sequences frozen into tuples
+    and names/body lines interned, since the same library calls and source
+    paths repeat across thousands of keywords.
+    """
     name: str
-    args: List[str] = field(default_factory=list)
+    args: Tuple[str, ...] = ()
     doc: str = ""
-    body: List[str] = field(default_factory=list)
+    body: Tuple[str, ...] = ()
     return_value: bool = False
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
+    source_file: str = ""
+    rf_name: str = ""  # Name as written, including embedded ${args}
+    steps: Tuple[ParsedStep, ...] = ()
+    
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
+        self.args = _interned(self.args)
+        self.body = _interned(self.body)
+        self.tags = _interned(self.tags)
+        self.source_file = sys.intern(self.source_file)
+        self.rf_name = sys.intern(self.rf_name)
+        self.steps = tuple(self.steps)
+        
+
+@dataclass(slots=True)
+class ParsedTestCase:
+    """
+    Represents a parsed RF test case.
+    
+    setup/teardown are the effective fixtures (the test's own, else the
+    suite's Test Setup/Test Teardown) as KEYWORD steps, None when disabled.
+    """
+    name: str
+    tags: Tuple[str, ...] = ()
+    steps: Tuple[ParsedStep, ...] = ()
+    setup: Optional[ParsedStep] = None
+    teardown: Optional[ParsedStep] = None
     source_file: str = ""
     
+    def __post_init__(self):
+        self.tags = _interned(self.tags)
+        self.steps = tuple(self.steps)
+        self.source_file = sys.intern(self.source_file)
+        
 
-@dataclass
+@dataclass(slots=True)
 class ParsedResource:
     """Represents a parsed RF resource file."""
     filename: str
@@ -33,13 +116,28 @@ class ParsedResource:
     variables: Dict[str, str] = field(default_factory=dict)
     imports: List[str] = field(default_factory=list)
     library_imports: List[str] = field(default_factory=list)
+    tests: List[ParsedTestCase] = field(default_factory=list)
     
 
 class RFNativeParser:
     """Parser using Robot Framework's native parsing API."""
     
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, use_cache: bool = True, cache_dir: Optional[str] = None,
+                 quiet: Optional[bool] = None):
         self.project_root = Path(project_root)
+        self.quiet = quiet_requested() if quiet is None else quiet
+        
+        # Parsed results are cached on disk keyed by content hash + RF version
+        self.cache: Optional[ParseCache] = None
+        if use_cache:
+            self.cache = ParseCache(cache_dir or self.project_root / ".rf_parse_cache")
+            
+        # Tracebacks of files that failed in the last parse_directory run
+        self.parse_errors: Dict[str, str] = {}
+        
+        # Per-file timings (seconds, cpu_seconds, peak_rss_bytes, cached) of
+        # every file parsed through parse_directory/iter_directory
+        self.file_stats: Dict[str, Dict] = {}
         
     def _extract_keyword_name_and_args(self, full_name: str) -> tuple[str, List[str]]:
         """
@@ -47,29 +145,91 @@ class RFNativeParser:
         
         RF Format: "Keyword Name [Arguments] ${arg1} ${arg2}"
         Returns: ("Keyword Name", ["arg1", "arg2"])
+        
+        RF treats the inline ${args} as embedded arguments, so they are parsed
+        the way RF (and the call graph's EmbeddedMatcher) parses them:
+        "${count:\\d+}" is argument count. Names without [Arguments] keep
+        their embedded ${args} in the name.
         """
+        try:
+            embedded = EmbeddedArguments.from_name(full_name)
+        except DataError:
+            embedded = None  # RF rejects the keyword; generate it without arguments
+        args = list(embedded.args) if embedded else []
+        
         # Check if [Arguments] is inline in the keyword name
         if '[Arguments]' in full_name:
-            parts = full_name.split('[Arguments]')
-            keyword_name = parts[0].strip()
-            
-            # Extract arguments from the second part
-            args = []
-            if len(parts) > 1:
-                args_str = parts[1].strip()
-                # Find all ${varname} patterns
-                arg_matches = re.findall(r'\$\{([^}]+)\}', args_str)
-                args = arg_matches
-                
-            return keyword_name, args
-        else:
-            # No inline arguments
-            return full_name.strip(), []
+            return full_name.split('[Arguments]')[0].strip(), args
+        return full_name.strip(), args
         
     def parse_robot_file(self, filepath: str) -> ParsedResource:
-        """Parse a .robot file using RF's native parser."""
+        """Parse a .robot file using RF's native parser (checking the parse cache first)."""
+        filepath = Path(filepath)
+        
+        if self.cache is None:
+            return self._parse_model(filepath)
+            
+        cache_key = self.cache.make_key(filepath, filepath.read_bytes())
+        result = self.cache.load(cache_key)
+        if result is None:
+            result = self._parse_model(filepath)
+            self.cache.store(cache_key, result)
+        return result
+        
+    def parse_variables_file(self, filepath: str) -> ParsedResource:
+        """
+        Fast path for variables-only files (locators, constants, configs).
+        
+        Reads the file with RF's tokenizer (robot.api.get_tokens) and never
+        builds the model. Resource/Library settings are kept too; a file that
+        turns out to define keywords or tests falls back to parse_robot_file.
+        Results share the parse cache with parse_robot_file.
+        """
         filepath = Path(filepath)
         
+        if self.cache is None:
+            return self._parse_variable_tokens(filepath) or self._parse_model(filepath)
+            
+        cache_key = self.cache.make_key(filepath, filepath.read_bytes())
+        result = self.cache.load(cache_key)
+        if result is None:
+            result = self._parse_variable_tokens(filepath) or self._parse_model(filepath)
+            self.cache.store(cache_key, result)
+        return result
+        
+    def _parse_variable_tokens(self, filepath: Path) -> Optional[ParsedResource]:
+        """Token-level parse; returns None if the file needs the full model."""
+        result = ParsedResource(
+            filename=filepath.name,
+            filepath=str(filepath)
+        )
+        
+        statement = []
+        for token in get_tokens(str(filepath), data_only=True):
+            if token.type in (Token.KEYWORD_HEADER, Token.TESTCASE_HEADER, Token.TASK_HEADER):
+                return None
+            if token.type != Token.EOS:
+                statement.append(token)
+                continue
+                
+            if statement:
+                first = statement[0]
+                if first.type == Token.VARIABLE:
+                    var_name = first.value
+                    if var_name.endswith('='):
+                        var_name = var_name[:-1].rstrip()
+                    values = [t.value for t in statement if t.type == Token.ARGUMENT]
+                    result.variables[var_name.strip('${}@&')] = ' '.join(values)
+                elif first.type == Token.RESOURCE and len(statement) > 1:
+                    result.imports.append(statement[1].value)
+                elif first.type == Token.LIBRARY and len(statement) > 1:
+                    result.library_imports.append(sys.intern(statement[1].value))
+            statement = []
+            
+        return result
+        
+    def _parse_model(self, filepath: Path) -> ParsedResource:
+        """Build a ParsedResource from RF's model of the file."""
         model = get_model(str(filepath))
         
         result = ParsedResource(
@@ -77,6 +237,10 @@ class RFNativeParser:
             filepath=str(filepath)
         )
         
+        # Suite-level test settings, applied to the tests afterwards
+        suite = {'setup': None, 'teardown': None, 'template': None, 'test_tags': [], 'default_tags': []}
+        test_nodes = []
+        
         # Parse all sections
         for section in model.sections:
             if not hasattr(section, 'header') or not section.header:
@@ -91,7 +255,15 @@ class RFNativeParser:
                     if item_type == 'RESOURCE' and hasattr(item, 'name'):
                         result.imports.append(item.name)
                     elif item_type == 'LIBRARY' and hasattr(item, 'name'):
-                        result.library_imports.append(item.name)
+                        result.library_imports.append(sys.intern(item.name))
+                    elif item_type in ('TEST SETUP', 'TEST TEARDOWN'):
+                        suite[item_type.split()[1].lower()] = self._fixture_step(item)
+                    elif item_type == 'TEST TEMPLATE':
+                        suite['template'] = item.value
+                    elif item_type == 'TEST TAGS':
+                        suite['test_tags'] = list(item.values)
+                    elif item_type == 'DEFAULT TAGS':
+                        suite['default_tags'] = list(item.values)
                         
             # Variables section
             elif header_type == 'VARIABLE HEADER':
@@ -109,8 +281,49 @@ class RFNativeParser:
                         if parsed_kw:
                             result.keywords.append(parsed_kw)
                             
+            # Test cases section
+            elif header_type in ('TESTCASE HEADER', 'TASK HEADER'):
+                test_nodes.extend(item for item in section.body if getattr(item, 'name', None))
+                
+        for test_node in test_nodes:
+            result.tests.append(self._parse_test(test_node, suite, str(filepath)))
+            
         return result
         
+    def _fixture_step(self, node) -> Optional[ParsedStep]:
+        """Setup/teardown setting as a KEYWORD step (None if missing or NONE)."""
+        if not node.name or node.name.upper() == 'NONE':
+            return None
+        return ParsedStep(kind='KEYWORD', name=node.name, args=list(node.args))
+        
+    def _parse_test(self, test_node, suite: Dict, source_file: str) -> ParsedTestCase:
+        """Parse one test case, applying the suite's test settings."""
+        fields = {'setup': suite['setup'], 'teardown': suite['teardown']}
+        tags = None
+        template = suite['template']
+        steps = []
+        
+        for item in test_node.body:
+            item_type = getattr(item, 'type', None)
+            if item_type == 'TAGS':
+                tags = list(item.values)
+            elif item_type in ('SETUP', 'TEARDOWN'):
+                fields[item_type.lower()] = self._fixture_step(item)
+            elif item_type == 'TEMPLATE':
+                template = item.value if item.value and item.value.upper() != 'NONE' else None
+            elif item_type != 'ARGUMENT':
+                step = self._parse_step(item)
+                if step:
+                    steps.append(step)
+                    
+        if template:
+            # Templated tests run the template keyword with each data row
+            steps = [ParsedStep(kind='KEYWORD', name=template)]
+            
+        all_tags = suite['test_tags'] + (tags if tags is not None else suite['default_tags'])
+        return ParsedTestCase(name=test_node.name, tags=list(dict.fromkeys(all_tags)), steps=steps,
+                              source_file=source_file, **fields)
+        
     def _parse_keyword(self, keyword_node, source_file: str) -> Optional[ParsedKeyword]:
         """Parse a single keyword with CORRECT argument extraction."""
         if not hasattr(keyword_node, 'name') or not keyword_node.name:
@@ -118,18 +331,35 @@ class RFNativeParser:
         
         # Extract keyword name and inline arguments
         keyword_name, inline_args = self._extract_keyword_name_and_args(keyword_node.name)
+        
+        # Fields are collected first; ParsedKeyword freezes them into tuples
+        fields = {
+            'args': list(inline_args),  # Start with inline args
+            'doc': "",
+            'body': [],
+            'return_value': False,
+            'tags': [],
+            'steps': [],
+        }
+        
+        # Parse keyword body
+        if hasattr(keyword_node, 'body'):
+            fields['steps'] = self._parse_steps(keyword_node.body)
+            self._parse_keyword_body(keyword_node.body, fields)
             
-        kw = ParsedKeyword(
+        return ParsedKeyword(
             name=keyword_name,
-            args=inline_args,  # Start with inline args
-            source_file=source_file
+            source_file=source_file,
+            rf_name=' '.join(keyword_node.name.split()),
+            **fields
         )
         
-        # Parse keyword body
-        if not hasattr(keyword_node, 'body'):
-            return kw
-            
-        for item in keyword_node.body:
+    def _parse_keyword_body(self, nodes, fields: Dict):
+        """Collect settings and called keyword names from a keyword body."""
+        args = fields['args']
+        body = fields['body']
+        
+        for item in nodes:
             item_type = getattr(item, 'type', None) if hasattr(item, 'type') else None
             
             if not item_type:
@@ -144,76 +374,214 @@ class RFNativeParser:
                             val = token.value.strip()
                             if val.startswith('${') and val.endswith('}'):
                                 arg_name = val.strip('${}')
-                                if arg_name not in kw.args:  # Avoid duplicates
-                                    kw.args.append(arg_name)
+                                if arg_name not in args:  # Avoid duplicates
+                                    args.append(arg_name)
                                 
             elif item_type == 'DOCUMENTATION':
                 if hasattr(item, 'value'):
-                    kw.doc = item.value
+                    fields['doc'] = item.value
                 elif hasattr(item, 'tokens'):
-                    kw.doc = ' '.join(t.value for t in item.tokens if hasattr(t, 'value') and t.value)
+                    fields['doc'] = ' '.join(t.value for t in item.tokens if hasattr(t, 'value') and t.value)
                     
             elif item_type == 'TAGS':
                 if hasattr(item, 'values'):
-                    kw.tags = list(item.values)
+                    fields['tags'] = list(item.values)
                     
             elif 'RETURN' in item_type:
-                kw.return_value = True
+                fields['return_value'] = True
                 
             elif 'KEYWORD' in item_type or item_type in ['IF', 'FOR', 'WHILE', 'TRY']:
                 if hasattr(item, 'keyword') and item.keyword:
-                    kw.body.append(str(item.keyword))
+                    body.append(str(item.keyword))
                 elif hasattr(item, 'name') and item.name:
-                    kw.body.append(str(item.name))
+                    body.append(str(item.name))
                     
-        return kw
+    def _parse_steps(self, nodes) -> List[ParsedStep]:
+        """Convert RF body nodes into ParsedStep trees (settings and comments are skipped)."""
+        steps = []
+        for node in nodes:
+            step = self._parse_step(node)
+            if step:
+                steps.append(step)
+        return steps
+        
+    def _parse_step(self, node) -> Optional[ParsedStep]:
+        """Convert a single RF body node into a ParsedStep."""
+        node_type = getattr(node, 'type', None) or node.__class__.__name__.upper()
+        
+        if node_type == 'KEYWORD':
+            return ParsedStep(kind='KEYWORD', name=node.keyword or '',
+                              args=list(node.args), assign=list(node.assign))
+            
+        if isinstance(node, If):
+            return ParsedStep(kind='IF' if node_type == 'INLINE IF' else node_type,
+                              args=[node.condition] if node.condition else [],
+                              assign=list(getattr(node, 'assign', ()) or ()),
+                              body=self._parse_steps(node.body),
+                              orelse=self._parse_step(node.orelse) if node.orelse else None)
+            
+        if isinstance(node, Try):
+            return ParsedStep(kind=node_type, name=node.pattern_type or '',
+                              args=list(node.patterns or ()),
+                              assign=[node.assign] if node.assign else [],
+                              body=self._parse_steps(node.body),
+                              orelse=self._parse_step(node.next) if node.next else None)
+            
+        if isinstance(node, For):
+            return ParsedStep(kind='FOR', name=node.flavor or '', args=list(node.values),
+                              assign=list(node.assign), body=self._parse_steps(node.body))
+            
+        if isinstance(node, While):
+            return ParsedStep(kind='WHILE', args=[node.condition] if node.condition else [],
+                              assign=[f"{option}={getattr(node, option)}"
+                                      for option in ('limit', 'on_limit', 'on_limit_message')
+                                      if getattr(node, option) is not None],
+                              body=self._parse_steps(node.body))
+            
+        if node_type in ('RETURN STATEMENT', 'RETURN'):
+            return ParsedStep(kind='RETURN', args=list(node.values))
+            
+        if node_type == 'VAR':
+            return ParsedStep(kind='VAR', name=node.name, args=list(node.value),
+                              assign=[f"{option}={getattr(node, option)}" for option in ('scope', 'separator')
+                                      if getattr(node, option) is not None])
+            
+        if node_type in ('BREAK', 'CONTINUE'):
+            return ParsedStep(kind=node_type)
+            
+        if hasattr(node, 'body') and hasattr(node, 'header'):
+            # Other blocks (e.g. GROUP) - keep their nested steps
+            return ParsedStep(kind=node_type, name=getattr(node, 'name', '') or '',
+                              body=self._parse_steps(node.body))
+            
+        return None
         
-    def parse_directory(self, directory: str, pattern: str = "*.robot") -> List[ParsedResource]:
-        """Parse all .robot files in a directory."""
+    def parse_directory(self, directory: str, pattern: str = "*.robot", jobs: int = 1) -> List[ParsedResource]:
+        """
+        Parse all .robot files in a directory.
+        
+        With jobs > 1 the files are fanned out to a process pool (jobs=0 uses
+        one worker per CPU). Results are always returned in sorted file order,
+        and a file that fails to parse is reported without stopping the others.
+        """
+        return list(self.iter_directory(directory, pattern, jobs))
+        
+    def iter_directory(self, directory: str, pattern: str = "*.robot", jobs: int = 1) -> Iterator[ParsedResource]:
+        """
+        Yield parsed .robot files one at a time, in sorted file order.
+        
+        Streaming counterpart of parse_directory: only a bounded number of
+        parse results exist at once, so memory does not grow with the corpus.
+        """
         directory = Path(directory)
-        results = []
+        robot_files = [f for f in sorted(directory.rglob(pattern)) if f.is_file()]
+        self.parse_errors = {}
         
-        for robot_file in sorted(directory.rglob(pattern)):
-            if robot_file.is_file():
-                try:
-                    parsed = self.parse_robot_file(robot_file)
-                    results.append(parsed)
-                    
-                    # Show parsed details
-                    print(f"✅ Parsed: {robot_file.name}")
-                    print(f"   Keywords: {len(parsed.keywords)}")
-                    if parsed.keywords:
-                        for kw in parsed.keywords[:3]:  # Show first 3
-                            print(f"     - {kw.name} ({len(kw.args)} args: {', '.join(kw.args)})")
-                        if len(parsed.keywords) > 3:
-                            print(f"     ... and {len(parsed.keywords) - 3} more")
-                    
-                except Exception as e:
-                    print(f"⚠️  Failed to parse {robot_file.name}: {e}")
-                    import traceback
-                    traceback.print_exc()
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+            
+        parallel = jobs > 1 and len(robot_files) > 1
+        if parallel:
+            outcomes = self._parse_files_parallel(robot_files, jobs)
+        else:
+            outcomes = (self._parse_file_safely(f) for f in robot_files)
+            
+        for robot_file, (parsed, error, stats) in zip(robot_files, outcomes):
+            self.file_stats[str(robot_file)] = stats
+            if parallel and self.cache:
+                # Workers have their own cache objects; keep this one's counters complete
+                if stats["cached"]:
+                    self.cache.hits += 1
+                else:
+                    self.cache.misses += 1
+            if error:
+                self.parse_errors[str(robot_file)] = error
+                print(f"⚠️  Failed to parse {robot_file.name}: {error.strip().splitlines()[-1]}")
+                if not self.quiet:
+                    print(error, end='')
+                continue
+                
+            if self.quiet:
+                yield parsed
+                continue
+                
+            # Show parsed details
+            print(f"✅ Parsed: {robot_file.name}")
+            print(f"   Keywords: {len(parsed.keywords)}")
+            if parsed.keywords:
+                for kw in parsed.keywords[:3]:  # Show first 3
+                    print(f"     - {kw.name} ({len(kw.args)} args: {', '.join(kw.args)})")
+                if len(parsed.keywords) > 3:
+                    print(f"     ... and {len(parsed.keywords) - 3} more")
                     
-        return results
+            yield parsed
+            
+    def _parse_file_safely(self, robot_file: Path) -> tuple[Optional[ParsedResource], Optional[str], Dict]:
+        """Parse one file, returning (parsed, None, stats) or (None, formatted traceback, stats)."""
+        hits = self.cache.hits if self.cache else 0
+        parsed, error = None, None
+        with measure() as stats:
+            try:
+                parsed = self.parse_robot_file(robot_file)
+            except Exception:
+                error = traceback.format_exc()
+        stats["cached"] = bool(self.cache and self.cache.hits > hits)
+        return parsed, error, stats
+            
+    def _parse_files_parallel(self, robot_files: List[Path], jobs: int):
+        """
+        Parse files across a process pool, yielding outcomes in input order.
         
-    def analyze_keyword_dependencies(self, parsed_files: List[ParsedResource]) -> Dict[str, Set[str]]:
-        """Analyze keyword dependencies."""
-        dependencies = {}
+        Only a few files per worker are in flight at a time, so finished parse
+        results never pile up ahead of a slower consumer.
+        """
+        window = jobs * 4
+        with ProcessPoolExecutor(max_workers=jobs,
+                                 initializer=_init_parse_worker,
+                                 initargs=(str(self.project_root), self.cache is not None,
+                                           str(self.cache.cache_dir) if self.cache else None)) as executor:
+            remaining = iter(robot_files)
+            in_flight = deque(executor.submit(_parse_in_worker, f) for f in islice(remaining, window))
+            while in_flight:
+                outcome = in_flight.popleft().result()
+                next_file = next(remaining, None)
+                if next_file is not None:
+                    in_flight.append(executor.submit(_parse_in_worker, next_file))
+                yield outcome
+        
+    def analyze_keyword_dependencies(self, parsed_files: List[ParsedResource],
+                                     symbol_tables: Optional[Dict] = None) -> Dict[str, Set[str]]:
+        """
+        Analyze keyword dependencies.
+        
+        Builds a KeywordCallGraph (kept in self.call_graph for callers/reachability
+        queries) and returns keyword name -> lowercased names of the user keywords
+        it calls directly. Pass ResourceResolver symbol tables to only resolve
+        calls to keywords the caller's file actually imports.
+        """
+        from rf_auto_generator.call_graph import KeywordCallGraph
+        
+        self.call_graph = KeywordCallGraph(parsed_files, symbol_tables)
         
-        all_keywords = {}
-        for pf in parsed_files:
-            for kw in pf.keywords:
-                all_keywords[kw.name.lower()] = kw
+        dependencies = {}
+        for kw_id, callees in self.call_graph.calls.items():
+            if callees:
+                kw = self.call_graph.keywords[kw_id]
+                dependencies[kw.name] = {self.call_graph.keywords[c].name.lower() for c in callees}
                 
-        for pf in parsed_files:
-            for kw in pf.keywords:
-                deps = set()
-                for body_item in kw.body:
-                    body_lower = body_item.lower()
-                    for known_kw in all_keywords.keys():
-                        if known_kw in body_lower:
-                            deps.add(known_kw)
-                            
-                if deps:
-                    dependencies[kw.name] = deps
-                    
         return dependencies
+
+
+# Per-process parser used by the parse_directory worker pool.
+_worker_parser: Optional[RFNativeParser] = None
+
+
+def _init_parse_worker(project_root: str, use_cache: bool, cache_dir: Optional[str]):
+    """Create the parser once in each worker process."""
+    global _worker_parser
+    _worker_parser = RFNativeParser(project_root, use_cache=use_cache, cache_dir=cache_dir, quiet=True)
+    
+
+def _parse_in_worker(robot_file: Path) -> tuple[Optional[ParsedResource], Optional[str], Dict]:
+    """Worker entry point: parse one file and capture any error as text."""
+    return _worker_parser._parse_file_safely(robot_file)
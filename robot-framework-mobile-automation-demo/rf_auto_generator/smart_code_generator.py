@@ -1,10 +1,70 @@
 """
 Smart code generator that creates proper implementations based on keyword analysis.
 """
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import compileall
+import hashlib
+import importlib.util
+import multiprocessing
+import os
+import py_compile
 import re
+import tempfile
+
+from robot.utils import normalize
+from robot.variables import contains_variable
+
+from rf_auto_generator.keyword_compiler import VARIABLES_MODULE, CompileError, KeywordCompiler
+from rf_auto_generator.library_specs import LibrarySpecs
+from rf_auto_generator.metrics import measure, quiet_requested
 from rf_auto_generator.rf_native_parser import ParsedResource, ParsedKeyword
+from rf_auto_generator.stub_generator import module_stub
+from rf_auto_generator.variable_resolver import VariableResolver, python_expression
+
+# Generated method bodies that still need a hand-written implementation
+_PLACEHOLDER = re.compile(r'^ +pass  # ', re.MULTILINE)
+
+# Permissions of newly written files, as open(path, 'w') would create them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Up to this many modules are byte-compiled without starting worker processes
+_SERIAL_COMPILE_MAX = 8
+
+# Resources with more keywords are split into shard modules behind a facade
+SHARD_SIZE = 500
+
+# Generated module dispatching RF keyword names (see generate_keyword_registry)
+REGISTRY_MODULE = "keyword_registry"
+
+# Library behind the bridge; without the compiler, keywords calling its
+# keywords (per its libdoc spec) get library-call bodies
+BRIDGED_LIBRARY = "AppiumLibrary"
+
+# AppiumLibrary locator prefixes that map to a single AppiumBy strategy. Others
+# (identifier, jquery, ios, tag-constrained lookups) keep the RF locator string.
+LOCATOR_STRATEGIES = {
+    'id': 'ID',
+    'name': 'NAME',
+    'xpath': 'XPATH',
+    'class': 'CLASS_NAME',
+    'accessibility_id': 'ACCESSIBILITY_ID',
+    'android': 'ANDROID_UIAUTOMATOR',
+    'viewtag': 'ANDROID_VIEWTAG',
+    'data_matcher': 'ANDROID_DATA_MATCHER',
+    'view_matcher': 'ANDROID_VIEW_MATCHER',
+    'css': 'CSS_SELECTOR',
+    'predicate': 'IOS_PREDICATE',
+    'chain': 'IOS_CLASS_CHAIN',
+}
+
+LOCATOR_IMPORTS = (
+    "from appium.webdriver.common.appiumby import AppiumBy",
+    "from pytest_rf_bridge.locators import Locator",
+)
 
 
 class SmartCodeGenerator:
@@ -16,24 +76,54 @@ class SmartCodeGenerator:
     - RF library usage
     """
     
-    def __init__(self, output_dir: str = "pytest_rf_bridge/auto_generated"):
+    def __init__(self, output_dir: str = "pytest_rf_bridge/auto_generated", quiet: bool = None,
+                 shard_size: int = SHARD_SIZE, stubs: bool = True, platform: str = None,
+                 specs: Optional[LibrarySpecs] = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.quiet = quiet_requested() if quiet is None else quiet
+        
+        # Max keywords per generated module (0 = never shard); see _sharded_code
+        self.shard_size = shard_size
+        
+        # Write a .pyi stub next to every generated module
+        self.stubs = stubs
         
-        # Track all generated keywords to avoid conflicts
-        self.generated_keywords = set()
-        
-        # Map of RF library keywords to bridge methods
-        self.library_mapping = {
-            'Open Application': 'self.bridge.appium.open_application',
-            'Close Application': 'self.bridge.close_application',
-            'Click Element': 'self.bridge.click_element',
-            'Input Text': 'self.bridge.input_text',
-            'Wait Until Element Is Visible': 'self.bridge.appium.wait_until_element_is_visible',
-            'Wait Until Page Contains Element': 'self.bridge.appium.wait_until_page_contains_element',
-            'Element Text Should Be': 'self.bridge.element_text_should_be',
-            'Set Appium Timeout': 'self.bridge.appium.set_appium_timeout',
-        }
+        # Platform the package is specialized for (e.g. 'ANDROID'): PLATFORM_NAME
+        # is pinned, and conditions over constants are folded by the compiler
+        self.platform = platform
+        
+        # Modules written since the last byte_compile
+        self.written_files: Set[Path] = set()
+        
+        # Files (modules and stubs) rewritten vs left alone because unchanged
+        self.write_counts = {"written": 0, "skipped": 0}
+        
+        # Per-module timings and counts (see _generate_module)
+        self.file_stats: Dict[str, Dict] = {}
+        
+        # Keyword body compiler (see enable_compiler) and the rf_variables
+        # constants it can reference (normalized RF name -> constant)
+        self.compiler = None
+        self.variable_constants: Dict[str, str] = {}
+        
+        # rf_variables constant -> value the compiler may fold (platform packages only)
+        self.constant_values: Dict[str, str] = {}
+        
+        # Library keyword specs (libdoc), for the compiler and the fallback
+        self.specs = specs or LibrarySpecs(cache_dir=None)
+        
+    def enable_compiler(self, call_graph, parsed_files: Iterable[ParsedResource],
+                        specs: Optional[LibrarySpecs] = None):
+        """
+        Compile keyword bodies into Python calls instead of pattern-based stubs.
+        
+        call_graph resolves the keywords each body calls; parsed_files are all
+        resources that get a generated class (not only the ones regenerated
+        now). specs provides library keyword specs (default: the generator's).
+        Keywords the compiler cannot translate keep the old bodies.
+        """
+        self.compiler = KeywordCompiler(self, call_graph, parsed_files, specs or self.specs)
         
     def sanitize_name(self, name: str) -> str:
         """Convert RF keyword name to valid Python method name."""
@@ -59,7 +149,7 @@ class SmartCodeGenerator:
         name_lower = keyword.name.lower()
         
         # Check if it directly calls library keywords
-        if any(lib_kw.lower() in str(keyword.body).lower() for lib_kw in self.library_mapping.keys()):
+        if self.calls_bridged_library(keyword):
             return 'library_call'
             
         # Verification keywords
@@ -80,6 +170,15 @@ class SmartCodeGenerator:
             
         return 'action'  # Default
         
+    def calls_bridged_library(self, keyword: ParsedKeyword) -> bool:
+        """True if the keyword body directly calls a keyword of BRIDGED_LIBRARY (per its libdoc spec)."""
+        spec = self.specs.get(BRIDGED_LIBRARY)
+        if spec is None:
+            return False
+        prefix = f"{BRIDGED_LIBRARY}."
+        return any(spec.keyword(name[len(prefix):] if name.startswith(prefix) else name)
+                   for name in keyword.body)
+        
     def generate_implementation(self, keyword: ParsedKeyword, locators: Dict[str, str]) -> str:
         """
         Generate smart implementation based on keyword analysis.
@@ -124,8 +223,8 @@ class SmartCodeGenerator:
             return "        pass  # Input text - args needed"
             
         elif 'open' in name_lower and 'application' in name_lower:
-            if 'android' in name_lower:
-                return "        self.bridge.open_android_application()"
+            if 'ios' in name_lower.split():
+                return "        self.bridge.open_ios_application()"
             return "        self.bridge.open_android_application()"
             
         elif 'close' in name_lower and 'application' in name_lower:
@@ -190,10 +289,24 @@ class SmartCodeGenerator:
         impl += "        pass  # TODO: Implement composite workflow"
         return impl
         
+    def class_name_for(self, filename: str) -> str:
+        """Name of the class generated from a resource file."""
+        return f"{Path(filename).stem.replace('Po', '').replace('Screen', '').replace('Bar', '')}Keywords"
+        
+    def module_name_for(self, filename: str) -> str:
+        """Name of the module generated from a resource file."""
+        return f"{self.sanitize_name(Path(filename).stem.replace('Po', ''))}_keywords"
+        
     def generate_class(self, parsed: ParsedResource, locators: Dict[str, str] = None) -> str:
         """Generate complete Python class from parsed RF resource."""
-        base_name = Path(parsed.filename).stem.replace('Po', '').replace('Screen', '').replace('Bar', '')
-        class_name = f"{base_name}Keywords"
+        return self._class_code(parsed, locators)[0]
+        
+    def _class_code(self, parsed: ParsedResource, locators: Dict[str, str] = None) -> Tuple[str, int]:
+        """Module code for a resource and the number of keywords whose bodies were compiled."""
+        class_name = self.class_name_for(parsed.filename)
+        base_name = class_name[:-len('Keywords')]
+        methods, imports, collaborators, compiled_count = self._method_code(parsed.keywords, locators)
+        locator_code = self._locator_code(locators, imports)
         
         code = f'''"""
 Auto-generated from: {parsed.filename}
@@ -202,7 +315,9 @@ Libraries: {', '.join(parsed.library_imports)}
 
 Generated using RF native parser - handles ALL RF syntax correctly.
 """
-
+'''
+        code += self._import_code(imports, collaborators)
+        code += f'''
 
 class {class_name}:
     """
@@ -212,14 +327,7 @@ class {class_name}:
     """
     
 '''
-        
-        # Add locators as class constants
-        if locators:
-            code += "    # Locators\n"
-            for loc_name, loc_value in locators.items():
-                const_name = self._locator_to_const(loc_name)
-                code += f'    {const_name} = "{loc_value}"\n'
-            code += "\n"
+        code += locator_code
             
         # Constructor
         code += '''    def __init__(self, bridge):
@@ -228,11 +336,189 @@ class {class_name}:
         
 '''
         
-        # Generate methods for each keyword
-        for kw in parsed.keywords:
-            method_code = self._generate_method(kw, locators or {})
-            code += method_code
+        code += self._collaborator_code(collaborators)
+        code += "".join(methods)
+        return code, compiled_count
+        
+    def _sharded_code(self, parsed: ParsedResource, locators: Dict[str, str] = None) -> Tuple[Dict[Path, str], int]:
+        """
+        Facade and shard modules for a resource with more than shard_size keywords.
+        
+        Keywords are split in file order into shards of at most shard_size.
+        The facade class keeps the public API: its KEYWORDS manifest maps each
+        method to its shard module, which is imported the first time one of
+        its keywords is used. Shards look attributes they lack (keywords of
+        other shards) up on the facade.
+        """
+        class_name = self.class_name_for(parsed.filename)
+        base_name = class_name[:-len('Keywords')]
+        output_file = self.output_file_for(parsed)
+        chunks = [parsed.keywords[i:i + self.shard_size] for i in range(0, len(parsed.keywords), self.shard_size)]
+        
+        modules: Dict[Path, str] = {}
+        keyword_modules: Dict[str, str] = {}
+        compiled_count = 0
+        first = 1
+        for index, keywords in enumerate(chunks, 1):
+            shard_module = f"{output_file.stem}_shard{index}"
+            for kw in keywords:
+                keyword_modules[self.sanitize_name(kw.name)] = shard_module
+            methods, imports, collaborators, compiled = self._method_code(keywords, locators)
+            locator_code = self._locator_code(locators, imports)
+            compiled_count += compiled
             
+            code = f'''"""
+Auto-generated from: {parsed.filename} (shard {index} of {len(chunks)})
+Keywords in this shard: {len(keywords)}
+
+Part of {output_file.stem}.{class_name}; use that class rather than this module.
+"""
+'''
+            code += self._import_code(imports, collaborators)
+            code += f'''
+
+class {class_name}Shard:
+    """Keywords {first}-{first + len(keywords) - 1} of {class_name}."""
+    
+'''
+            code += locator_code
+            code += f'''    def __init__(self, facade):
+        """Initialize with the {class_name} facade and its RF bridge."""
+        self.bridge = facade.bridge
+        self._facade = facade
+        
+    def __getattr__(self, name):
+        # Keywords of other shards
+        return getattr(self._facade, name)
+        
+'''
+            code += self._collaborator_code(collaborators)
+            code += "".join(methods)
+            modules[output_file.with_name(f"{shard_module}.py")] = code
+            first += len(keywords)
+            
+        entries = "".join(f"    {method!r}: {module!r},\n" for method, module in keyword_modules.items())
+        imports = {"import importlib"}
+        locator_code = self._locator_code(locators, imports)
+        code = f'''"""
+Auto-generated from: {parsed.filename}
+Total keywords: {len(parsed.keywords)} in {len(chunks)} shards of up to {self.shard_size}
+Libraries: {', '.join(parsed.library_imports)}
+
+Generated using RF native parser - handles ALL RF syntax correctly.
+"""
+{self._import_code(imports, {})}
+# Keyword method -> shard module defining it
+KEYWORDS = {{
+{entries}}}
+
+
+class {class_name}:
+    """
+    Wrapper for RF keywords from {base_name}.
+    
+    Keywords in this class: {len(parsed.keywords)} (in {len(chunks)} shards, loaded on first use)
+    """
+    
+'''
+        code += locator_code
+        code += f'''    def __init__(self, bridge):
+        """Initialize with RF bridge."""
+        self.bridge = bridge
+        self._shards = {{}}
+        
+    def __getattr__(self, name):
+        module = KEYWORDS.get(name)
+        if module is None:
+            raise AttributeError(f"{{type(self).__name__!r}} object has no attribute {{name!r}}")
+        if module not in self._shards:
+            shard = importlib.import_module(f".{{module}}", __package__)
+            self._shards[module] = shard.{class_name}Shard(self)
+        method = getattr(self._shards[module], name)
+        # Later lookups find the bound method without going through __getattr__
+        self.__dict__[name] = method
+        return method
+        
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(KEYWORDS))
+'''
+        modules[output_file] = code
+        return modules, compiled_count
+        
+    def _method_code(self, keywords: List[ParsedKeyword], locators: Dict[str, str] = None):
+        """
+        Generated methods of keywords, with the imports and collaborators
+        their compiled bodies need and the number of compiled bodies.
+        """
+        methods = []
+        imports: Set[str] = set()
+        collaborators: Dict[str, Tuple[str, str]] = {}
+        compiled_count = 0
+        for kw in keywords:
+            compiled = None
+            if self.compiler:
+                try:
+                    compiled = self.compiler.compile(kw, locators or {})
+                except CompileError as error:
+                    reason = ' '.join(str(error).split())
+                    methods.append(self._generate_method(kw, locators or {}, f"        # Not compiled: {reason}\n"))
+                    continue
+            if compiled:
+                compiled_count += 1
+                imports |= compiled.imports
+                collaborators.update(compiled.collaborators)
+                body = "\n".join(f"        {line}" for line in compiled.lines)
+                methods.append(self._generate_method(kw, locators or {}, impl=body))
+            else:
+                methods.append(self._generate_method(kw, locators or {}))
+        return methods, imports, collaborators, compiled_count
+        
+    def _import_code(self, imports: Set[str], collaborators: Dict[str, Tuple[str, str]]) -> str:
+        """Import block of a module: absolute imports, then one relative import line."""
+        imports = set(imports)
+        if collaborators:
+            imports.add("from functools import cached_property")
+        import_lines = sorted(line for line in imports if not line.startswith("from . "))
+        relative = sorted(line[len("from . import "):] for line in imports if line.startswith("from . import "))
+        if relative:
+            import_lines += [""] if import_lines else []
+            import_lines += [f"from . import {', '.join(relative)}"]
+        return "".join(f"{line}\n" for line in import_lines)
+        
+    def _locator_code(self, locators: Dict[str, str] = None, imports: Set[str] = None) -> str:
+        """
+        Locators as class constants. Locators with a single AppiumBy strategy
+        become pre-parsed Locator constants (adding their imports to imports);
+        the rest stay RF locator strings.
+        """
+        if not locators:
+            return ""
+        code = "    # Locators\n"
+        for loc_name, loc_value in locators.items():
+            const_name = self._locator_to_const(loc_name)
+            parsed = parse_locator(loc_value)
+            if parsed and imports is not None:
+                by, criteria = parsed
+                imports.update(LOCATOR_IMPORTS)
+                code += f'    {const_name} = Locator({_quoted(loc_value)}, AppiumBy.{by}, {_quoted(criteria)})\n'
+            else:
+                code += f'    {const_name} = {_quoted(loc_value)}\n'
+        return code + "\n"
+        
+    def _collaborator_code(self, collaborators: Dict[str, Tuple[str, str]]) -> str:
+        """
+        Properties for the keyword classes of other resources called by compiled
+        bodies; imported on first use so loading one module does not load its callees.
+        """
+        code = ""
+        for attribute, (module, other_class) in sorted(collaborators.items()):
+            code += f'''    @cached_property
+    def {attribute}(self):
+        """{other_class} sharing this bridge."""
+        from .{module} import {other_class}
+        return {other_class}(self.bridge)
+        
+'''
         return code
         
     def _locator_to_const(self, name: str) -> str:
@@ -241,8 +527,13 @@ class {class_name}:
         name = re.sub(r'([a-z])([A-Z])', r'\1_\2', name)
         return name.upper()
         
-    def _generate_method(self, kw: ParsedKeyword, locators: Dict) -> str:
-        """Generate a single method."""
+    def _generate_method(self, kw: ParsedKeyword, locators: Dict, impl: str = None) -> str:
+        """
+        Generate a single method.
+        
+        impl is a compiled body; without it (or when it is only a comment
+        line) the pattern-based implementation is used.
+        """
         method_name = self.sanitize_name(kw.name)
         py_args = [self.convert_arg_name(arg) for arg in kw.args]
         
@@ -254,7 +545,8 @@ class {class_name}:
         doc = kw.doc if kw.doc else f"Execute RF keyword: {kw.name}"
         
         # Generate implementation
-        impl = self.generate_implementation(kw, locators)
+        if impl is None or impl.endswith("\n"):
+            impl = (impl or "") + self.generate_implementation(kw, locators)
         
         code = f'''    def {method_name}(self{params}):
         """
@@ -269,31 +561,519 @@ class {class_name}:
 '''
         return code
         
-    def generate_all(self, parsed_files: List[ParsedResource], locators_map: Dict[str, Dict] = None) -> Dict[str, str]:
-        """Generate all wrapper files."""
+    def output_file_for(self, parsed: ParsedResource) -> Path:
+        """Path of the wrapper module generated from a resource."""
+        return self.output_dir / f"{self.module_name_for(parsed.filename)}.py"
+        
+    def shard_files_for(self, output_file: Path) -> List[Path]:
+        """Shard modules currently on disk for a generated module."""
+        return sorted(path for path in output_file.parent.glob(f"{output_file.stem}_shard*.py")
+                      if path.stem[len(output_file.stem) + len("_shard"):].isdigit())
+        
+    def uses_variables(self, output_file: Path) -> bool:
+        """True if a generated module (or one of its shards) imports the rf_variables module."""
+        imports = re.compile(rf"^from \. import .*\b{VARIABLES_MODULE}\b", re.MULTILINE)
+        return any(imports.search(path.read_text())
+                   for path in [output_file] + self.shard_files_for(output_file) if path.exists())
+        
+    def remove_module(self, module_file: Path):
+        """Delete a generated module with its stub and bytecode."""
+        module_file.unlink(missing_ok=True)
+        module_file.with_suffix('.pyi').unlink(missing_ok=True)
+        Path(importlib.util.cache_from_source(module_file)).unlink(missing_ok=True)
+        
+    def generate_all(self, parsed_files: List[ParsedResource], locators_map: Dict[str, Dict] = None,
+                     symbol_tables: Dict = None, jobs: int = 1) -> Dict[str, str]:
+        """
+        Generate all wrapper files.
+        
+        locators_map maps locator files to their variables. With symbol_tables
+        (from ResourceResolver, keyed by resolved file path) its keys are file
+        paths and a resource gets the locators of the locator files it imports;
+        without them, keys are base names matched against the resource name.
+        
+        With jobs other than 1 (0 = one per CPU), modules are rendered and
+        written in worker processes; the output is the same as with jobs=1.
+        """
+        parsed_files = self.plan_outputs(parsed_files)
         generated = {}
         
+        if jobs != 1 and len(parsed_files) > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            results = self._emit_parallel(parsed_files, locators_map, symbol_tables, jobs)
+        else:
+            results = (self._generate_module(parsed, locators_map, symbol_tables) for parsed in parsed_files)
+        for output_file, code in results:
+            generated[str(output_file)] = code
+            
+        return generated
+        
+    def plan_outputs(self, parsed_files: List[ParsedResource]) -> List[ParsedResource]:
+        """
+        Resolve output-file collisions before anything is written.
+        
+        Resources whose names map to the same module (e.g. LoginPo.robot in
+        two directories) would overwrite each other in order, so only the
+        last of them is kept. With that settled, every module can be emitted
+        independently of the others, in any order.
+        """
+        owners: Dict[Path, int] = {}
+        for index, parsed in enumerate(parsed_files):
+            output_file = self.output_file_for(parsed)
+            if output_file in owners:
+                print(f"   ⚠️  {parsed_files[owners[output_file]].filename} and {parsed.filename} both "
+                      f"generate {output_file.name}; keeping {parsed.filename}")
+            owners[output_file] = index
+        return [parsed_files[index] for index in sorted(owners.values())]
+        
+    def _emit_parallel(self, parsed_files: List[ParsedResource], locators_map: Dict[str, Dict],
+                       symbol_tables: Dict, jobs: int) -> Iterator[Tuple[Path, str]]:
+        """
+        Emit modules in forked worker processes; yields results in input order.
+        
+        Workers inherit the generator (compiler and call graph included) and
+        the inputs through fork instead of pickling them, and send back each
+        module's code, stats and written files. Progress lines and stats are
+        recorded here, in input order, exactly as the serial path would.
+        """
+        global _emit_state
+        if self.compiler:
+            # Load library specs once here rather than once per worker
+            self.compiler.preload_libraries()
+        _emit_state = (self, parsed_files, locators_map, symbol_tables)
+        workers = jobs or os.cpu_count() or 1
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(parsed_files)),
+                                     mp_context=multiprocessing.get_context('fork')) as executor:
+                chunksize = max(1, len(parsed_files) // (workers * 4))
+                for index, result in enumerate(executor.map(_emit_in_worker, range(len(parsed_files)),
+                                                            chunksize=chunksize)):
+                    output_file, code, stats, written, counts = result
+                    self.file_stats[str(output_file)] = stats
+                    self.written_files.update(written)
+                    for key, value in counts.items():
+                        self.write_counts[key] += value
+                    self._report(parsed_files[index], output_file, stats)
+                    yield output_file, code
+        finally:
+            _emit_state = None
+        
+    def generate_stream(self, parsed_files: Iterable[ParsedResource], locators_map: Dict[str, Dict] = None,
+                        symbol_tables: Dict = None) -> Iterator[Tuple[ParsedResource, Path]]:
+        """
+        Streaming counterpart of generate_all.
+        
+        Writes each module as soon as its resource arrives and yields
+        (parsed, output_file); the generated code is not kept, so once the
+        caller drops the parsed resource nothing of it stays in memory.
+        """
         for parsed in parsed_files:
-            base_name = Path(parsed.filename).stem.replace('Po', '')
+            output_file, _ = self._generate_module(parsed, locators_map, symbol_tables)
+            yield parsed, output_file
             
-            # Get locators for this file
-            locators = {}
-            if locators_map:
-                # Try to find matching locators
-                for loc_key, loc_vars in locators_map.items():
-                    if loc_key.lower() in base_name.lower():
-                        locators = loc_vars
-                        break
-                        
-            # Generate class
-            code = self.generate_class(parsed, locators)
+    def _generate_module(self, parsed: ParsedResource, locators_map: Dict[str, Dict] = None,
+                         symbol_tables: Dict = None) -> Tuple[Path, str]:
+        """Generate and write the wrapper module for one resource."""
+        with measure() as stats:
+            locators = self._locators_for(parsed, locators_map, symbol_tables)
             
-            # Write to file
-            output_file = self.output_dir / f"{self.sanitize_name(base_name)}_keywords.py"
-            with open(output_file, 'w') as f:
-                f.write(code)
+            # Generate class (a facade plus shard modules for big resources)
+            output_file = self.output_file_for(parsed)
+            if self.shard_size and len(parsed.keywords) > self.shard_size:
+                modules, compiled_count = self._sharded_code(parsed, locators)
+            else:
+                code, compiled_count = self._class_code(parsed, locators)
+                modules = {output_file: code}
                 
-            generated[str(output_file)] = code
-            print(f"✅ Generated: {output_file.name} ({len(parsed.keywords)} keywords)")
+            # Write to file (unchanged modules are left alone)
+            stats["written"] = sum(self.write_if_changed(module_file, module_code)
+                                   for module_file, module_code in modules.items())
+            for shard_file in self.shard_files_for(output_file):
+                if shard_file not in modules:
+                    self.remove_module(shard_file)
+            code = modules[output_file]
+            self._write_stubs(modules, output_file, self.class_name_for(parsed.filename))
+                
+        stats["keywords"] = len(parsed.keywords)
+        stats["compiled"] = compiled_count
+        stats["shards"] = len(modules) - 1
+        stats["placeholders"] = sum(len(_PLACEHOLDER.findall(c)) for c in modules.values())
+        self.file_stats[str(output_file)] = stats
+        
+        self._report(parsed, output_file, stats)
+        return output_file, code
+        
+    def _report(self, parsed: ParsedResource, output_file: Path, stats: Dict):
+        """Progress line for a generated module."""
+        if not self.quiet:
+            shards = f" in {stats['shards']} shards" if stats["shards"] else ""
+            unchanged = "" if stats["written"] else ", unchanged"
+            print(f"✅ Generated: {output_file.name} ({len(parsed.keywords)} keywords{shards}{unchanged})")
+        
+    def _write_stubs(self, modules: Dict[Path, str], output_file: Path, class_name: str):
+        """Write (or, with stubs off, remove) the .pyi stubs of a resource's modules."""
+        shard_codes = [code for path, code in modules.items() if path != output_file]
+        for module_file, module_code in modules.items():
+            stub_file = module_file.with_suffix('.pyi')
+            if not self.stubs:
+                stub_file.unlink(missing_ok=True)
+            elif module_file == output_file:
+                self.write_if_changed(stub_file, module_stub(module_code, module_file.name, shard_codes))
+            else:
+                self.write_if_changed(stub_file, module_stub(module_code, module_file.name,
+                                                             facade=(output_file.stem, class_name)))
+                
+    def write_if_changed(self, path: Path, text: str) -> bool:
+        """
+        Write text to path unless the file already has exactly this content.
+        
+        Unchanged files keep their mtime, so __pycache__, file watchers and
+        build caches are not invalidated. Changed files are written to a
+        temporary file in the same directory and renamed over the target, so
+        readers never see a half-written module. Returns True if written.
+        """
+        data = text.encode()
+        try:
+            existing = path.stat()
+        except FileNotFoundError:
+            existing = None
+        if existing and existing.st_size == len(data) and \
+                hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(data).digest():
+            self.write_counts["skipped"] += 1
+            return False
             
-        return generated
+        mode = existing.st_mode & 0o777 if existing else 0o666 & ~_UMASK
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self.write_counts["written"] += 1
+        if path.suffix == '.py':
+            self.written_files.add(path)
+        return True
+                
+    def byte_compile(self, workers: int = 0) -> int:
+        """
+        Byte-compile generated modules ahead of the first import; returns the
+        number compiled.
+        
+        Modules written since the last call and modules without bytecode are
+        compiled with compileall semantics, in worker processes when workers
+        is not 1 (0 = one per CPU) and there are more than a few. The .pyc files use checked-hash
+        invalidation, so they stay valid when a checkout or cache restore
+        changes source mtimes (e.g. on CI workers) but not content.
+        """
+        files = sorted(path for path in self.output_dir.glob("*.py")
+                       if path in self.written_files or not Path(importlib.util.cache_from_source(path)).exists())
+        compile_file = partial(compileall.compile_file, quiet=1, force=True,
+                               invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+        if workers != 1 and len(files) > _SERIAL_COMPILE_MAX:
+            with ProcessPoolExecutor(max_workers=workers or None) as executor:
+                results = list(executor.map(compile_file, map(str, files)))
+        else:
+            results = [compile_file(str(path)) for path in files]
+        self.written_files.clear()
+        
+        failed = [path.name for path, ok in zip(files, results) if not ok]
+        if failed:
+            print(f"   ⚠️  Byte-compiling failed for: {', '.join(failed)}")
+        return len(files) - len(failed)
+        
+    def _locators_for(self, parsed: ParsedResource, locators_map: Dict[str, Dict] = None,
+                      symbol_tables: Dict = None) -> Dict[str, str]:
+        """Locators visible to a resource (see generate_all for locators_map keys)."""
+        locators = {}
+        if not locators_map:
+            return locators
+            
+        source = Path(parsed.filepath).resolve()
+        table = symbol_tables.get(str(source)) if symbol_tables else None
+        locator_files = {str(Path(loc_file).resolve()): loc_vars for loc_file, loc_vars in locators_map.items()
+                         if Path(loc_file).suffix == '.robot'}
+        
+        if table is not None:
+            for name, value in table.variables.items():
+                if table.variable_sources[name] in locator_files:
+                    locators[name] = value
+                    
+        elif locator_files:
+            # No symbol table (e.g. streaming): use the locator files imported directly
+            for imp in parsed.imports:
+                imported = str((source.parent / imp).resolve())
+                for name, value in locator_files.get(imported, {}).items():
+                    locators.setdefault(name, value)
+                    
+        else:
+            # Try to find matching locators
+            base_name = Path(parsed.filename).stem.replace('Po', '')
+            for loc_key, loc_vars in locators_map.items():
+                if loc_key.lower() in base_name.lower():
+                    locators = loc_vars
+                    break
+                    
+        return locators
+        
+    def generate_package_init(self, filenames: Iterable[str]) -> Path:
+        """
+        Write the package __init__ that maps keyword classes to their modules.
+        
+        Classes are loaded on first attribute access (PEP 562 __getattr__), so
+        `from <package> import CommonKeywords` imports common_keywords only,
+        not every generated module. filenames are the resource files of all
+        modules in the package, not only the ones regenerated now.
+        """
+        output_file = self.output_dir / "__init__.py"
+        package = ".".join(self.output_dir.parts) if not self.output_dir.is_absolute() else self.output_dir.name
+        classes: Dict[str, str] = {}
+        for filename in sorted(set(filenames), key=self.module_name_for):
+            class_name, module = self.class_name_for(filename), self.module_name_for(filename)
+            if classes.setdefault(class_name, module) != module:
+                print(f"   ⚠️  {class_name} of {module} is shadowed by {classes[class_name]} "
+                      f"in {output_file.name}; import it from its module")
+                
+        entries = "".join(f"    {name!r}: {module!r},\n" for name, module in sorted(classes.items()))
+        type_imports = "".join(f"    from .{module} import {name}\n" for name, module in sorted(classes.items()))
+        type_imports = type_imports or "    pass\n"
+        code = f'''"""
+Auto-generated package index: {len(classes)} keyword classes.
+
+Keyword classes are imported on first access, e.g.
+`from {package} import CommonKeywords` loads common_keywords only.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+# Keyword class -> module defining it
+_CLASSES = {{
+{entries}}}
+
+__all__ = sorted(_CLASSES)
+
+if TYPE_CHECKING:
+{type_imports}
+
+def __getattr__(name):
+    module = _CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(f".{{module}}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CLASSES))
+'''
+        
+        self.write_if_changed(output_file, code)
+        if not self.quiet:
+            print(f"✅ Generated: {output_file.name} ({len(classes)} lazily loaded classes)")
+        return output_file
+        
+    def generate_keyword_registry(self, keyword_names: Dict[str, Iterable[str]]) -> Path:
+        """
+        Write the registry module dispatching RF keyword names to generated methods.
+        
+        keyword_names maps the resource file of every module in the package to
+        the names of the keywords generated from it. KEYWORDS is keyed by the
+        RF-normalized name (case, spaces and underscores ignored) and by the
+        resource-qualified name, so run_keyword is one dict lookup; a name
+        defined in several resources resolves to the first module, as in
+        generate_package_init, and its qualified names stay unambiguous.
+        """
+        output_file = self.output_dir / f"{REGISTRY_MODULE}.py"
+        entries: Dict[str, Tuple[str, str, str]] = {}
+        qualified: Dict[str, Tuple[str, str, str]] = {}
+        for filename in sorted(keyword_names, key=self.module_name_for):
+            target = (self.module_name_for(filename), self.class_name_for(filename))
+            owner = normalize(Path(filename).stem, ignore='_')
+            for name in keyword_names[filename]:
+                key = normalize(name, ignore='_')
+                entry = target + (self.sanitize_name(name),)
+                qualified.setdefault(f"{owner}.{key}", entry)
+                if entries.setdefault(key, entry)[0] != entry[0]:
+                    print(f"   ⚠️  Keyword '{name}' of {entry[0]} is shadowed by {entries[key][0]} "
+                          f"in {output_file.name}; run it as '{Path(filename).stem}.{name}'")
+        entries.update(qualified)
+        
+        lines = "".join(f"    {key!r}: {entry!r},\n" for key, entry in entries.items())
+        code = f'''"""
+Auto-generated keyword registry: {len(entries) - len(qualified)} keywords of {len(keyword_names)} resources.
+
+Runs generated keywords by their RF names, e.g.
+`KeywordRegistry(bridge).run_keyword("Navigate To Login Screen")`.
+Names match as in RF (case, spaces and underscores are ignored, and
+`Resource.Keyword Name` selects the resource); keyword classes are
+imported on first use.
+"""
+import importlib
+
+from robot.utils import normalize
+
+# RF-normalized keyword name -> (module, class, method)
+KEYWORDS = {{
+{lines}}}
+
+
+class KeywordRegistry:
+    """Generated keywords by RF name, bound to one bridge."""
+
+    def __init__(self, bridge):
+        self.bridge = bridge
+        self._instances = {{}}
+        self._callables = {{}}
+
+    def get_keyword(self, name):
+        """Bound method implementing the RF keyword name."""
+        try:
+            return self._callables[name]
+        except KeyError:
+            pass
+        entry = KEYWORDS.get(normalize(name, ignore='_'))
+        if entry is None:
+            raise KeyError(f"No keyword with name '{{name}}' found.")
+        module, class_name, method = entry
+        if class_name not in self._instances:
+            keyword_class = getattr(importlib.import_module(f".{{module}}", __package__), class_name)
+            self._instances[class_name] = keyword_class(self.bridge)
+        # Later calls with the same spelling skip normalization
+        self._callables[name] = getattr(self._instances[class_name], method)
+        return self._callables[name]
+
+    def run_keyword(self, name, *args, **kwargs):
+        """Run the RF keyword name with Python arguments."""
+        return self.get_keyword(name)(*args, **kwargs)
+
+    def __contains__(self, name):
+        return normalize(name, ignore='_') in KEYWORDS
+'''
+        
+        self.write_if_changed(output_file, code)
+        if self.stubs:
+            self.write_if_changed(output_file.with_suffix('.pyi'), module_stub(code, output_file.name))
+        else:
+            output_file.with_suffix('.pyi').unlink(missing_ok=True)
+        if not self.quiet:
+            print(f"✅ Generated: {output_file.name} ({len(entries) - len(qualified)} keywords by RF name)")
+        return output_file
+        
+    def generate_variables_module(self, resolver: VariableResolver) -> Path:
+        """
+        Write the resolved configs/constants variables as a Python module.
+        
+        Values are rendered as constants; ${CURDIR} paths are joined onto the
+        project root and %{ENV=default} is read once, when the module is
+        imported. PLATFORMS maps each platform to its generic capability names.
+        
+        For a platform-specialized package, PLATFORM_NAME is resolved as
+        <PLATFORM>_PLATFORM_NAME, and the constants without environment or
+        path parts become constant_values for the compiler to fold.
+        """
+        output_file = self.output_dir / f"{VARIABLES_MODULE}.py"
+        sources = sorted({str(resolver.source_of(name).relative_to(resolver.project_root))
+                          for name in resolver.names()})
+        
+        try:
+            depth = len(self.output_dir.resolve().relative_to(resolver.project_root).parts)
+            root_expr = "os.path.abspath(__file__)"
+            for _ in range(depth + 1):
+                root_expr = f"os.path.dirname({root_expr})"
+        except ValueError:
+            root_expr = repr(str(resolver.project_root))
+            
+        resolved_for = "generation time"
+        if self.platform:
+            resolved_for += f" for platform {self.platform.lower()!r}"
+        code = f'''"""
+Auto-generated from: {', '.join(sources)}
+Total variables: {len(resolver.names())}
+
+Resolved at {resolved_for}; environment variables are read on import.
+"""
+import os
+
+PROJECT_ROOT = {root_expr}
+'''
+        
+        resolved = resolver.resolve_all(self.platform)
+        constants = {}
+        self.variable_constants = {}
+        self.constant_values = {}
+        current_source = None
+        for name in resolver.names():
+            const_name = re.sub(r'\W', '_', name)
+            if const_name[0].isdigit():
+                const_name = f"_{const_name}"
+            if const_name in constants.values():
+                continue
+            constants[name] = const_name
+            self.variable_constants[normalize(name, ignore='_')] = const_name
+            if self.platform and all(isinstance(part, str) for part in resolved[name]):
+                self.constant_values[const_name] = ''.join(resolved[name])
+            
+            source = resolver.source_of(name)
+            if source != current_source:
+                code += f"\n# {source.relative_to(resolver.project_root)}\n"
+                current_source = source
+            code += f"{const_name} = {python_expression(resolved[name], resolver.project_root)}\n"
+            
+        code += "\nPLATFORMS = {\n"
+        for platform in resolver.platforms():
+            code += f"    {platform.lower()!r}: {{\n"
+            for generic, name in resolver.platform_variables(platform).items():
+                if name in constants:
+                    code += f"        {generic!r}: {constants[name]},\n"
+            code += "    },\n"
+        code += "}\n"
+        
+        self.write_if_changed(output_file, code)
+        if self.stubs:
+            self.write_if_changed(output_file.with_suffix('.pyi'), module_stub(code, output_file.name))
+        else:
+            output_file.with_suffix('.pyi').unlink(missing_ok=True)
+        if not self.quiet:
+            print(f"✅ Generated: {output_file.name} ({len(constants)} variables)")
+        return output_file
+
+
+# Generator and inputs inherited by forked emission workers (see _emit_parallel)
+_emit_state = None
+
+
+def _emit_in_worker(index: int):
+    """Emit one module in a worker; returns (output file, code, stats, written files, write counts)."""
+    generator, parsed_files, locators_map, symbol_tables = _emit_state
+    generator.quiet = True
+    generator.written_files.clear()
+    counts = generator.write_counts = {"written": 0, "skipped": 0}
+    output_file, code = generator._generate_module(parsed_files[index], locators_map, symbol_tables)
+    return output_file, code, generator.file_stats.pop(str(output_file)), sorted(generator.written_files), counts
+
+
+def parse_locator(locator: str):
+    """
+    (AppiumBy attribute, criteria) of an RF locator, parsed the way
+    AppiumLibrary's ElementFinder does, or None if it has no single strategy.
+    """
+    if not locator or contains_variable(locator):
+        return None
+    prefix, criteria = 'default', locator
+    if not locator.startswith('//'):
+        head, separator, tail = locator.partition('=')
+        if separator:
+            prefix, criteria = head.strip().lower(), tail.strip()
+    if prefix == 'default':
+        prefix = 'xpath' if criteria.startswith('//') else 'id'
+    by = LOCATOR_STRATEGIES.get(prefix)
+    return (by, criteria) if by else None
+
+
+def _quoted(text: str) -> str:
+    """Python literal of a string, double-quoted like the rest of the generated code."""
+    if '"' in text or '\\' in text or not text.isprintable():
+        return repr(text)
+    return f'"{text}"'
@@ -0,0 +1,162 @@
+"""
+Type stubs (.pyi) for generated wrapper modules.
+
+Stubs are derived from the generated source with ast, so they describe
+exactly what was written: public methods with their parameters, class
+constants (pre-parsed locators are Locator) and module constants. RF
+keyword arguments are untyped, so parameters are Any; a method returns Any
+if its body returns a value and None otherwise. A sharded facade's stub lists the keyword methods of all
+its shards, which the facade only provides through __getattr__ at run time.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import ast
+import re
+
+# Dunder methods of generated classes that belong in the stubs
+_STUB_DUNDERS = ("__init__", "__getattr__", "__dir__")
+
+_TYPING_NAMES = ("Any", "Dict", "List")
+
+
+def module_stub(code: str, source: str, shard_codes: Iterable[str] = (),
+                facade: Optional[Tuple[str, str]] = None) -> str:
+    """
+    Stub for a generated module.
+
+    source names the generated module for the header. For a facade,
+    shard_codes are its shard modules, whose keyword methods replace its
+    __getattr__; for a shard, facade is the (module, class) it belongs to.
+    """
+    shard_methods = [node for shard in shard_codes for cls in _classes(ast.parse(shard))
+                     for node in cls.body if isinstance(node, ast.FunctionDef) and _is_keyword(node)]
+    facade_class = facade[1] if facade else "Any"
+
+    body = []
+    for node in ast.parse(code).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            body.append(f"{node.targets[0].id}: {_annotation(node.value)}")
+        elif isinstance(node, ast.ClassDef):
+            body += ["", ""] + _class_stub(node, shard_methods, facade_class)
+
+    text = "\n".join(body)
+    typing_names = [name for name in _TYPING_NAMES if re.search(rf"\b{name}\b", text)]
+    header = [f"# Stub for {source} (auto-generated)"]
+    if typing_names:
+        header.append(f"from typing import {', '.join(typing_names)}")
+    if re.search(r"\bLocator\b", text):
+        header.append("from pytest_rf_bridge.locators import Locator")
+    if facade:
+        header += ["", f"from .{facade[0]} import {facade[1]}"]
+    if not body or body[0]:
+        header.append("")
+    return "\n".join(header + body).rstrip() + "\n"
+
+
+def _class_stub(cls: ast.ClassDef, shard_methods: List[ast.FunctionDef], facade_class: str) -> List[str]:
+    attributes: Dict[str, str] = {}
+    methods: Dict[str, ast.FunctionDef] = {}
+    for node in cls.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            attributes[node.targets[0].id] = _annotation(node.value)
+        elif isinstance(node, ast.FunctionDef) and (_is_keyword(node) or node.name in _STUB_DUNDERS):
+            methods[node.name] = node
+            if node.name == "__init__":
+                attributes.update(_instance_attributes(node))
+
+    if shard_methods:
+        # The facade's keyword methods come from its shards, not __getattr__
+        methods.pop("__getattr__", None)
+        methods.pop("__dir__", None)
+        methods.update((node.name, node) for node in shard_methods)
+
+    lines = [f"class {cls.name}:"]
+    lines += [f"    {name}: {annotation}" for name, annotation in attributes.items()]
+    if attributes and methods:
+        lines.append("")
+    lines += [f"    def {node.name}({_parameters(node, facade_class)}) -> {_returns(node)}: ..."
+              for node in methods.values()]
+    if len(lines) == 1:
+        lines.append("    ...")
+    return lines
+
+
+def _classes(tree: ast.Module) -> List[ast.ClassDef]:
+    return [node for node in tree.body if isinstance(node, ast.ClassDef)]
+
+
+def _is_keyword(node: ast.FunctionDef) -> bool:
+    """Public methods without decorators: the generated keyword methods."""
+    return not node.name.startswith("_") and not node.decorator_list
+
+
+def _instance_attributes(init: ast.FunctionDef) -> Dict[str, str]:
+    """Public self.<name> attributes assigned in __init__."""
+    attributes = {}
+    for node in ast.walk(init):
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name)
+                        and target.value.id == "self" and not target.attr.startswith("_")):
+                    attributes[target.attr] = "Any"
+    return attributes
+
+
+def _parameters(node: ast.FunctionDef, facade_class: str) -> str:
+    args = node.args
+    defaults = [None] * (len(args.args) - len(args.defaults)) + list(args.defaults)
+    params = [args.args[0].arg]
+    for arg, default in zip(args.args[1:], defaults[1:]):
+        if node.name == "__getattr__":
+            annotation = "str"
+        elif node.name == "__init__" and arg.arg == "facade":
+            annotation = facade_class
+        else:
+            annotation = "Any"
+        params.append(f"{arg.arg}: {annotation}" + (" = ..." if default is not None else ""))
+    if args.vararg:
+        params.append(f"*{args.vararg.arg}: Any")
+    elif args.kwonlyargs:
+        params.append("*")
+    params += [f"{arg.arg}: Any" + (" = ..." if default is not None else "")
+               for arg, default in zip(args.kwonlyargs, args.kw_defaults)]
+    if args.kwarg:
+        params.append(f"**{args.kwarg.arg}: Any")
+    return ", ".join(params)
+
+
+def _returns(node: ast.FunctionDef) -> str:
+    if node.name == "__init__":
+        return "None"
+    if node.name == "__dir__":
+        return "List[str]"
+    if node.name == "__getattr__":
+        return "Any"
+    returns_value = any(isinstance(child, ast.Return) and child.value is not None for child in ast.walk(node))
+    return "Any" if returns_value else "None"
+
+
+def _annotation(value: ast.AST) -> str:
+    """Static type of a generated constant expression."""
+    if isinstance(value, ast.Constant):
+        return "None" if value.value is None else type(value.value).__name__
+    if isinstance(value, ast.JoinedStr) or _is_str_expression(value):
+        return "str"
+    if isinstance(value, ast.Call) and isinstance(value.func, ast.Name) and value.func.id == "Locator":
+        return "Locator"
+    if isinstance(value, ast.Dict):
+        values = {_annotation(v) for v in value.values}
+        inner = values.pop() if len(values) == 1 else "Any"
+        return f"Dict[str, {inner}]"
+    return "Any"
+
+
+def _is_str_expression(value: ast.AST) -> bool:
+    """os.path/os.environ lookups and string concatenations, as in rf_variables."""
+    if isinstance(value, ast.BinOp) and isinstance(value.op, ast.Add):
+        return all(_annotation(side) == "str" for side in (value.left, value.right))
+    if isinstance(value, ast.Call):
+        name = ast.unparse(value.func)
+        return name.startswith("os.path.") or name == "os.environ.get"
+    if isinstance(value, ast.Subscript):
+        return ast.unparse(value.value) == "os.environ"
+    return isinstance(value, ast.Name) and value.id == "PROJECT_ROOT"
@@ -0,0 +1,279 @@
+"""
+Resolution of the configs/ and constants/ variable tables.
+
+Parsed variable values are the raw cell text, e.g.
+"${CURDIR}/../apps/wdioNativeDemoApp.apk" or "%{ANDROID_PLATFORM_VERSION=13}".
+The resolver follows nested ${...} references (RF name matching: case,
+space and underscore insensitive), turns ${CURDIR} into the directory of
+the defining file and keeps %{NAME=default} as an environment reference,
+so a value can be evaluated for a given environment or rendered as a
+Python expression. Backslash escapes in literal text are removed like RF
+does, so "\\${x}" is the literal text "${x}" and "\\\\" a single
+backslash. Results are memoized per platform and environment.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+import os
+import re
+
+from robot.utils import normalize, unescape
+
+from rf_auto_generator.rf_native_parser import RFNativeParser
+
+VARIABLE_DIRS = ("configs", "constants")
+
+# RF built-in variables with a plain string value, by normalized name
+BUILTIN_VARIABLES = {
+    'empty': '',
+    'space': ' ',
+    'true': 'True',
+    'false': 'False',
+    'none': 'None',
+    '\\n': '\n',
+}
+
+
+class VariableResolutionError(ValueError):
+    """A variable table cannot be resolved (e.g. a reference cycle)."""
+
+
+@dataclass(frozen=True)
+class EnvRef:
+    """%{NAME} or %{NAME=default}."""
+    name: str
+    default: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CurdirRef:
+    """${CURDIR}: directory of the file defining the variable."""
+    directory: str
+
+
+Part = Union[str, EnvRef, CurdirRef]
+Value = Tuple[Part, ...]
+
+
+def _normalize(name: str) -> str:
+    return normalize(name, ignore='_')
+
+
+def evaluate(value: Value, environ: Optional[Mapping[str, str]] = None) -> str:
+    """String value of resolved parts in the given environment."""
+    environ = os.environ if environ is None else environ
+    text = []
+    for part in value:
+        if isinstance(part, EnvRef):
+            if part.name not in environ and part.default is None:
+                raise VariableResolutionError(f"Environment variable '%{{{part.name}}}' not found")
+            text.append(environ.get(part.name, part.default))
+        elif isinstance(part, CurdirRef):
+            text.append(part.directory)
+        else:
+            text.append(part)
+    return ''.join(text)
+
+
+def python_expression(value: Value, project_root: Path, root_name: str = 'PROJECT_ROOT') -> str:
+    """
+    Render resolved parts as a Python expression.
+
+    Paths under ${CURDIR} become os.path.join(<root_name>, ...) so the
+    generated code does not depend on where it was generated.
+    """
+    project_root = Path(project_root).resolve()
+
+    if value and isinstance(value[0], CurdirRef) and all(isinstance(p, str) for p in value[1:]):
+        directory = Path(value[0].directory)
+        if directory == project_root or project_root in directory.parents:
+            relative = os.path.normpath(os.path.join(directory.relative_to(project_root), ''.join(value[1:])))
+            segments = [s for s in Path(relative).as_posix().split('/') if s not in ('', '.')]
+            if segments and segments[0] != '..':
+                return f"os.path.join({root_name}, {', '.join(repr(s) for s in segments)})"
+
+    pieces = []
+    for part in value:
+        if isinstance(part, EnvRef):
+            if part.default is None:
+                pieces.append(f"os.environ[{part.name!r}]")
+            else:
+                pieces.append(f"os.environ.get({part.name!r}, {part.default!r})")
+        elif isinstance(part, CurdirRef):
+            directory = Path(part.directory)
+            if directory == project_root or project_root in directory.parents:
+                segments = directory.relative_to(project_root).parts
+                pieces.append(f"os.path.join({', '.join([root_name] + [repr(s) for s in segments])})")
+            else:
+                pieces.append(repr(part.directory))
+        else:
+            pieces.append(repr(part))
+    return ' + '.join(pieces) if pieces else "''"
+
+
+class VariableResolver:
+    """Resolves the variable tables of configs/ and constants/ once per platform."""
+
+    def __init__(self, parser: RFNativeParser, project_root: str = ".", directories=VARIABLE_DIRS):
+        self.project_root = Path(project_root).resolve()
+        self.files: List[Path] = []
+        # normalized name -> (variable name, raw value, defining file)
+        self.table: Dict[str, Tuple[str, str, Path]] = {}
+        self._memo: Dict[Optional[str], Dict[str, Value]] = {}
+        self._values: Dict[Tuple, Dict[str, str]] = {}
+
+        for directory in directories:
+            directory = self.project_root / directory
+            if not directory.is_dir():
+                continue
+            for robot_file in sorted(directory.rglob("*.robot")):
+                self.files.append(robot_file)
+                parsed = parser.parse_variables_file(robot_file)
+                for name, raw in parsed.variables.items():
+                    # Like RF resource imports, the first definition wins
+                    self.table.setdefault(_normalize(name), (name, raw, robot_file.resolve()))
+
+    def names(self) -> List[str]:
+        """Variable names in definition order."""
+        return [name for name, _, _ in self.table.values()]
+
+    def source_of(self, name: str) -> Path:
+        """File defining a variable."""
+        return self.table[_normalize(name)][2]
+
+    def platforms(self) -> List[str]:
+        """Platform prefixes with a <PREFIX>_PLATFORM_NAME variable, e.g. ['ANDROID', 'IOS']."""
+        return [name[:-len('_PLATFORM_NAME')] for name in self.names()
+                if name.upper().endswith('_PLATFORM_NAME') and name.upper() != 'PLATFORM_NAME']
+
+    def resolve_all(self, platform: Optional[str] = None) -> Dict[str, Value]:
+        """
+        Every variable resolved to parts, computed once per platform.
+
+        With platform (a prefix from platforms()), PLATFORM_NAME is taken
+        from <PLATFORM>_PLATFORM_NAME, the way the suites switch platforms.
+        """
+        key = platform.upper() if platform else None
+        if key not in self._memo:
+            overrides = {}
+            if key:
+                if key not in (p.upper() for p in self.platforms()):
+                    raise VariableResolutionError(f"Unknown platform '{platform}'")
+                overrides[_normalize('PLATFORM_NAME')] = f"${{{key}_PLATFORM_NAME}}"
+            resolved: Dict[str, Value] = {}
+            for normalized, (name, _, _) in self.table.items():
+                resolved[name] = self._resolve(normalized, overrides, resolved, [])
+            self._memo[key] = resolved
+        return self._memo[key]
+
+    def values(self, platform: Optional[str] = None,
+               environ: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+        """String values for a platform and environment (memoized on the env values used)."""
+        environ = os.environ if environ is None else environ
+        resolved = self.resolve_all(platform)
+        env_names = sorted({p.name for value in resolved.values() for p in value if isinstance(p, EnvRef)})
+        key = (platform.upper() if platform else None, tuple((n, environ.get(n)) for n in env_names))
+        if key not in self._values:
+            self._values[key] = {name: evaluate(value, environ) for name, value in resolved.items()}
+        return self._values[key]
+
+    def platform_variables(self, platform: str) -> Dict[str, str]:
+        """Generic name -> variable name for a platform, e.g. {'APP': 'ANDROID_APP', ...}."""
+        prefix = f"{platform.upper()}_"
+        mapping = {'PLATFORM_NAME': f"{prefix}PLATFORM_NAME"}
+        for name in self.names():
+            if name.upper().startswith(prefix):
+                mapping[name[len(prefix):]] = name
+        return mapping
+
+    def _resolve(self, normalized: str, overrides: Dict[str, str], resolved: Dict[str, Value],
+                 stack: List[str]) -> Value:
+        name, raw, source = self.table[normalized]
+        if name in resolved:
+            return resolved[name]
+        if normalized in stack:
+            cycle = ' -> '.join(self.table[n][0] for n in stack[stack.index(normalized):] + [normalized])
+            raise VariableResolutionError(f"Variable reference cycle: {cycle}")
+
+        stack.append(normalized)
+        value = self._expand(overrides.get(normalized, raw), source, overrides, resolved, stack)
+        stack.pop()
+        resolved[name] = value
+        return value
+
+    def _expand(self, text: str, source: Path, overrides: Dict[str, str], resolved: Dict[str, Value],
+                stack: List[str], is_name: bool = False) -> Value:
+        """
+        Split text into literal and reference parts, resolving ${...} references.
+
+        Literal text is unescaped, except in variable names (is_name), where
+        RF keeps backslashes: ${\\n} is the built-in newline variable.
+        """
+        literal = str if is_name else unescape
+        parts: List[Part] = []
+        pos = 0
+        for start, end, marker, inner in _references(text):
+            parts.append(literal(text[pos:start]))
+            pos = end
+            name_parts = self._expand(inner, source, overrides, resolved, stack, is_name=True)
+            if not all(isinstance(p, str) for p in name_parts):
+                # Name built from an environment value: leave it to RF
+                parts.append(text[start:end])
+                continue
+            name = ''.join(name_parts)
+
+            if marker == '%':
+                env_name, has_default, default = name.partition('=')
+                parts.append(EnvRef(env_name, default if has_default else None))
+            elif _normalize(name) == 'curdir':
+                parts.append(CurdirRef(str(source.parent)))
+            elif _normalize(name) in self.table:
+                parts.extend(self._resolve(_normalize(name), overrides, resolved, stack))
+            elif _normalize(name) in BUILTIN_VARIABLES:
+                parts.append(BUILTIN_VARIABLES[_normalize(name)])
+            else:
+                # Unknown here (e.g. set at run time): keep the reference
+                parts.append(f"{marker}{{{name}}}")
+        parts.append(literal(text[pos:]))
+        return _merge(parts)
+
+
+_REFERENCE_START = re.compile(r'([$%])\{')
+
+
+def _references(text: str):
+    """Yield (start, end, marker, inner text) of top-level ${...} / %{...} references."""
+    pos = 0
+    while True:
+        match = _REFERENCE_START.search(text, pos)
+        if not match:
+            return
+        backslashes = len(text[:match.start()]) - len(text[:match.start()].rstrip('\\'))
+        if backslashes % 2:
+            pos = match.end()  # Escaped: literal text
+            continue
+        depth = 1
+        index = match.end()
+        while index < len(text) and depth:
+            if text[index] == '{':
+                depth += 1
+            elif text[index] == '}':
+                depth -= 1
+            index += 1
+        if depth:
+            return  # Unbalanced: the rest is literal
+        yield match.start(), index, match.group(1), text[match.end():index - 1]
+        pos = index
+
+
+def _merge(parts: List[Part]) -> Value:
+    """Drop empty strings and join adjacent literals."""
+    merged: List[Part] = []
+    for part in parts:
+        if part == '':
+            continue
+        if isinstance(part, str) and merged and isinstance(merged[-1], str):
+            merged[-1] += part
+        else:
+            merged.append(part)
+    return tuple(merged)
@@ -0,0 +1,72 @@
+"""
+Polling file watcher for --watch mode.
+
+Only stats files (mtime and size) on each poll, so an idle watch costs a
+directory walk per interval. Changes are coalesced: a batch is emitted
+once no further change has been seen for the debounce window, so a burst
+of editor saves triggers a single regeneration.
+"""
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+import fnmatch
+import os
+import time
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+def snapshot(directories: Iterable, pattern: str = "*.robot") -> Snapshot:
+    """Resolved path -> (mtime_ns, size) of every matching file under directories."""
+    files: Snapshot = {}
+    for directory in directories:
+        for root, _, names in os.walk(directory):
+            for name in fnmatch.filter(names, pattern):
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue  # Removed between listing and stat
+                files[str(Path(path).resolve())] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> Set[str]:
+    """Paths added, removed or modified between two snapshots."""
+    return {path for path in old.keys() | new.keys() if old.get(path) != new.get(path)}
+
+
+class PollingWatcher:
+    """Yields debounced batches of changed .robot files."""
+
+    def __init__(self, directories: Iterable, interval: float = 0.5, debounce: float = 1.0,
+                 pattern: str = "*.robot"):
+        self.directories = [Path(d) for d in directories if Path(d).exists()]
+        self.interval = interval
+        self.debounce = debounce
+        self.pattern = pattern
+        self._state = snapshot(self.directories, pattern)
+
+    def poll(self) -> Set[str]:
+        """Files changed since the previous poll."""
+        current = snapshot(self.directories, self.pattern)
+        changed = diff_snapshots(self._state, current)
+        self._state = current
+        return changed
+
+    def batches(self, max_batches: Optional[int] = None) -> Iterator[Set[str]]:
+        """Block and yield each batch of changes once the debounce window has passed quietly."""
+        pending: Set[str] = set()
+        deadline = 0.0
+        emitted = 0
+
+        while max_batches is None or emitted < max_batches:
+            time.sleep(self.interval)
+            changed = self.poll()
+            now = time.monotonic()
+            if changed:
+                pending |= changed
+                deadline = now + self.debounce
+            elif pending and now >= deadline:
+                yield pending
+                emitted += 1
+                pending = set()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Query the on-disk keyword catalog.
+
+    python rf_catalog.py update                     # (re)index object-repository/
+    python rf_catalog.py search "alert title"       # full-text search
+    python rf_catalog.py show "Click Element"       # details, callers and callees
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rf_auto_generator.keyword_catalog import CATALOG_NAME, KeywordCatalog
+
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    arg_parser = argparse.ArgumentParser(description="Search the RF keyword catalog.")
+    arg_parser.add_argument("--db", default=CATALOG_NAME, help=f"Catalog file (default: {CATALOG_NAME})")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    update = commands.add_parser("update", help="Index resource files (only changed files are rewritten)")
+    update.add_argument("directories", nargs="*", default=["object-repository"])
+    update.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Parse resource files in N worker processes (0 = one per CPU)")
+
+    search = commands.add_parser("search", help="Full-text search over names, docs, args, tags and calls")
+    search.add_argument("query", nargs="+")
+    search.add_argument("-n", "--limit", type=int, default=20)
+
+    show = commands.add_parser("show", help="Show a keyword with its callers and callees")
+    show.add_argument("name", help="Keyword name (RF-normalized) or id such as CommonPo.Click Element")
+
+    commands.add_parser("stats", help="Print catalog row counts")
+    return arg_parser.parse_args(argv)
+
+
+def update_catalog(catalog, directories, jobs):
+    """Parse the directories and bring the catalog up to date."""
+    from rf_auto_generator.resource_resolver import ResourceResolver
+    from rf_auto_generator.rf_native_parser import RFNativeParser
+
+    parser = RFNativeParser(Path.cwd())
+    parsed_files = []
+    for directory in directories:
+        parsed_files.extend(parser.iter_directory(directory, jobs=jobs))
+
+    resolver = ResourceResolver(parser)
+    for pf in parsed_files:
+        resolver.add(pf)
+    resolved = resolver.resolve([pf.filepath for pf in parsed_files])
+    parser.analyze_keyword_dependencies(parsed_files, {key: resolver.symbol_table(key) for key in resolved})
+
+    result = catalog.update(parsed_files, parser.call_graph)
+    print(f"Indexed {result['files']} files: {result['updated']} updated, {result['removed']} removed")
+
+
+def print_keyword(row):
+    print(f"{row['kw_id']}")
+    print(f"   file: {row['source_file']}")
+    if row['args']:
+        print(f"   args: {row['args']}")
+    if row['doc']:
+        print(f"   doc:  {row['doc']}")
+    if row['tags']:
+        print(f"   tags: {row['tags']}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    with KeywordCatalog(args.db) as catalog:
+        if args.command == "update":
+            update_catalog(catalog, args.directories, args.jobs)
+            return 0
+
+        if args.command == "stats":
+            for table, count in catalog.stats().items():
+                print(f"{table:<10}{count}")
+            return 0
+
+        start = time.perf_counter()
+        if args.command == "search":
+            rows = catalog.search(" ".join(args.query), args.limit)
+        else:
+            rows = catalog.lookup(args.name)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        for row in rows:
+            print_keyword(row)
+            if args.command == "show":
+                print(f"   called by: {', '.join(catalog.callers(row['kw_id'])) or '-'}")
+                print(f"   calls:     {', '.join(catalog.callees(row['kw_id'])) or '-'}")
+                print(f"   library:   {', '.join(catalog.callees(row['kw_id'], resolved=False)) or '-'}")
+        print(f"\n{len(rows)} keyword(s) in {elapsed:.1f} ms")
+        return 0 if rows else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())